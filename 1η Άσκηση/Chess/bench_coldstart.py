@@ -0,0 +1,32 @@
+import argparse, os, subprocess, sys, tempfile
+
+#---------- Cold start: import krk + πρώτο μικρό ερώτημα ----------
+PROBE = r"""
+import time
+t0 = time.perf_counter()
+import krk
+s = krk.State((0,0), (0,2), (4,4), True)
+krk.legal_white_moves(s)
+krk.is_checkmate(krk.State((0,0), (2,4), (0,4), False))
+print((time.perf_counter() - t0) * 1000)
+"""
+
+def probe(cache_dir):
+    env = dict(os.environ, KRK_CACHE_DIR=cache_dir)
+    here = os.path.dirname(os.path.abspath(__file__))
+    out = subprocess.run([sys.executable, "-c", PROBE], cwd=here, env=env,
+                         capture_output=True, text=True, check=True)
+    return float(out.stdout)
+
+#---------- Εκτέλεση ----------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Χρόνος import krk + πρώτου ερωτήματος σε νέα διεργασία")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cold = probe(cache_dir)                               # άδεια cache: χτίζει τους πίνακες
+        warm = sorted(probe(cache_dir) for _ in range(args.repeat))
+    print("\nCOLD START krk")
+    print("--------------------------------------------------")
+    print(f"• Χωρίς cache πινάκων: {cold:.1f} ms")
+    print(f"• Με cache πινάκων: median {warm[len(warm)//2]:.1f} ms, max {warm[-1]:.1f} ms (στόχος < 50 ms)")
@@ -0,0 +1,111 @@
+import argparse, heapq, itertools, time, tracemalloc
+
+import krk
+from krk.board import black_move_str
+
+#---------- Παλιές υλοποιήσεις (dicts ανά κατάσταση) για σύγκριση ----------
+def reconstruct(parents, cur):
+    path = []
+    while parents[cur][0] is not None:
+        move, parent = parents[cur]
+        path.append(move)
+        cur = parent
+    return list(reversed(path))
+
+def astar_dicts(start, hfunc, stats, n):
+    counter = itertools.count()
+    openh = []
+    gscore = {start: 0}
+    parents = {start: (None,None)}
+    heapq.heappush(openh, (hfunc(start), 0, next(counter), start))
+    closed = set()
+    expanded = 0
+    try:
+        while openh:
+            f,g,_, cur = heapq.heappop(openh)
+            if cur in closed: continue
+            closed.add(cur); expanded += 1
+            if krk.is_checkmate(cur, n):
+                path = reconstruct(parents, cur)
+                return expanded, len(path), path
+            if cur.white:
+                children = krk.legal_white_moves(cur, n)
+            else:
+                nxt = krk.black_policy(cur, n)
+                children = [(black_move_str(cur, nxt), nxt)] if nxt else []
+            for md, ns in children:
+                ng = g + 1
+                if ng < gscore.get(ns, float('inf')):
+                    gscore[ns] = ng
+                    parents[ns] = (md, cur)
+                    heapq.heappush(openh, (ng + hfunc(ns), ng, next(counter), ns))
+        return expanded, None, None
+    finally:
+        stats["nodes"] = len(gscore)
+
+def best_first_dicts(start, hfunc, stats, n):
+    counter = itertools.count()
+    openh = []
+    parents = {start: (None, None)}
+    heapq.heappush(openh, (hfunc(start), next(counter), start))
+    closed = set()
+    expanded = 0
+    try:
+        while openh:
+            _, _, cur = heapq.heappop(openh)
+            if cur in closed: continue
+            closed.add(cur); expanded += 1
+            if krk.is_checkmate(cur, n):
+                path = reconstruct(parents, cur)
+                return expanded, len(path), path
+            if cur.white:
+                children = krk.legal_white_moves(cur, n)
+            else:
+                nxt = krk.black_policy(cur, n)
+                children = [(black_move_str(cur, nxt), nxt)] if nxt else []
+            for md, ns in children:
+                if ns not in parents:       # όπως το krk.best_first: μία φορά στο open
+                    parents[ns] = (md, cur)
+                    heapq.heappush(openh, (hfunc(ns), next(counter), ns))
+        return expanded, None, None
+    finally:
+        stats["nodes"] = len(parents)
+
+#---------- Μέτρηση ----------
+ENGINES = {
+    "astar (dicts)":      lambda s, st, n: astar_dicts(s, krk.h_cheb, st, n),
+    "astar (store)":      lambda s, st, n: krk.astar(s, krk.h_cheb, stats=st, n=n),
+    "best_first (dicts)": lambda s, st, n: best_first_dicts(s, krk.h_cheb, st, n),
+    "best_first (store)": lambda s, st, n: krk.best_first(s, krk.h_cheb, stats=st, n=n),
+}
+
+def measure(engine, start, n, repeat=5):
+    krk.tables(n)                   # οι πίνακες δεν μετράνε στη μνήμη της αναζήτησης
+    stats = {}
+    # ο χρόνος μετριέται σε ξεχωριστές εκτελέσεις (το καλύτερο από repeat): το tracemalloc
+    # επιβαρύνει κάθε allocation και μία μόνο εκτέλεση έχει θόρυβο ±20%
+    elapsed = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        _, length, _ = engine(start, stats, n)
+        elapsed = min(elapsed, time.perf_counter() - t0)
+    tracemalloc.start()
+    engine(start, stats, n)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return stats["nodes"], peak, elapsed, length
+
+#---------- Εκτέλεση ----------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bytes ανά κόμβο: dicts ανά κατάσταση vs NodeStore")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[7, 8])
+    parser.add_argument("--repeat", type=int, default=5, help="εκτελέσεις για τον χρόνο (κρατιέται η καλύτερη)")
+    args = parser.parse_args()
+    print("\nΜΝΗΜΗ ΑΝΑ ΚΟΜΒΟ (tracemalloc peak)")
+    print("--------------------------------------------------")
+    print(f"{'n':>2} {'αλγόριθμος':<20} {'κόμβοι':>8} {'peak(KB)':>9} {'bytes/κόμβο':>11} {'χρόνος(s)':>9} {'μήκος':>6}")
+    for n in args.sizes:
+        start = krk.State((0,0), (0,2), (n-1,n-1), True)
+        for name, engine in ENGINES.items():
+            nodes, peak, elapsed, length = measure(engine, start, n, args.repeat)
+            print(f"{n:>2} {name:<20} {nodes:>8} {peak/1024:>9.0f} {peak/nodes:>11.1f} {elapsed:>9.2f} {length:>6}")
@@ -0,0 +1,72 @@
+import argparse, random, time
+
+import krk
+
+def random_starts(n, seed):
+    """Τυχαίες αρχικές θέσεις (Λευκός παίζει, Μαύρος όχι σε σαχ) + η θέση των scripts"""
+    rng = random.Random(seed)
+    squares = [(x,y) for x in range(krk.BOARD_SIZE) for y in range(krk.BOARD_SIZE)]
+    starts = [krk.State((0,0), (0,2), (4,4), True)]
+    while len(starts) < n:
+        wk, wr, bk = rng.sample(squares, 3)
+        if krk.kings_adjacent(wk, bk) or wr[0] == bk[0] or wr[1] == bk[1]: continue
+        starts.append(krk.State(wk, wr, bk, True))
+    return starts
+
+#---------- Benchmark ----------
+def run(starts, hfunc, partial, repeat=3):
+    """Σύνολα για όλες τις θέσεις· ο χρόνος είναι το καλύτερο από repeat (θόρυβος ±20%)"""
+    totals = {"time": float("inf"), "expanded": 0, "pushes": 0, "peak_open": 0, "pops": 0, "length": 0}
+    for r in range(repeat):
+        elapsed = 0.0
+        for s in starts:
+            stats = {}
+            t0 = time.perf_counter()
+            expanded, length, _ = krk.astar(s, hfunc, partial=partial, stats=stats)
+            elapsed += time.perf_counter() - t0
+            if r == 0:
+                totals["expanded"] += expanded
+                totals["length"] += length or 0
+                totals["pushes"] += stats["pushes"]
+                totals["pops"] += stats["pops"]
+                totals["peak_open"] = max(totals["peak_open"], stats["peak_open"])
+        totals["time"] = min(totals["time"], elapsed)
+    return totals
+
+METRICS = ("time", "expanded", "pushes", "pops", "peak_open")
+
+def cell(t, base, k, width):
+    """Τιμή της στήλης k και, στη γραμμή του PEA*, η μεταβολή έναντι του A*"""
+    v = f"{t[k]:.3f}" if k == "time" else str(t[k])
+    if base is not None:
+        v += f" ({(t[k] / base[k] - 1) * 100:+.0f}%)"
+    return f"{v:>{width}}"
+
+#---------- Εκτέλεση ----------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="A* έναντι PEA* (heap pushes, peak open, χρόνος)")
+    parser.add_argument("--positions", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3, help="επαναλήψεις για τον χρόνο (κρατιέται ο καλύτερος)")
+    args = parser.parse_args()
+    starts = random_starts(args.positions, args.seed)
+
+    print(f"\nA* vs PEA* σε {len(starts)} θέσεις (στο PEA*: μεταβολή έναντι του A*)")
+    print("--------------------------------------------------")
+    print(f"{'ευρετική':<10} {'mode':<6} {'χρόνος(s)':>15} {'expanded':>15} {'pushes':>15} {'pops':>15} "
+          f"{'peak_open':>15} {'Σμήκος':>7}")
+    change = {}
+    for hname, hfunc in krk.HEURISTICS.items():
+        a = None
+        for mode, partial in (("A*", False), ("PEA*", True)):
+            t = run(starts, hfunc, partial, args.repeat)
+            print(f"{hname:<10} {mode:<6} " + " ".join(cell(t, a, k, 15) for k in METRICS) + f" {t['length']:>7}")
+            change.setdefault(hname, []).append(t)
+            a = t
+    print("\nPEA* έναντι A*:")
+    for hname, (a, p) in change.items():
+        pct = {k: (p[k] / a[k] - 1) * 100 for k in METRICS}
+        gains = ", ".join(f"{k} {v:+.1f}%" for k, v in pct.items() if v < 0) or "—"
+        costs = ", ".join(f"{k} {v:+.1f}%" for k, v in pct.items() if v > 0) or "—"
+        print(f"• {hname:<10} κερδίζει: {gains}")
+        print(f"  {'':<10} χάνει:    {costs}")
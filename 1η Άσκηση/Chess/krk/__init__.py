@@ -0,0 +1,8 @@
+"""KRK (Βασιλιάς + Πύργος εναντίον Βασιλιά): κοινή μηχανή για τα scripts του φακέλου Chess.
+
+Το import δεν κάνει καμία αναζήτηση· οι πίνακες κινήσεων χτίζονται στην πρώτη χρήση
+(board.tables) και αποθηκεύονται στο δίσκο."""
+from .board import (BOARD_SIZE, CAPTURED, State, in_bounds, coord_to_alg, alg_to_coord,
+                    kings_adjacent, tables, rook_attacks, legal_black_moves_all, legal_white_moves,
+                    is_checkmate, black_policy, h_cheb, h_manhattan, HEURISTICS)
+from .search import astar, best_first, bfs, dfs, ids, ALGORITHMS
@@ -0,0 +1,143 @@
+import itertools, os
+from collections import namedtuple
+
+#---------- Board & State ----------
+BOARD_SIZE = 5
+CAPTURED = (-1,-1)
+
+# wk: White King, wr: White Rook, bk: Black King ως (x,y), white: True if it's White's move.
+# namedtuple αντί για dataclass: γρηγορότερο hash/eq στα dicts της αναζήτησης και φθηνό import
+State = namedtuple("State", "wk wr bk white")
+
+def in_bounds(p, n=BOARD_SIZE): return 0 <= p[0] < n and 0 <= p[1] < n
+def coord_to_alg(c): return "--" if c[0] < 0 else f"{'abcdefgh'[c[0]]}{c[1]+1}"
+def alg_to_coord(s): return CAPTURED if s == "--" else ("abcdefgh".index(s[0]), int(s[1:]) - 1)
+def kings_adjacent(a,b): return max(abs(a[0]-b[0]), abs(a[1]-b[1])) <= 1
+
+#---------- Πίνακες (lazy, με cache στο δίσκο) ----------
+TABLES_VERSION = 1
+CACHE_DIR = os.environ.get("KRK_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "krk"))
+KING_DIRS = [d for d in itertools.product([-1,0,1], repeat=2) if d != (0,0)]
+ROOK_DIRS = [(1,0),(-1,0),(0,1),(0,-1)]
+
+# king: τετράγωνο -> γειτονικά τετράγωνα (σειρά KING_DIRS)
+# rays: τετράγωνο -> 4 ακτίνες πύργου (σειρά ROOK_DIRS)
+Tables = namedtuple("Tables", "n king rays")
+
+_tables = {}
+
+def build_tables(n):
+    squares = [(x,y) for x in range(n) for y in range(n)]
+    king = {s: tuple((s[0]+dx, s[1]+dy) for dx,dy in KING_DIRS if in_bounds((s[0]+dx, s[1]+dy), n))
+            for s in squares}
+    rays = {}
+    for s in squares:
+        rs = []
+        for dx,dy in ROOK_DIRS:
+            ray, x, y = [], s[0]+dx, s[1]+dy
+            while in_bounds((x,y), n):
+                ray.append((x,y)); x += dx; y += dy
+            rs.append(tuple(ray))
+        rays[s] = tuple(rs)
+    return Tables(n, king, rays)
+
+def tables(n=BOARD_SIZE):
+    """Οι πίνακες κινήσεων για σκακιέρα n x n: χτίζονται στην πρώτη χρήση και
+    αποθηκεύονται στο CACHE_DIR, ώστε οι επόμενες διεργασίες απλώς να τους φορτώνουν"""
+    t = _tables.get(n)
+    if t is not None:
+        return t
+    import pickle
+    path = os.path.join(CACHE_DIR, f"tables-v{TABLES_VERSION}-{n}.pickle")
+    try:
+        with open(path, "rb") as f:
+            t = Tables(*pickle.load(f))
+    except (OSError, pickle.UnpicklingError, EOFError, TypeError, ValueError):
+        t = build_tables(n)
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            tmp = f"{path}.{os.getpid()}"
+            with open(tmp, "wb") as f:
+                pickle.dump(tuple(t), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except OSError:
+            pass    # χωρίς cache στο δίσκο απλώς ξαναχτίζονται την επόμενη φορά
+    _tables[n] = t
+    return t
+
+#---------- Move Generation ----------
+def rook_attacks(wr, wk, bk, n=BOARD_SIZE):
+    if wr[0] < 0: return set()
+    attacks = set()
+    for ray in tables(n).rays[wr]:
+        for sq in ray:
+            attacks.add(sq)
+            if sq == wk or sq == bk: break
+    return attacks
+
+def rook_attacks_square(wr, wk, bk, target, n=BOARD_SIZE):
+    """Ισοδύναμο με target in rook_attacks(wr, wk, bk) χωρίς να φτιάχνει set"""
+    if wr[0] != target[0] and wr[1] != target[1]: return False
+    for ray in tables(n).rays[wr]:
+        for sq in ray:
+            if sq == target: return True
+            if sq == wk or sq == bk: break
+    return False
+
+def legal_black_moves_all(state, n=BOARD_SIZE):
+    wk,wr,bk = state.wk, state.wr, state.bk
+    moves = []
+    for np_ in tables(n).king[bk]:
+        if np_ == wk: continue
+        if kings_adjacent(wk, np_): continue
+        new_wr = CAPTURED if np_ == wr else wr   # rook captured
+        if new_wr[0] >= 0 and rook_attacks_square(new_wr, wk, np_, np_, n):
+            continue
+        moves.append((f"k{coord_to_alg(bk)}->{coord_to_alg(np_)}", State(wk, new_wr, np_, True)))
+    return moves
+
+def rook_capturable(wk, wr, bk):
+    """Μπορεί ο Μαύρος να πάρει τον πύργο; (ο πύργος δεν προστατεύεται από τον Λευκό βασιλιά)"""
+    return kings_adjacent(bk, wr) and not kings_adjacent(wk, wr)
+
+def legal_white_moves(state, n=BOARD_SIZE):
+    wk,wr,bk = state.wk, state.wr, state.bk
+    t = tables(n)
+    moves = []
+    # King moves
+    for np_ in t.king[wk]:
+        if np_ == wr or np_ == bk: continue
+        if kings_adjacent(np_, bk): continue
+        moves.append((f"K{coord_to_alg(wk)}->{coord_to_alg(np_)}", State(np_, wr, bk, False)))
+    # Rook moves (safe only)
+    if wr[0] >= 0:
+        for ray in t.rays[wr]:
+            for np_ in ray:
+                if np_ == wk or np_ == bk: break
+                # safety check: black must not capture rook
+                if not rook_capturable(wk, np_, bk):
+                    moves.append((f"R{coord_to_alg(wr)}->{coord_to_alg(np_)}", State(wk, np_, bk, False)))
+    return moves
+
+#---------- Goal Test ----------
+def is_checkmate(state, n=BOARD_SIZE):
+    if state.white: return False
+    if state.wr[0] < 0: return False
+    if not rook_attacks_square(state.wr, state.wk, state.bk, state.bk, n): return False
+    return len(legal_black_moves_all(state, n)) == 0
+
+#---------- Black Policy ----------
+def black_policy(state, n=BOARD_SIZE):
+    """Ο Μαύρος πηγαίνει στο τετράγωνο πιο κοντά στο κέντρο (Manhattan)"""
+    moves = legal_black_moves_all(state, n)
+    if not moves: return None
+    cx = cy = n // 2
+    return min(moves, key=lambda m: abs(m[1].bk[0]-cx)+abs(m[1].bk[1]-cy))[1]
+
+def black_move_str(cur, nxt): return f"Black→{coord_to_alg(cur.bk)}->{coord_to_alg(nxt.bk)}"
+
+#---------- Heuristics ----------
+def h_cheb(state): return max(abs(state.wk[0]-state.bk[0]), abs(state.wk[1]-state.bk[1]))
+def h_manhattan(state): return abs(state.wk[0]-state.bk[0]) + abs(state.wk[1]-state.bk[1])
+
+HEURISTICS = {"cheb": h_cheb, "manhattan": h_manhattan}
@@ -0,0 +1,66 @@
+from array import array
+
+from .board import State, CAPTURED, coord_to_alg
+
+#---------- Συμπαγής αναπαράσταση ----------
+# κατάσταση -> u32: 7 bits ανά τετράγωνο (x*8+y, 64 = αιχμαλωτισμένος πύργος) + 1 bit για το ποιος παίζει
+SQUARES = tuple((i >> 3, i & 7) for i in range(64)) + (CAPTURED,)
+SQUARE_INDEX = {sq: i for i, sq in enumerate(SQUARES)}
+
+def pack_state(s):
+    wk, wr, bk, white = s
+    r = wr[0] << 3 | wr[1] if wr[0] >= 0 else 64
+    return (wk[0] << 3 | wk[1]) | r << 7 | (bk[0] << 3 | bk[1]) << 14 | white << 21
+
+def unpack_state(v):
+    return State(SQUARES[v & 127], SQUARES[v >> 7 & 127], SQUARES[v >> 14 & 127], bool(v >> 21 & 1))
+
+# κίνηση -> u16: είδος (2 bits) | από (7 bits) | προς (7 bits)
+MOVE_NONE, MOVE_KING, MOVE_ROOK, MOVE_BLACK = range(4)
+MOVE_PREFIX = {MOVE_KING: "K", MOVE_ROOK: "R", MOVE_BLACK: "Black→"}
+
+def move_code(cur, nxt):
+    """Ο κωδικός της κίνησης cur -> nxt (ίδια πληροφορία με τα strings των legal_*_moves)"""
+    if not cur.white:
+        return MOVE_BLACK << 14 | SQUARE_INDEX[cur.bk] << 7 | SQUARE_INDEX[nxt.bk]
+    if cur.wk != nxt.wk:
+        return MOVE_KING << 14 | SQUARE_INDEX[cur.wk] << 7 | SQUARE_INDEX[nxt.wk]
+    return MOVE_ROOK << 14 | SQUARE_INDEX[cur.wr] << 7 | SQUARE_INDEX[nxt.wr]
+
+def move_str(code):
+    return f"{MOVE_PREFIX[code >> 14]}{coord_to_alg(SQUARES[code >> 7 & 127])}->{coord_to_alg(SQUARES[code & 127])}"
+
+#---------- Node store ----------
+class NodeStore:
+    """Ένας κόμβος ανά κατάσταση: state -> node id και παράλληλοι typed πίνακες για
+    g, parent id και closed flag (αντί για dicts με tuples ανά κόμβο). Η κίνηση δεν
+    αποθηκεύεται: βγαίνει από τις καταστάσεις γονέα/παιδιού μόνο για το τελικό μονοπάτι."""
+    __slots__ = ("ids", "key", "g", "parent", "closed")
+
+    def __init__(self):
+        self.ids = {}               # packed state -> node id
+        self.key = array("I")       # node id -> packed state
+        self.g = array("i")
+        self.parent = array("i")    # -1 για τη ρίζα
+        self.closed = bytearray()
+
+    def __len__(self): return len(self.key)
+
+    def add(self, key, g, parent):
+        i = len(self.key)
+        self.ids[key] = i
+        self.key.append(key)
+        self.g.append(g)
+        self.parent.append(parent)
+        self.closed.append(0)
+        return i
+
+    def state(self, i): return unpack_state(self.key[i])
+
+    def path(self, i):
+        moves = []
+        while self.parent[i] >= 0:
+            p = self.parent[i]
+            moves.append(move_str(move_code(self.state(p), self.state(i))))
+            i = p
+        return list(reversed(moves))
@@ -0,0 +1,279 @@
+import itertools, heapq
+from collections import deque
+
+from .board import BOARD_SIZE, legal_white_moves, is_checkmate, black_policy, black_move_str
+from .nodestore import NodeStore, pack_state
+
+def reconstruct(parents, cur):
+    path = []
+    while parents[cur][0] is not None:
+        move, parent = parents[cur]
+        path.append(move)
+        cur = parent
+    return list(reversed(path))
+
+#---------- A* ----------
+def astar(start, hfunc, partial=False, stats=None, trace=None, n=BOARD_SIZE):
+    """A* πάνω σε NodeStore. Με partial=True τρέχει ως Partial-Expansion A* (PEA*): σε κάθε
+    pop μπαίνουν στο heap μόνο τα παιδιά με f ίσο με το αποθηκευμένο F του γονέα (ή μικρότερο,
+    που γίνεται μόνο με μη συνεπή ευρετική όπως η manhattan στις διαγώνιες κινήσεις), και ο
+    γονέας ξαναμπαίνει με το αμέσως μεγαλύτερο f. Το PEA* συμφέρει με την h_manhattan (μισό
+    peak open, λιγότερα pushes)· με την h_cheb τα παιδιά είναι σχεδόν όλα στο F ή στο F+1 και
+    τα επιπλέον pops του γονέα είναι περισσότερα από όσα γλιτώνει, γι' αυτό είναι εκτός εξ
+    ορισμού (bench_pea.py). Στο stats (dict) γράφονται pushes/peak_open/pops/nodes. Με trace
+    (search_trace.TraceRecorder) καταγράφονται pushes/επεκτάσεις."""
+    counter = itertools.count()
+    openh = []
+    store = NodeStore()
+    ids, gs, closed = store.ids, store.g, store.closed
+    add, parents, heappush = store.add, store.parent, heapq.heappush
+    root = add(pack_state(start), 0, -1)
+    heappush(openh, (hfunc(start), 0, next(counter), root))
+    if trace is not None: trace.push(start, 0, hfunc(start))
+    pending = {}    # PEA*: παιδιά που δεν έχουν μπει ακόμη στο heap, ανά γονέα
+    expanded = 0
+    pushes, peak, pops = 1, 1, 0
+    try:
+        while openh:
+            if len(openh) > peak: peak = len(openh)
+            f,g,_, ci = heapq.heappop(openh)
+            pops += 1
+            if closed[ci]: continue
+            if partial:
+                if g > gs[ci]: continue             # παλιά εγγραφή, βρέθηκε καλύτερο g
+                first = ci not in pending           # πρώτη επέκταση του κόμβου;
+            else:
+                first = True
+                closed[ci] = 1
+            cur = store.state(ci)
+            if first:
+                expanded += 1
+                if trace is not None: trace.expand(cur, g, f - g, store.key[ci])
+                if is_checkmate(cur, n):
+                    if trace is not None: trace.goal(cur, g, f - g, store.key[ci])
+                    path = store.path(ci)
+                    return expanded, len(path), path
+            if cur.white:
+                ng = g + 1
+                if not partial:
+                    # A*: κάθε παιδί πάει κατευθείαν στο heap (ένα pack_state/ids.get ανά παιδί)
+                    for _, ns in legal_white_moves(cur, n):
+                        key = pack_state(ns)
+                        i = ids.get(key)
+                        if i is None:
+                            i = add(key, ng, ci)
+                        elif ng < gs[i]:
+                            gs[i] = ng
+                            parents[i] = ci
+                        else:
+                            continue
+                        nf = ng + hfunc(ns)
+                        heappush(openh, (nf, ng, next(counter), i)); pushes += 1
+                        if trace is not None: trace.push(ns, ng, nf - ng, cur, key)
+                    continue
+                if first:
+                    # το key και το id υπολογίζονται μία φορά ανά παιδί και περνούν στο push
+                    children = []
+                    for _, ns in legal_white_moves(cur, n):
+                        key = pack_state(ns)
+                        i = ids.get(key)
+                        if i is None or ng < gs[i]:
+                            children.append((ng + hfunc(ns), next(counter), ns, key, i))
+                else:
+                    # PEA*: από το προηγούμενο pop μπορεί να έχουν προστεθεί κόμβοι ή να άλλαξε το g
+                    children = [(nf, c, ns, key, ids.get(key)) for nf, c, ns, key, _ in pending.pop(ci)]
+                # PEA*: μπαίνουν μόνο τα παιδιά με f <= F, τα υπόλοιπα περιμένουν στο pending
+                children.sort(reverse=True)
+                rest = children
+                children = []
+                while rest and rest[-1][0] <= f:
+                    children.append(rest.pop())
+                if rest:
+                    pending[ci] = rest
+                    heappush(openh, (rest[-1][0], g, next(counter), ci)); pushes += 1
+                else:
+                    closed[ci] = 1
+                for nf, _, ns, key, i in children:
+                    if i is None:
+                        i = add(key, ng, ci)
+                    elif ng < gs[i]:
+                        gs[i] = ng
+                        parents[i] = ci
+                        pending.pop(i, None)        # νέο g: τα παλιά παιδιά του κόμβου δεν ισχύουν
+                    else:
+                        continue
+                    heappush(openh, (nf, ng, next(counter), i)); pushes += 1
+                    if trace is not None: trace.push(ns, ng, nf - ng, cur, key)
+            else:
+                closed[ci] = 1
+                nxt = black_policy(cur, n)
+                if nxt:
+                    ng = g + 1
+                    key = pack_state(nxt)
+                    i = ids.get(key)
+                    if i is None:
+                        i = add(key, ng, ci)
+                    elif ng < gs[i]:
+                        gs[i] = ng
+                        parents[i] = ci
+                        pending.pop(i, None)
+                    else:
+                        continue
+                    nf = ng + hfunc(nxt)
+                    heappush(openh, (nf, ng, next(counter), i)); pushes += 1
+                    if trace is not None: trace.push(nxt, ng, nf - ng, cur, key)
+        return expanded, None, None
+    finally:
+        if stats is not None:
+            stats.update(pushes=pushes, peak_open=peak, pops=pops, nodes=len(store))
+
+#---------- Best-First Search ----------
+def best_first(start, hfunc, trace=None, stats=None, n=BOARD_SIZE):
+    """Greedy best-first πάνω σε NodeStore. Κάθε κατάσταση μπαίνει στο open μία φορά και
+    κρατά τον γονέα που τη βρήκε πρώτος (η h δεν εξαρτάται από τον γονέα, άρα ένα δεύτερο
+    push θα έβγαινε πάντα μετά το πρώτο και θα πετιόταν ως κλειστό)"""
+    counter = itertools.count()
+    openh = []
+    store = NodeStore()
+    ids, closed = store.ids, store.closed
+    add, gs, heappush = store.add, store.g, heapq.heappush
+    root = add(pack_state(start), 0, -1)
+    heappush(openh, (hfunc(start), next(counter), root))
+    if trace is not None: trace.push(start, h=hfunc(start))
+    expanded = 0
+
+    try:
+        while openh:
+            _, _, ci = heapq.heappop(openh)
+            if closed[ci]:
+                continue
+            closed[ci] = 1
+            expanded += 1
+            cur = store.state(ci)
+            if trace is not None: trace.expand(cur, key=store.key[ci])
+
+            if is_checkmate(cur, n):
+                if trace is not None: trace.goal(cur, key=store.key[ci])
+                path = store.path(ci)
+                return expanded, len(path), path
+
+            if cur.white:
+                children = [ns for _, ns in legal_white_moves(cur, n)]
+            else:
+                nxt = black_policy(cur, n)
+                children = [nxt] if nxt else []
+            g = gs[ci] + 1
+            for ns in children:
+                key = pack_state(ns)
+                i = ids.get(key)
+                if i is not None:
+                    continue                # ήδη στο open ή κλειστός: κρατά τον πρώτο γονέα του
+                i = add(key, g, ci)
+                h = hfunc(ns)
+                heappush(openh, (h, next(counter), i))
+                if trace is not None: trace.push(ns, h=h, parent=cur, key=key)
+
+        return expanded, None, None
+    finally:
+        if stats is not None:
+            stats.update(nodes=len(store))
+
+#---------- BFS ----------
+def bfs(start, trace=None, n=BOARD_SIZE):
+    queue = deque([start])
+    parents = {start: (None,None)}
+    expanded = 0
+    if trace is not None: trace.push(start, 0)
+
+    while queue:
+        cur = queue.popleft()
+        expanded += 1
+        if trace is not None: trace.expand(cur)
+
+        if is_checkmate(cur, n):
+            if trace is not None: trace.goal(cur)
+            path = reconstruct(parents, cur)
+            return expanded, len(path), path
+
+        if cur.white:
+            for md, ns in legal_white_moves(cur, n):
+                if ns not in parents:
+                    parents[ns] = (md, cur)
+                    queue.append(ns)
+                    if trace is not None: trace.push(ns, parent=cur)
+        else:
+            nxt = black_policy(cur, n)
+            if nxt and nxt not in parents:
+                parents[nxt] = (black_move_str(cur, nxt), cur)
+                queue.append(nxt)
+                if trace is not None: trace.push(nxt, parent=cur)
+
+    return expanded, None, None
+
+#---------- DFS ----------
+def dfs(start, n=BOARD_SIZE):
+    stack = [(start, [])]  # state, path
+    visited = set()
+    expanded = 0
+
+    while stack:
+        state, path = stack.pop()
+        if state in visited: continue
+        visited.add(state)
+        expanded += 1
+
+        if is_checkmate(state, n):
+            return expanded, len(path), path
+
+        if state.white:
+            for move, ns in reversed(legal_white_moves(state, n)):
+                stack.append((ns, path + [move]))
+        else:
+            nxt = black_policy(state, n)
+            if nxt:
+                stack.append((nxt, path + [black_move_str(state, nxt)]))
+    return expanded, None, None
+
+#---------- IDS ----------
+def dfs_limited(state, limit, gscore, parents, expanded, n=BOARD_SIZE):
+    stack = [(state, 0)]
+    while stack:
+        cur, depth = stack.pop()
+        expanded[0] += 1
+        if is_checkmate(cur, n):
+            return cur
+        if depth < limit:
+            if cur.white:
+                for md, ns in reversed(legal_white_moves(cur, n)):
+                    if ns not in gscore or depth+1 < gscore[ns]:
+                        gscore[ns] = depth+1
+                        parents[ns] = (md, cur)
+                        stack.append((ns, depth+1))
+            else:
+                nxt = black_policy(cur, n)
+                if nxt:
+                    if nxt not in gscore or depth+1 < gscore[nxt]:
+                        gscore[nxt] = depth+1
+                        parents[nxt] = (black_move_str(cur, nxt), cur)
+                        stack.append((nxt, depth+1))
+    return None
+
+def ids(start, max_depth=50, n=BOARD_SIZE):
+    for limit in range(max_depth):
+        gscore = {start: 0}
+        parents = {start: (None, None)}
+        expanded = [0]
+        goal = dfs_limited(start, limit, gscore, parents, expanded, n)
+        if goal:
+            path = reconstruct(parents, goal)
+            return expanded[0], len(path), path
+    return None, None, None
+
+# όνομα -> (συνάρτηση, χρειάζεται ευρετική)
+ALGORITHMS = {
+    "astar":      (astar, True),
+    "best_first": (best_first, True),
+    "bfs":        (bfs, False),
+    "dfs":        (dfs, False),
+    "ids":        (ids, False),
+}
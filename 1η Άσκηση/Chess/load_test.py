@@ -0,0 +1,77 @@
+import argparse, asyncio, json, random, time
+
+from krk import BOARD_SIZE, coord_to_alg, kings_adjacent
+
+#---------- Τυχαίες θέσεις ----------
+def random_position(rng):
+    """Τυχαία θέση με τον Λευκό να παίζει: βασιλιάδες όχι δίπλα, ο Μαύρος όχι σε σαχ"""
+    squares = [(x,y) for x in range(BOARD_SIZE) for y in range(BOARD_SIZE)]
+    while True:
+        wk, wr, bk = rng.sample(squares, 3)
+        if kings_adjacent(wk, bk): continue
+        if wr[0] == bk[0] or wr[1] == bk[1]: continue
+        return {"wk": coord_to_alg(wk), "wr": coord_to_alg(wr), "bk": coord_to_alg(bk), "white": True}
+
+def percentile(xs, p):
+    xs = sorted(xs)
+    return xs[min(len(xs)-1, int(round(p/100 * (len(xs)-1))))]
+
+#---------- Client ----------
+async def connect(args):
+    if args.unix:
+        return await asyncio.open_unix_connection(args.unix)
+    return await asyncio.open_connection(args.host, args.port)
+
+async def worker(args, requests, latencies, errors):
+    reader, writer = await connect(args)
+    try:
+        while requests:
+            req = requests.pop()
+            t0 = time.perf_counter()
+            writer.write((json.dumps(req) + "\n").encode())
+            await writer.drain()
+            resp = json.loads(await reader.readline())
+            latencies.append(time.perf_counter() - t0)
+            if not resp.get("ok"):
+                errors.append(resp.get("error"))
+    finally:
+        writer.close()
+
+async def run(args):
+    rng = random.Random(args.seed)
+    positions = [random_position(rng) for _ in range(args.distinct)]
+    requests = [{"id": i, "position": rng.choice(positions), "algorithm": args.algorithm,
+                 "heuristic": args.heuristic, "deadline": args.deadline}
+                for i in range(args.requests)]
+    latencies, errors = [], []
+    t0 = time.perf_counter()
+    await asyncio.gather(*(worker(args, requests, latencies, errors) for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - t0
+
+    reader, writer = await connect(args)
+    writer.write(b'{"op": "stats"}\n')
+    await writer.drain()
+    stats = json.loads(await reader.readline())
+    writer.close()
+
+    print("\nΑΠΟΤΕΛΕΣΜΑΤΑ LOAD TEST")
+    print("--------------------------------------------------")
+    print(f"• Αιτήματα: {len(latencies)} ({len(errors)} σφάλματα), ταυτόχρονα: {args.concurrency}")
+    print(f"• Throughput: {len(latencies)/elapsed:.1f} αιτήματα/s")
+    print(f"• Latency p50: {percentile(latencies, 50)*1000:.2f} ms, p99: {percentile(latencies, 99)*1000:.2f} ms")
+    print(f"• Server: cache hits {stats['cache_hits']}, coalesced {stats['coalesced']}, computed {stats['computed']}")
+
+#---------- Εκτέλεση ----------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test για το solve_service.py")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--distinct", type=int, default=20, help="πλήθος διαφορετικών θέσεων")
+    parser.add_argument("--algorithm", default="astar")
+    parser.add_argument("--heuristic", default="cheb")
+    parser.add_argument("--deadline", type=float, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    asyncio.run(run(parser.parse_args()))
@@ -0,0 +1,235 @@
+import argparse, struct, sys, time
+from collections import Counter
+
+from krk import coord_to_alg, HEURISTICS
+from krk.nodestore import pack_state, unpack_state
+
+#---------- Μορφή αρχείου ----------
+# header: magic, έκδοση, μέγεθος εγγραφής
+# εγγραφή: state(u32, krk.nodestore.pack_state), parent(u32), g(u16), h(u16), event(u8) -> 13 bytes
+MAGIC = b"KRKT"
+HEADER = struct.Struct("<4sHH")
+RECORD = struct.Struct("<IIHHB")
+VERSION = 2
+pack_into, SIZE = RECORD.pack_into, RECORD.size
+
+PUSH, EXPAND, GOAL = 1, 2, 3
+EVENT_NAMES = {PUSH: "push", EXPAND: "expand", GOAL: "goal"}
+NONE = 0xFFFFFFFF      # parent που δεν υπάρχει
+UNKNOWN = 0xFFFF       # g/h που δεν δόθηκαν από τον αλγόριθμο
+
+#---------- Recorder ----------
+class TraceRecorder:
+    """Γράφει εγγραφές σταθερού μήκους σε buffer και τον αδειάζει στο αρχείο όταν γεμίσει.
+    Τα push είναι η συχνότερη εγγραφή: γράφονται χωρίς ενδιάμεση κλήση και ο γονέας
+    πακετάρεται μία φορά ανά επέκταση (όλα τα παιδιά της έχουν το ίδιο αντικείμενο γονέα)."""
+    def __init__(self, path, buffer_records=65536):
+        self.f = open(path, "wb")
+        self.f.write(HEADER.pack(MAGIC, VERSION, RECORD.size))
+        self.buf = bytearray(RECORD.size * buffer_records)
+        self.pos = 0
+        self.written = 0
+        self._parent = self._parent_key = None
+
+    @property
+    def count(self):
+        return self.written + self.pos // RECORD.size
+
+    def push(self, state, g=None, h=None, parent=None, key=None):
+        """key: το pack_state(state), αν το έχει ήδη υπολογίσει ο αλγόριθμος"""
+        if parent is None:
+            p = NONE
+        elif parent is self._parent:
+            p = self._parent_key
+        else:
+            p = self._parent_key = pack_state(parent)
+            self._parent = parent
+        if self.pos == len(self.buf):
+            self.flush()
+        pack_into(self.buf, self.pos, pack_state(state) if key is None else key, p,
+                  UNKNOWN if g is None else g, UNKNOWN if h is None else h, PUSH)
+        self.pos += SIZE
+
+    def record(self, event, state, g=None, h=None, key=None):
+        if self.pos == len(self.buf):
+            self.flush()
+        pack_into(self.buf, self.pos, pack_state(state) if key is None else key, NONE,
+                  UNKNOWN if g is None else g, UNKNOWN if h is None else h, event)
+        self.pos += SIZE
+
+    def expand(self, state, g=None, h=None, key=None):
+        # η δεύτερη συχνότερη εγγραφή: χωρίς την ενδιάμεση κλήση του record
+        if self.pos == len(self.buf):
+            self.flush()
+        pack_into(self.buf, self.pos, pack_state(state) if key is None else key, NONE,
+                  UNKNOWN if g is None else g, UNKNOWN if h is None else h, EXPAND)
+        self.pos += SIZE
+
+    def goal(self, state, g=None, h=None, key=None): self.record(GOAL, state, g, h, key)
+
+    def flush(self):
+        self.f.write(memoryview(self.buf)[:self.pos])
+        self.written += self.pos // RECORD.size
+        self.pos = 0
+
+    def close(self):
+        if not self.f.closed:
+            self.flush()
+            self.f.close()
+
+    def __enter__(self): return self
+    def __exit__(self, *exc): self.close()
+
+#---------- Reader ----------
+def read_trace(path):
+    """Επιστρέφει τις εγγραφές ως λίστα (event, state, parent, g, h)"""
+    with open(path, "rb") as f:
+        data = f.read()
+    magic, version, size = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION or size != RECORD.size:
+        raise ValueError(f"{path}: not a search trace (v{VERSION})")
+    return [(e, st, p, g, h) for st, p, g, h, e in RECORD.iter_unpack(memoryview(data)[HEADER.size:])]
+
+def with_depths(records):
+    """Συμπληρώνει g/h όπου λείπουν (bfs/best_first): g από το βάθος του γονέα,
+    h από το τελευταίο push του ίδιου κόμβου"""
+    depth, hval = {}, {}
+    out = []
+    for e, st, p, g, h in records:
+        if e == PUSH:
+            if g == UNKNOWN:
+                g = 0 if p == NONE else depth.get(p, 0) + 1
+            if st not in depth or g < depth[st]:
+                depth[st] = g
+            if h != UNKNOWN:
+                hval[st] = h
+        else:
+            if g == UNKNOWN: g = depth.get(st, 0)
+            if h == UNKNOWN: h = hval.get(st, 0)
+        out.append((e, st, p, g, 0 if h == UNKNOWN else h))
+    return out
+
+def summarise(records):
+    records = with_depths(records)
+    expansions = [(st, g, h) for e, st, p, g, h in records if e == EXPAND]
+    pushes = sum(1 for r in records if r[0] == PUSH)
+    seen = Counter(st for st, _, _ in expansions)
+    return {
+        "records": len(records),
+        "pushes": pushes,
+        "expansions": len(expansions),
+        "unique_expanded": len(seen),
+        "re_expansions": len(expansions) - len(seen),
+        "branching": pushes / len(expansions) if expansions else 0.0,
+        "goal": any(r[0] == GOAL for r in records),
+        "f_layers": Counter(g + h for _, g, h in expansions),
+        "order": [st for st, _, _ in expansions],
+    }
+
+def fmt_state(v):
+    s = unpack_state(v)
+    return f"K{coord_to_alg(s.wk)} R{coord_to_alg(s.wr)} k{coord_to_alg(s.bk)} {'w' if s.white else 'b'}"
+
+def print_summary(path, s):
+    print(f"\nTRACE {path}")
+    print("--------------------------------------------------")
+    print(f"• Εγγραφές: {s['records']}, pushes: {s['pushes']}, επεκτάσεις: {s['expansions']}")
+    print(f"• Μοναδικοί κόμβοι: {s['unique_expanded']}, επανα-επεκτάσεις: {s['re_expansions']}")
+    print(f"• Μέσος παράγοντας διακλάδωσης: {s['branching']:.2f}")
+    print(f"• Στόχος: {'ναι' if s['goal'] else 'όχι'}")
+    print("• Επεκτάσεις ανά f-layer:")
+    for f in sorted(s["f_layers"]):
+        print(f"   f={f:<4} {s['f_layers'][f]}")
+
+#---------- Εντολές ----------
+TRACED = ("astar", "best_first", "bfs")     # οι αλγόριθμοι του krk που δέχονται trace
+
+def cmd_record(args):
+    """Τρέχει έναν αλγόριθμο από τη θέση wk wr bk και γράφει το trace του"""
+    import krk
+    try:
+        squares = [krk.alg_to_coord(sq) for sq in (args.wk, args.wr, args.bk)]
+    except ValueError:
+        squares = None
+    if not squares or not all(krk.in_bounds(sq, args.size) for sq in squares):
+        raise ValueError(f"τετράγωνο εκτός σκακιέρας {args.size}x{args.size}: {args.wk} {args.wr} {args.bk}")
+    start = krk.State(*squares, not args.black)
+    search, needs_h = krk.ALGORITHMS[args.algorithm]
+    kwargs = {"n": args.size}
+    if needs_h:
+        kwargs["hfunc"] = krk.HEURISTICS[args.heuristic]
+    if args.partial:
+        if args.algorithm != "astar":
+            raise ValueError(f"το --partial (PEA*) υπάρχει μόνο για τον astar, όχι για τον {args.algorithm}")
+        kwargs["partial"] = True
+    with TraceRecorder(args.out) as rec:
+        expanded, length, _ = search(start, trace=rec, **kwargs)
+    print(f"{args.out}: {rec.count} εγγραφές, {expanded} επεκτάσεις, μήκος λύσης {length}")
+
+def cmd_replay(args):
+    for i, (e, st, p, g, h) in enumerate(with_depths(read_trace(args.trace))):
+        if args.limit and i >= args.limit: break
+        parent = "-" if p == NONE else fmt_state(p)
+        print(f"{i:>8} {EVENT_NAMES[e]:<6} {fmt_state(st):<20} g={g:<4} h={h:<4} <- {parent}")
+
+def cmd_summary(args):
+    print_summary(args.trace, summarise(read_trace(args.trace)))
+
+def cmd_compare(args):
+    a, b = summarise(read_trace(args.a)), summarise(read_trace(args.b))
+    print(f"\nΣΥΓΚΡΙΣΗ {args.a} / {args.b}")
+    print("--------------------------------------------------")
+    for k in ("pushes", "expansions", "unique_expanded", "re_expansions"):
+        print(f"• {k:<16} {a[k]:>8} {b[k]:>8}")
+    print(f"• {'branching':<16} {a['branching']:>8.2f} {b['branching']:>8.2f}")
+    common = set(a["order"]) & set(b["order"])
+    print(f"• Κοινοί κόμβοι που επεκτάθηκαν: {len(common)}")
+    diverge = next((i for i, (x, y) in enumerate(zip(a["order"], b["order"])) if x != y),
+                   min(len(a["order"]), len(b["order"])))
+    print(f"• Πρώτη απόκλιση στη σειρά επέκτασης: {diverge}")
+    print("• Επεκτάσεις ανά f-layer:")
+    for f in sorted(set(a["f_layers"]) | set(b["f_layers"])):
+        print(f"   f={f:<4} {a['f_layers'][f]:>8} {b['f_layers'][f]:>8}")
+
+def cmd_overhead(args):
+    """Μετρά το κόστος του recorder στον A*: διάμεσος του λόγου με/χωρίς trace ανά ζεύγος
+    διαδοχικών εκτελέσεων (το ελάχιστο δύο ανεξάρτητων σειρών είναι πολύ θορυβώδες)"""
+    import krk as mod
+    start = mod.State((0,0), (0,2), (4,4), True)
+    off, on = [], []
+    for _ in range(args.repeat):
+        t0 = time.perf_counter()
+        mod.astar(start, mod.h_cheb)
+        t1 = time.perf_counter()
+        with TraceRecorder(args.out) as rec:
+            mod.astar(start, mod.h_cheb, trace=rec)
+        off.append(t1 - t0); on.append(time.perf_counter() - t1)
+    ratio = sorted(b / a for a, b in zip(off, on))[len(on) // 2]
+    print(f"• Χωρίς trace: {min(off)*1000:.1f} ms, με trace: {min(on)*1000:.1f} ms, "
+          f"{rec.count} εγγραφές (διάμεσος {(ratio - 1)*100:+.1f}% σε {args.repeat} ζεύγη)")
+
+#---------- Εκτέλεση ----------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Εργαλείο ανάγνωσης binary traces αναζήτησης")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    p = sub.add_parser("record", help="εκτέλεση αλγορίθμου με καταγραφή")
+    p.add_argument("wk", nargs="?", default="a1"); p.add_argument("wr", nargs="?", default="a3")
+    p.add_argument("bk", nargs="?", default="e5")
+    p.add_argument("--black", action="store_true", help="παίζει ο Μαύρος")
+    p.add_argument("--algorithm", default="astar", choices=TRACED)
+    p.add_argument("--heuristic", default="cheb", choices=list(HEURISTICS))
+    p.add_argument("--partial", action="store_true", help="PEA* (μόνο astar)")
+    p.add_argument("--size", type=int, default=5, choices=range(3, 9))
+    p.add_argument("-o", "--out", default="search.trace")
+    p.set_defaults(func=cmd_record)
+    p = sub.add_parser("replay"); p.add_argument("trace"); p.add_argument("--limit", type=int, default=0)
+    p.set_defaults(func=cmd_replay)
+    p = sub.add_parser("summary"); p.add_argument("trace"); p.set_defaults(func=cmd_summary)
+    p = sub.add_parser("compare"); p.add_argument("a"); p.add_argument("b"); p.set_defaults(func=cmd_compare)
+    p = sub.add_parser("overhead"); p.add_argument("--out", default="astar.trace")
+    p.add_argument("--repeat", type=int, default=31); p.set_defaults(func=cmd_overhead)
+    args = parser.parse_args()
+    try:
+        args.func(args)
+    except (OSError, ValueError) as e:
+        sys.exit(f"σφάλμα: {e}")
@@ -0,0 +1,175 @@
+import argparse, asyncio, json
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+from krk import (BOARD_SIZE, CAPTURED, State, in_bounds, alg_to_coord, kings_adjacent, tables,
+                 ALGORITHMS, HEURISTICS)
+
+#---------- Worker (τρέχει στο process pool) ----------
+def _warm():
+    tables()
+
+def solve(key):
+    """Λύνει ένα αίτημα key = (wk, wr, bk, white, algorithm, heuristic)"""
+    wk, wr, bk, white, algorithm, heuristic = key
+    search, needs_h = ALGORITHMS[algorithm]
+    start = State(wk, wr, bk, white)
+    if needs_h:
+        expanded, length, path = search(start, HEURISTICS[heuristic])
+    else:
+        expanded, length, path = search(start)
+    return {"expanded": expanded, "length": length, "path": path}
+
+def square(name, captured=False):
+    """Αλγεβρικό τετράγωνο -> (x, y) της σκακιέρας του service ('--' μόνο για τον πύργο)"""
+    try:
+        c = alg_to_coord(name)
+    except (TypeError, ValueError, IndexError):
+        c = None
+    if c == CAPTURED and captured:
+        return c
+    if c is None or not in_bounds(c):
+        # π.χ. το a9 θα γινόταν (0, 8) και στο pack_state θα ταυτιζόταν με το b1
+        raise ValueError(f"square off the {BOARD_SIZE}x{BOARD_SIZE} board: {name!r}")
+    return c
+
+#---------- Service ----------
+class SolveService:
+    def __init__(self, workers=None, cache_size=1024):
+        self.pool = ProcessPoolExecutor(max_workers=workers, initializer=_warm)
+        self.cache = OrderedDict()      # LRU: key -> αποτέλεσμα
+        self.cache_size = cache_size
+        self.inflight = {}              # key -> Future (συγχώνευση ίδιων αιτημάτων)
+        self.stats = {"requests": 0, "cache_hits": 0, "coalesced": 0, "computed": 0}
+
+    def parse(self, req):
+        pos = req["position"]
+        if not isinstance(pos, dict):
+            raise ValueError("position must be an object")
+        algorithm = req.get("algorithm", "astar")
+        heuristic = req.get("heuristic", "cheb")
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"unknown algorithm: {algorithm}")
+        if ALGORITHMS[algorithm][1]:
+            if heuristic not in HEURISTICS:
+                raise ValueError(f"unknown heuristic: {heuristic}")
+        else:
+            heuristic = None
+        white = pos.get("white", True)
+        if not isinstance(white, bool):
+            raise ValueError(f"white must be true or false: {white!r}")
+        wk, wr, bk = square(pos["wk"]), square(pos["wr"], captured=True), square(pos["bk"])
+        if wk == bk or wr in (wk, bk):
+            raise ValueError("two pieces on the same square")
+        if kings_adjacent(wk, bk):
+            raise ValueError("kings on adjacent squares")
+        return wk, wr, bk, white, algorithm, heuristic
+
+    async def lookup(self, key):
+        """Επιστρέφει (αποτέλεσμα, πηγή) με πηγή 'cache', 'coalesced' ή 'computed'"""
+        self.stats["requests"] += 1
+        if key in self.cache:
+            self.cache.move_to_end(key)
+            self.stats["cache_hits"] += 1
+            return self.cache[key], "cache"
+        fut = self.inflight.get(key)
+        if fut is not None:
+            self.stats["coalesced"] += 1
+            return await asyncio.shield(fut), "coalesced"
+        loop = asyncio.get_running_loop()
+        fut = asyncio.ensure_future(loop.run_in_executor(self.pool, solve, key))
+        self.inflight[key] = fut
+        fut.add_done_callback(lambda f, key=key: self._done(key, f))
+        self.stats["computed"] += 1
+        return await asyncio.shield(fut), "computed"
+
+    def _done(self, key, fut):
+        self.inflight.pop(key, None)
+        if fut.cancelled() or fut.exception() is not None:
+            return
+        self.cache[key] = fut.result()
+        self.cache.move_to_end(key)
+        while len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+
+    async def handle(self, req):
+        if not isinstance(req, dict):
+            return {"id": None, "ok": False, "error": "bad request: expected a JSON object"}
+        rid = req.get("id")
+        if req.get("op") == "stats":
+            return {"id": rid, "ok": True, **self.stats, "cache_size": len(self.cache)}
+        try:
+            key = self.parse(req)
+            # το deadline ελέγχεται πριν φτιαχτεί η coroutine του lookup
+            deadline = req.get("deadline")
+            if deadline is not None and (isinstance(deadline, bool) or not isinstance(deadline, (int, float))):
+                raise ValueError(f"deadline must be a number of seconds: {deadline!r}")
+        except (KeyError, ValueError, IndexError, TypeError, AttributeError) as e:
+            return {"id": rid, "ok": False, "error": f"bad request: {e}"}
+        try:
+            # ο υπολογισμός συνεχίζει και μετά το deadline, ώστε να μπει στην cache
+            result, source = await asyncio.wait_for(self.lookup(key), deadline)
+        except asyncio.TimeoutError:
+            return {"id": rid, "ok": False, "error": "deadline exceeded"}
+        except Exception as e:
+            return {"id": rid, "ok": False, "error": f"{type(e).__name__}: {e}"}
+        return {"id": rid, "ok": True, "source": source, **result}
+
+    async def client(self, reader, writer):
+        """Ένα αίτημα JSON ανά γραμμή, μία απάντηση JSON ανά γραμμή (με τη σειρά ολοκλήρωσης)"""
+        lock = asyncio.Lock()
+        tasks = set()
+
+        async def respond(line):
+            try:
+                resp = await self.handle(json.loads(line))
+            except json.JSONDecodeError as e:
+                resp = {"id": None, "ok": False, "error": f"bad json: {e}"}
+            data = (json.dumps(resp, ensure_ascii=False) + "\n").encode()
+            async with lock:
+                writer.write(data)
+                await writer.drain()
+
+        try:
+            while line := await reader.readline():
+                if not line.strip(): continue
+                t = asyncio.create_task(respond(line))
+                tasks.add(t)
+                t.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    def close(self):
+        self.pool.shutdown(cancel_futures=True)
+
+async def serve(args):
+    service = SolveService(args.workers, args.cache_size)
+    if args.unix:
+        server = await asyncio.start_unix_server(service.client, path=args.unix)
+        where = args.unix
+    else:
+        server = await asyncio.start_server(service.client, args.host, args.port)
+        where = f"{args.host}:{args.port}"
+    print(f"KRK solve service σε {where}", flush=True)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+
+#---------- Εκτέλεση ----------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="JSON-lines υπηρεσία επίλυσης KRK")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="διαδρομή Unix socket (αντί για TCP)")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--cache-size", type=int, default=1024)
+    try:
+        asyncio.run(serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
@@ -1,136 +1,598 @@
-import itertools
-from collections import deque
-import copy
-
-#---------- Sudoku 4x4 Setup ----------
-ROWS = ['1','2','3','4']  # αριθμητική αρίθμηση από κάτω προς τα πάνω
-COLS = ['a','b','c','d']
-
-# αρχική κατάσταση
-initial = {
-    ('3','b'): '4',
-    ('2','c'): '3',
-    ('2','d'): '2',
-    ('4','d'): '3'
+import argparse, itertools, random
+from collections import deque, OrderedDict
+
+from sudoku_grid import parse, initial_domains, consistent, Solver
+
+#---------- Sudoku Setup ----------
+# αρχική κατάσταση 4x4 σε μορφή μίας γραμμής (γραμμή 0 = πάνω, '.' = κενό)
+INITIAL = "...3.4....32...."
+
+#---------- Trail (undo stack) ----------
+# Κάθε αφαίρεση τιμής γράφεται ως (κελί, θέση, τιμή)· στο backtrack ξαναμπαίνουν με
+# αντίστροφη σειρά μέχρι το mark, οπότε τα domains επανέρχονται ακριβώς (και με την ίδια σειρά)
+def remove_value(domains, var, value, trail):
+    i = domains[var].index(value)
+    del domains[var][i]
+    trail.append((var, i, value))
+
+def undo(domains, trail, mark):
+    while len(trail) > mark:
+        var, i, value = trail.pop()
+        domains[var].insert(i, value)
+
+#---------- MAC Helper Functions ----------
+# Ο γράφος περιορισμών είναι οι γείτονες g.peers κάθε κελιού (προϋπολογισμένοι στο sudoku_grid)
+# και όλοι οι περιορισμοί είναι X != Y.
+
+def revise(g, X, Y, domains, trail):
+    """Revise για X != Y: μια τιμή της X χάνει κάθε υποστήριξη μόνο όταν το domain
+    της Y είναι μονοσύνολο με την ίδια τιμή"""
+    dy = domains[Y]
+    if len(dy) == 1 and dy[0] in domains[X]:
+        remove_value(domains, X, dy[0], trail)
+        return True
+    return False
+
+def bump(weights, X, Y):
+    """dom/wdeg: +1 στο βάρος του περιορισμού X != Y που προκάλεσε αποτυχία"""
+    if weights is not None:
+        key = (X, Y) if X < Y else (Y, X)
+        weights[key] = weights.get(key, 0) + 1
+
+def ac3(g, domains, unassigned, trail, weights=None, stats=None):
+    """Διατηρεί arc-consistency στα τόξα του γράφου περιορισμών (ουρά χωρίς διπλά τόξα).
+    Με weights, κάθε wipe-out ανεβάζει το βάρος του τόξου που το προκάλεσε· τα τόξα
+    που εξετάστηκαν προστίθενται στο stats.arcs_processed."""
+    peers = g.peers
+    queue = deque((X, Y) for X in unassigned for Y in peers[X] if Y in unassigned)
+    queued = set(queue)
+    arcs = 0
+    try:
+        while queue:
+            arc = queue.popleft()
+            queued.discard(arc)
+            arcs += 1
+            X, Y = arc
+            if revise(g, X, Y, domains, trail):
+                if not domains[X]:
+                    bump(weights, X, Y)
+                    return False
+                for Z in peers[X]:
+                    if Z != Y and Z in unassigned and (Z, X) not in queued:
+                        queued.add((Z, X))
+                        queue.append((Z, X))
+        return True
+    finally:
+        if stats is not None:
+            stats.arcs_processed += arcs
+
+#---------- Ισχυρότερη διάδοση ----------
+# Επίπεδα διάδοσης για το mac_search:
+#   "ac3"     : μόνο δυαδική arc-consistency μεταξύ μη ανατεθειμένων κελιών (όπως πριν)
+#   "subsets" : + απαλοιφή τιμών ανατεθειμένων κελιών, hidden singles, naked pairs, pointing pairs
+#   "alldiff" : + φιλτράρισμα all-different κάθε μονάδας με matching (Régin)
+LEVELS = ("ac3", "subsets", "alldiff")
+
+def restrict(domains, var, keep, trail):
+    """Κρατά στο domain της var μόνο τις τιμές του keep"""
+    for v in [v for v in domains[var] if v not in keep]:
+        remove_value(domains, var, v, trail)
+
+def eliminate_singles(g, domains, unassigned, trail, weights=None):
+    """Naked singles: η τιμή κάθε κελιού με μονοσύνολο domain φεύγει από τους γείτονές του"""
+    changed = False
+    for var in g.cells:
+        if len(domains[var]) == 1:
+            v = domains[var][0]
+            for p in g.peers[var]:
+                if p in unassigned and v in domains[p]:
+                    remove_value(domains, p, v, trail)
+                    changed = True
+                    if not domains[p]:
+                        bump(weights, p, var)
+                        return None
+    return changed
+
+def hidden_singles(g, domains, unassigned, trail, weights=None):
+    """Μια τιμή που χωράει σε ένα μόνο κελί μιας μονάδας ανατίθεται εκεί"""
+    changed = False
+    for unit in g.units:
+        places = {}
+        for var in unit:
+            for v in domains[var]:
+                places.setdefault(v, []).append(var)
+        if len(places) < g.n:
+            return None                     # κάποια τιμή δεν χωράει πουθενά στη μονάδα
+        for v, cells in places.items():
+            if len(cells) == 1 and len(domains[cells[0]]) > 1:
+                restrict(domains, cells[0], (v,), trail)
+                changed = True
+    return changed
+
+def naked_pairs(g, domains, unassigned, trail, weights=None):
+    """Δύο κελιά μιας μονάδας με το ίδιο domain {a,b}: τα a,b φεύγουν από τα υπόλοιπα"""
+    changed = False
+    for unit in g.units:
+        seen = {}
+        for var in unit:
+            if len(domains[var]) == 2:
+                key = tuple(sorted(domains[var]))
+                if key in seen:
+                    pair = (seen[key], var)
+                    for other in unit:
+                        if other not in pair and other in unassigned:
+                            for v in key:
+                                if v in domains[other]:
+                                    remove_value(domains, other, v, trail)
+                                    changed = True
+                            if not domains[other]:
+                                return None
+                else:
+                    seen[key] = var
+    return changed
+
+def pointing_pairs(g, domains, unassigned, trail, weights=None):
+    """Αν σε ένα κουτί η τιμή v χωράει μόνο σε μία γραμμή (ή στήλη), φεύγει από
+    την υπόλοιπη γραμμή (στήλη) εκτός κουτιού"""
+    changed = False
+    for bx, box_cells in enumerate(g.boxes):
+        for v in g.digits:
+            cells = [var for var in box_cells if v in domains[var]]
+            if len(cells) < 2:
+                continue
+            for line_of, lines in ((g.row_of, g.rows), (g.col_of, g.cols)):
+                line = line_of[cells[0]]
+                if all(line_of[var] == line for var in cells):
+                    for other in lines[line]:
+                        if g.box_of[other] != bx and other in unassigned and v in domains[other]:
+                            remove_value(domains, other, v, trail)
+                            changed = True
+                            if not domains[other]:
+                                return None
+    return changed
+
+def alldiff_filter(g, unit, domains, unassigned, trail):
+    """Régin: κρατά μόνο τις ακμές (κελί, τιμή) που ανήκουν σε κάποιο μέγιστο matching.
+    Επιστρέφει None αν δεν υπάρχει matching που καλύπτει όλα τα κελιά."""
+    k = len(unit)
+    match_var = [None] * k                  # κελί -> τιμή
+    match_val = {}                          # τιμή -> κελί
+    def augment(i, seen):
+        for v in domains[unit[i]]:
+            if v not in seen:
+                seen.add(v)
+                if v not in match_val or augment(match_val[v], seen):
+                    match_var[i] = v
+                    match_val[v] = i
+                    return True
+        return False
+    for i in range(k):
+        if not augment(i, set()):
+            return None
+
+    # γράφος: κελί i -> τιμή του matching, τιμή v -> κελιά (εκτός matching) που την έχουν
+    val_edges = {}
+    for i in range(k):
+        for v in domains[unit[i]]:
+            if v != match_var[i]:
+                val_edges.setdefault(v, []).append(i)
+    # κορυφές που φτάνονται με εναλλασσόμενο μονοπάτι από ελεύθερη τιμή
+    free = [v for v in val_edges if v not in match_val]
+    reach_val = set(free)
+    stack = list(free)
+    while stack:
+        for i in val_edges.get(stack.pop(), ()):
+            w = match_var[i]
+            if w not in reach_val:
+                reach_val.add(w)
+                stack.append(w)
+    # SCC (Tarjan) στις κορυφές-τιμές: v -> w αν v -> κελί i (εκτός matching) και match_var[i] = w
+    index, low, comp, on_stack, st = {}, {}, {}, set(), []
+    counter = [0]
+    def strongconnect(v):
+        index[v] = low[v] = counter[0]; counter[0] += 1
+        st.append(v); on_stack.add(v)
+        for i in val_edges.get(v, ()):
+            w = match_var[i]
+            if w not in index:
+                strongconnect(w)
+                low[v] = min(low[v], low[w])
+            elif w in on_stack:
+                low[v] = min(low[v], index[w])
+        if low[v] == index[v]:
+            while True:
+                w = st.pop(); on_stack.discard(w); comp[w] = v
+                if w == v: break
+    for v in list(match_val):
+        if v not in index:
+            strongconnect(v)
+
+    changed = False
+    for v, cells in val_edges.items():
+        if v in reach_val:
+            continue
+        for i in cells:
+            var = unit[i]
+            if var in unassigned and comp.get(v) != comp.get(match_var[i]):
+                remove_value(domains, var, v, trail)
+                changed = True
+    return changed
+
+def alldiff(g, domains, unassigned, trail, weights=None):
+    changed = False
+    for unit in g.units:
+        r = alldiff_filter(g, unit, domains, unassigned, trail)
+        if r is None:
+            return None
+        changed = changed or r
+    return changed
+
+RULES = {
+    "ac3":     (),
+    "subsets": (eliminate_singles, hidden_singles, naked_pairs, pointing_pairs),
+    "alldiff": (eliminate_singles, alldiff, pointing_pairs),
 }
 
-#domain για κάθε κελί
-domain = { (r,c): ['1','2','3','4'] if (r,c) not in initial else [initial[(r,c)]]
-          for r in ROWS for c in COLS }
-
-#---------- Constraints ----------
-def consistent(sol, var, value):
-    """Ελέγχει περιορισμούς για σειρά, στήλη και τετράγωνο 2x2"""
-    r,c = var
-    #σειρά
-    for col in COLS:
-        if col != c and sol.get((r,col)) == value:
+def propagate(g, domains, unassigned, trail, level="ac3", weights=None, stats=None):
+    """ac3 και μετά οι κανόνες του επιπέδου μέχρι να μην αλλάζει τίποτα"""
+    while True:
+        if not ac3(g, domains, unassigned, trail, weights, stats):
             return False
-    #στήλη
-    for row in ROWS:
-        if row != r and sol.get((row,c)) == value:
-            return False
-    # μικρό τετράγωνο 2x2
-    box_rows = ['1','2'] if r in ['1','2'] else ['3','4']
-    box_cols = ['a','b'] if c in ['a','b'] else ['c','d']
-    for br in box_rows:
-        for bc in box_cols:
-            if (br,bc) != var and sol.get((br,bc)) == value:
+        changed = False
+        for rule in RULES[level]:
+            r = rule(g, domains, unassigned, trail, weights)
+            if r is None:
                 return False
-    return True
+            if r:
+                changed = True
+                break                       # ξανά από τους φθηνότερους κανόνες
+        if not changed:
+            return True
 
-#---------- MAC Helper Functions ----------
-def revise(X, Y, domains):
-    """Ελέγχει αν το domain της X μπορεί να παραμείνει συνεπές με το Y"""
-    revised = False
-    to_remove = []
-    for x_val in domains[X]:
-        #Υπάρχει έστω μία τιμή y στο domain του Y που δεν παραβιάζει τον περιορισμό;
-        if not any(consistent({X: x_val, Y: y_val}, X, x_val) and consistent({X: x_val, Y: y_val}, Y, y_val)
-                   for y_val in domains[Y]):
-            to_remove.append(x_val)
-            revised = True
-    for val in to_remove:
-        domains[X].remove(val)
-    return revised
-
-def ac3(domains, unassigned):
-    """Διατηρεί arc-consistency σε όλα τα ζεύγη μεταβλητών"""
-    queue = deque()
-    for var1 in unassigned:
-        for var2 in unassigned:
-            if var1 != var2 and (var1[0]==var2[0] or var1[1]==var2[1] or same_box(var1,var2)):
-                queue.append((var1,var2))
-    while queue:
-        X, Y = queue.popleft()
-        if revise(X, Y, domains):
-            if not domains[X]:
-                return False
-            for Z in unassigned:
-                if Z != X and (X[0]==Z[0] or X[1]==Z[1] or same_box(X,Z)):
-                    queue.append((Z,X))
-    return True
-
-def same_box(var1, var2):
-    """Ελέγχει αν δύο κελιά ανήκουν στο ίδιο τετράγωνο 2x2"""
-    r1, c1 = var1
-    r2, c2 = var2
-    box_rows1 = ['1','2'] if r1 in ['1','2'] else ['3','4']
-    box_cols1 = ['a','b'] if c1 in ['a','b'] else ['c','d']
-    return r2 in box_rows1 and c2 in box_cols1
+#---------- Σειρά μεταβλητών και τιμών ----------
+class Restart(Exception):
+    """Το όριο αποτυχιών του τρέχοντος restart εξαντλήθηκε"""
 
-#---------- MAC Search ----------
-solutions = []
-tree_nodes = 0
-solution_leaves = 0
-failure_leaves = 0
+class Ordering:
+    """Επιλογή κελιού και σειρά τιμών για το mac_search:
+    dom/wdeg (|domain| / (1 + αποτυχίες των περιορισμών με μη ανατεθειμένους γείτονες) —
+    χωρίς αποτυχίες είναι ακριβώς MRV, γιατί στο Sudoku όλα τα κελιά έχουν ίδιο βαθμό),
+    LCV (πρώτα η τιμή που αφαιρεί τις λιγότερες τιμές από γείτονες), τυχαίο σπάσιμο
+    ισοπαλιών με rng και όριο αποτυχιών fail_limit που προκαλεί Restart."""
+    def __init__(self, wdeg=True, lcv=False, rng=None, fail_limit=None):
+        self.weights = {} if wdeg else None
+        self.lcv = lcv
+        self.rng = rng
+        self.fail_limit = fail_limit
+        self.failures = 0
+
+    def select(self, g, unassigned, domains):
+        weights, rng = self.weights, self.rng
+        best, var = None, None
+        for v in unassigned:
+            score = len(domains[v])
+            if weights:
+                w = 1
+                for p in g.peers[v]:
+                    if p in unassigned:
+                        w += weights.get((v, p) if v < p else (p, v), 0)
+                score /= w
+            key = (score, rng.random()) if rng is not None else (score, v)
+            if best is None or key < best:
+                best, var = key, v
+        return var
 
-def mac_search(sol, unassigned, domains):
-    global tree_nodes, solution_leaves, failure_leaves
+    def values(self, g, var, domains, unassigned):
+        if not self.lcv:
+            return list(domains[var])
+        peers = [domains[p] for p in g.peers[var] if p in unassigned]
+        return sorted(domains[var], key=lambda value: sum(value in d for d in peers))
+
+    def conflict(self, g, sol, var, value):
+        """Η τιμή συγκρούεται με ανατεθειμένο γείτονα: βάρος στον περιορισμό και αποτυχία"""
+        for p in g.peers[var]:
+            if sol.get(p) == value:
+                bump(self.weights, var, p)
+                break
+        self.fail()
+
+    def fail(self):
+        self.failures += 1
+        if self.fail_limit is not None and self.failures > self.fail_limit:
+            raise Restart()
+
+#---------- MAC Search ----------
+# Τα στατιστικά γράφονται στο stats (ένας MacSolver): tree_nodes, solution_leaves,
+# failure_leaves, wipeouts (αναθέσεις που απορρίφθηκαν επειδή η διάδοση άδειασε κάποιο
+# domain) και arcs_processed.
+def mac_search_iter(stats, g, sol, unassigned, domains, trail=None, level="ac3", ordering=None):
+    """MAC με trail ως γεννήτρια: δίνει κάθε λύση μόλις βρεθεί (το ίδιο το dict sol,
+    οπότε όποιος θέλει να την κρατήσει παίρνει αντίγραφο). Τα domains αλλάζουν επί τόπου
+    και επαναφέρονται στο backtrack, και όταν η γεννήτρια κλείσει νωρίς.
+    Το level (βλ. LEVELS) ορίζει πόσο ισχυρή διάδοση γίνεται μετά από κάθε ανάθεση και
+    το ordering (Ordering ή None για απλό MRV) τη σειρά κελιών και τιμών."""
+    weights = ordering.weights if ordering is not None else None
+    if trail is None:
+        trail = []
+        try:
+            # στη ρίζα διαδίδονται και οι δοσμένες τιμές (το "ac3" μένει όπως ήταν)
+            if level == "ac3" or propagate(g, domains, unassigned, trail, level, weights, stats):
+                yield from mac_search_iter(stats, g, sol, unassigned, domains, trail, level, ordering)
+            else:
+                stats.wipeouts += 1
+        finally:
+            undo(domains, trail, 0)
+        return
 
     if not unassigned:
         # βρήκαμε λύση
-        solutions.append(sol.copy())
-        solution_leaves += 1
-        tree_nodes += 1
-        return True
+        stats.solution_leaves += 1
+        stats.tree_nodes += 1
+        yield sol
+        return
 
-    #διάλεξε μεταβλητή με MRV heuristic
-    var = min(unassigned, key=lambda v: len(domains[v]))
+    #διάλεξε μεταβλητή με MRV heuristic (ή dom/wdeg)
+    if ordering is None:
+        var = min(unassigned, key=lambda v: len(domains[v]))
+        values = list(domains[var])
+    else:
+        var = ordering.select(g, unassigned, domains)
+        values = ordering.values(g, var, domains, unassigned)
     remaining = unassigned - {var}
-    tree_nodes += 1
+    stats.tree_nodes += 1
 
-    for value in domains[var]:
-        if consistent(sol, var, value):
+    for value in values:
+        if consistent(g, sol, var, value):
             sol[var] = value
-            new_domains = copy.deepcopy(domains)
-            new_domains[var] = [value]
+            mark = len(trail)
+            try:
+                for other in list(domains[var]):
+                    if other != value:
+                        remove_value(domains, var, other, trail)
+
+                # Εφαρμογή MAC
+                if propagate(g, domains, remaining, trail, level, weights, stats):
+                    yield from mac_search_iter(stats, g, sol, remaining, domains, trail, level, ordering)
+                else:
+                    stats.wipeouts += 1
+                    if ordering is not None: ordering.fail()
+            finally:
+                undo(domains, trail, mark)
+                sol.pop(var)
+        else:
+            stats.failure_leaves += 1
+            if ordering is not None: ordering.conflict(g, sol, var, value)
+
+class MacSolver(Solver):
+    """MAC με επίπεδο διάδοσης level· με wdeg/lcv η σειρά κελιών και τιμών γίνεται με Ordering"""
+    counters = Solver.counters + ("wipeouts", "arcs_processed")
+
+    def __init__(self, level="ac3", wdeg=False, lcv=False):
+        super().__init__()
+        self.level, self.wdeg, self.lcv = level, wdeg, lcv
+
+    def solutions_of(self, g, initial):
+        ordering = Ordering(self.wdeg, self.lcv) if self.wdeg or self.lcv else None
+        return mac_search_iter(self, g, initial.copy(), set(g.cells) - set(initial), initial_domains(g, initial),
+                               level=self.level, ordering=ordering)
+
+#---------- Restarts ----------
+def luby(i):
+    """Η ακολουθία Luby 1, 1, 2, 1, 1, 2, 4, 1, ... (i από 1)"""
+    k = 1
+    while (1 << k) - 1 < i:
+        k += 1
+    while (1 << k) - 1 != i:
+        i -= (1 << (k - 1)) - 1
+        k = 1
+        while (1 << k) - 1 < i:
+            k += 1
+    return 1 << (k - 1)
+
+def mac_restart_iter(stats, g, initial, level="subsets", base=50, seed=0, lcv=True):
+    """Πρώτη λύση με dom/wdeg, LCV και τυχαίες restarts: το restart i σταματά μετά από
+    base·luby(i) αποτυχίες, ενώ τα βάρη κρατιούνται από restart σε restart. Δίνει το πολύ
+    μία λύση (μετά από restart θα ξαναβρίσκονταν οι ίδιες)."""
+    ordering = Ordering(wdeg=True, lcv=lcv, rng=random.Random(seed))
+    unassigned = set(g.cells) - set(initial)
+    for i in itertools.count(1):
+        ordering.failures = 0
+        ordering.fail_limit = base * luby(i)
+        try:
+            for sol in mac_search_iter(stats, g, initial.copy(), set(unassigned), initial_domains(g, initial),
+                                       level=level, ordering=ordering):
+                yield sol
+                return
+            return                          # όλο το δέντρο εξαντλήθηκε μέσα στο όριο: καμία λύση
+        except Restart:
+            stats.restarts += 1
+
+class MacRestartSolver(Solver):
+    """Πρώτη λύση με dom/wdeg, LCV και restarts (βλ. mac_restart_iter)"""
+    counters = MacSolver.counters + ("restarts",)
+
+    def __init__(self, level="subsets", base=50, seed=0, lcv=True):
+        super().__init__()
+        self.level, self.base, self.seed, self.lcv = level, base, seed, lcv
+
+    def solutions_of(self, g, initial):
+        return mac_restart_iter(self, g, initial, self.level, self.base, self.seed, self.lcv)
+
+#---------- Backjumping και nogoods ----------
+# Κάθε αφαίρεση τιμής κρατά την αιτία της ως bitset επιπέδων απόφασης (bit L = ανάθεση
+# του επιπέδου L). Η διάδοση είναι η arc-consistency του != (η τιμή ενός κελιού με μία
+# τιμή φεύγει από τους γείτονες) και η αιτία της αφαίρεσης είναι οι αιτίες που άφησαν το
+# κελί με μία τιμή. Όταν αδειάσει ένα domain, η ένωση των αιτιών του είναι το conflict set
+# και η αναζήτηση γυρίζει κατευθείαν στο βαθύτερο επίπεδο του. Το -1 σημαίνει "όλα τα
+# επίπεδα" (βρέθηκε λύση από κάτω, οπότε δεν επιτρέπεται άλμα ούτε μάθηση).
+NOGOOD_LIMIT = 10000        # μέγιστο πλήθος nogoods στη μνήμη (LRU εκδίωξη)
+NOGOOD_MAX_SIZE = 8         # μεγαλύτερα conflict sets δεν αποθηκεύονται
+
+class NogoodStore:
+    """Φραγμένη αποθήκη nogoods: συνόλων αναθέσεων (κελί, τιμή) που δεν συνυπάρχουν σε λύση"""
+    def __init__(self, limit=NOGOOD_LIMIT):
+        self.limit = limit
+        self.nogoods = OrderedDict()        # frozenset -> None, με σειρά χρήσης
+        self.by_literal = {}                # (κελί, τιμή) -> nogoods που την περιέχουν
+        self.hits = 0
+
+    def add(self, nogood):
+        if nogood in self.nogoods:
+            self.nogoods.move_to_end(nogood)
+            return
+        self.nogoods[nogood] = None
+        for lit in nogood:
+            self.by_literal.setdefault(lit, set()).add(nogood)
+        while len(self.nogoods) > self.limit:
+            old, _ = self.nogoods.popitem(last=False)
+            for lit in old:
+                ngs = self.by_literal[lit]
+                ngs.discard(old)
+                if not ngs:
+                    del self.by_literal[lit]
+
+    def violated(self, sol, var, value):
+        """Ένα nogood που θα ικανοποιούνταν πλήρως με την ανάθεση var=value (ή None)"""
+        for ng in self.by_literal.get((var, value), ()):
+            if all(sol.get(v) == x for v, x in ng if v != var):
+                self.nogoods.move_to_end(ng)
+                self.hits += 1
+                return ng
+        return None
 
-            # Εφαρμογή MAC
-            if ac3(new_domains, remaining):
-                mac_search(sol, remaining, new_domains)
+def reason(expl, var):
+    r = 0
+    for why in expl[var].values():
+        r |= why
+    return r
 
+def remove_because(domains, expl, var, value, why, trail):
+    remove_value(domains, var, value, trail)
+    expl[var][value] = why
+
+def undo_because(domains, expl, trail, mark):
+    while len(trail) > mark:
+        var, i, value = trail.pop()
+        domains[var].insert(i, value)
+        del expl[var][value]
+
+def propagate_because(g, domains, expl, unassigned, trail, queue):
+    """Διάδοση των κελιών του queue (με μία τιμή) στους μη ανατεθειμένους γείτονες.
+    Επιστρέφει None ή το conflict set του κελιού που άδειασε."""
+    while queue:
+        x = queue.pop()
+        v = domains[x][0]
+        why = reason(expl, x)
+        for p in g.peers[x]:
+            if p in unassigned and v in domains[p]:
+                remove_because(domains, expl, p, v, why, trail)
+                if not domains[p]:
+                    return reason(expl, p)
+                if len(domains[p]) == 1:
+                    queue.append(p)
+    return None
+
+def cbj_search(stats, g, sol, unassigned, domains, expl, trail, decisions, level_of, store, backjump=True):
+    """MAC με conflict-directed backjumping. Γεννήτρια λύσεων που επιστρέφει (return)
+    το conflict set του υποδέντρου. Το stats.backjumps μετρά τα επίπεδα που παρακάμφθηκαν."""
+    if not unassigned:
+        stats.solution_leaves += 1
+        stats.tree_nodes += 1
+        yield sol
+        return -1
+
+    var = min(unassigned, key=lambda v: len(domains[v]))
+    remaining = unassigned - {var}
+    stats.tree_nodes += 1
+    level = len(decisions)
+    me = 1 << level
+    conflict = 0
+
+    for value in list(domains[var]):
+        ng = store.violated(sol, var, value) if store is not None else None
+        if ng is not None:
+            #φύλλο αποτυχίας: η ανάθεση ολοκληρώνει ένα γνωστό nogood
+            stats.failure_leaves += 1
+            for v, _ in ng:
+                if v != var:
+                    conflict |= 1 << level_of[v]
+            continue
+        sol[var] = value
+        level_of[var] = level
+        decisions.append((var, value))
+        mark = len(trail)
+        try:
+            for other in list(domains[var]):
+                if other != value:
+                    remove_because(domains, expl, var, other, me, trail)
+            child = propagate_because(g, domains, expl, remaining, trail, [var])
+            if child is not None:
+                stats.wipeouts += 1
+            else:
+                child = yield from cbj_search(stats, g, sol, remaining, domains, expl, trail,
+                                              decisions, level_of, store, backjump)
+        finally:
+            undo_because(domains, expl, trail, mark)
+            decisions.pop()
+            del level_of[var]
             sol.pop(var)
+        if backjump and not child & me:
+            # η σύγκρουση δεν αφορά αυτή την ανάθεση: άλμα πάνω από τις υπόλοιπες τιμές
+            stats.backjumps += 1
+            return child
+        conflict |= child & ~me
+
+    if conflict < 0:
+        return -1
+    # εξαντλήθηκαν οι τιμές: φταίνε και όσες είχαν ήδη αφαιρεθεί από το domain της var
+    conflict |= reason(expl, var)
+    if store is not None and 0 < conflict.bit_count() <= NOGOOD_MAX_SIZE:
+        store.add(frozenset(decisions[L] for L in range(level) if conflict >> L & 1))
+    return conflict
+
+def mac_cbj_iter(stats, g, sol, unassigned, domains, nogoods=NOGOOD_LIMIT, backjump=True):
+    """Λύσεις με MAC + backjumping + nogoods (nogoods=0: χωρίς μάθηση,
+    backjump=False: χρονολογικό backtracking με την ίδια διάδοση)"""
+    expl = {v: {} for v in g.cells}
+    trail = []
+    store = NogoodStore(nogoods) if nogoods else None
+    try:
+        # οι δοσμένες τιμές διαδίδονται χωρίς αιτία (επίπεδο "πριν από κάθε απόφαση")
+        if propagate_because(g, domains, expl, unassigned, trail,
+                             [v for v in g.cells if v not in unassigned and len(domains[v]) == 1]) is None:
+            yield from cbj_search(stats, g, sol, unassigned, domains, expl, trail, [], {}, store, backjump)
         else:
-            failure_leaves += 1
+            stats.wipeouts += 1
+    finally:
+        undo_because(domains, expl, trail, 0)
+
+class MacCbjSolver(Solver):
+    """MAC με conflict-directed backjumping και nogoods (βλ. mac_cbj_iter)"""
+    counters = MacSolver.counters + ("backjumps",)
+
+    def __init__(self, nogoods=NOGOOD_LIMIT, backjump=True):
+        super().__init__()
+        self.nogoods, self.backjump = nogoods, backjump
+
+    def solutions_of(self, g, initial):
+        return mac_cbj_iter(self, g, initial.copy(), set(g.cells) - set(initial), initial_domains(g, initial),
+                            self.nogoods, self.backjump)
 
 #---------- Εκτέλεση ----------
-all_vars = set(domain.keys())
-assigned_vars = set(initial.keys())
-unassigned_vars = all_vars - assigned_vars
-solution_dict = initial.copy()
-
-mac_search(solution_dict, unassigned_vars, domain)
-
-#---------- Εκτύπωση Αποτελεσμάτων ----------
-print("\nΑΠΟΤΕΛΕΣΜΑΤΑ SUDOKU 4x4 ΜΕ MAC")
-print("--------------------------------------------------")
-for sol in solutions:
-    full_sol = {(r,c): sol.get((r,c), '0') for r in ROWS for c in COLS}
-    for r in reversed(ROWS):  # από κάτω προς τα πάνω
-        print(' '.join(full_sol[(r,c)] for c in COLS))
-    print('')  # κενή γραμμή μεταξύ λύσεων
-
-print("Στατιστικά δέντρου αναζήτησης:")
-print(f"Συνολικοί κόμβοι: {tree_nodes}")
-print(f"Φύλλα λύσης: {solution_leaves}, Φύλλα αποτυχίας: {failure_leaves}")
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="MAC (ac3 + κανόνες Sudoku) με backtracking ή CBJ")
+    parser.add_argument("puzzle", nargs="?", default=INITIAL, help="puzzle μίας γραμμής (81/256 χαρακτήρες)")
+    parser.add_argument("level", nargs="?", default="ac3", choices=list(RULES) + ["cbj"],
+                        help="επίπεδο διάδοσης ή cbj (conflict-directed backjumping)")
+    args = parser.parse_args()
+    level = args.level
+    try:
+        g, initial = parse(args.puzzle)
+    except ValueError as e:
+        parser.error(str(e))
+    solver = MacCbjSolver() if level == "cbj" else MacSolver(level)
+    solutions = solver.solve((g, initial))
+
+    #---------- Εκτύπωση Αποτελεσμάτων ----------
+    solver.report(f"MAC ({level})", g, solutions)
+    print(f"Αποτυχίες διάδοσης: {solver.wipeouts}")
\ No newline at end of file
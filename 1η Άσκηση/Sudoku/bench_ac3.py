@@ -0,0 +1,86 @@
+import argparse, os, time
+from collections import deque
+
+import MacForSudoku
+from MacForSudoku import remove_value
+from sudoku_grid import parse, consistent
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+#---------- Προηγούμενο ac3 (σάρωση O(n²) και revise μέσω consistent) για σύγκριση ----------
+old_arcs = 0
+
+def old_revise(g, X, Y, domains, trail):
+    revised = False
+    to_remove = []
+    for x_val in domains[X]:
+        if not any(consistent(g, {X: x_val, Y: y_val}, X, x_val) and consistent(g, {X: x_val, Y: y_val}, Y, y_val)
+                   for y_val in domains[Y]):
+            to_remove.append(x_val)
+            revised = True
+    for val in to_remove:
+        remove_value(domains, X, val, trail)
+    return revised
+
+def old_ac3(g, domains, unassigned, trail, weights=None, stats=None):
+    global old_arcs
+    queue = deque()
+    for var1 in unassigned:
+        for var2 in unassigned:
+            if var1 != var2 and var2 in g.peer_sets[var1]:
+                queue.append((var1,var2))
+    while queue:
+        X, Y = queue.popleft()
+        old_arcs += 1
+        if old_revise(g, X, Y, domains, trail):
+            if not domains[X]:
+                return False
+            for Z in unassigned:
+                if Z != X and Z in g.peer_sets[X]:
+                    queue.append((Z,X))
+    return True
+
+#---------- Μέτρηση ----------
+def run(g, initial, ac3, level="subsets"):
+    """mac_search με το δοσμένο ac3 -> (τόξα, χρόνος, κόμβοι)"""
+    global old_arcs
+    old_arcs = 0
+    solver = MacForSudoku.MacSolver(level)
+    saved = MacForSudoku.ac3
+    MacForSudoku.ac3 = ac3
+    try:
+        t0 = time.perf_counter()
+        solver.solve((g, initial))
+        elapsed = time.perf_counter() - t0
+    finally:
+        MacForSudoku.ac3 = saved
+    arcs = old_arcs if ac3 is old_ac3 else solver.arcs_processed
+    return arcs, elapsed, solver.tree_nodes
+
+#---------- Εκτέλεση ----------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Τόξα και χρόνος ανά puzzle: προηγούμενο ac3 vs γράφος περιορισμών")
+    parser.add_argument("corpus", nargs="?", default=os.path.join(HERE, "corpus", "9x9_36.txt"))
+    parser.add_argument("--limit", type=int, default=0)
+    # στο "ac3" τα τόξα είναι μόνο μεταξύ μη ανατεθειμένων κελιών και το revise δεν κλαδεύει
+    # ποτέ (άρα ούτε ξαναμπαίνουν τόξα)· οι κανόνες του "subsets" αφήνουν μονοσύνολα domains
+    # και το revise κλαδεύει, οπότε φαίνεται η ουρά χωρίς διπλά τόξα
+    parser.add_argument("--level", default="subsets", choices=MacForSudoku.LEVELS)
+    args = parser.parse_args()
+    with open(args.corpus) as f:
+        puzzles = [parse(line) for line in f if line.strip()]
+    if args.limit:
+        puzzles = puzzles[:args.limit]
+
+    print(f"\nAC-3: {len(puzzles)} puzzles ({os.path.basename(args.corpus)}, {args.level})")
+    print("--------------------------------------------------")
+    print(f"{'#':>3} {'κόμβοι':>7} {'τόξα (πριν)':>12} {'τόξα (τώρα)':>12} {'s (πριν)':>9} {'s (τώρα)':>9}")
+    totals = [0, 0, 0.0, 0.0]
+    for k, (g, initial) in enumerate(puzzles, 1):
+        a_old, t_old, nodes = run(g, initial, old_ac3, args.level)
+        a_new, t_new, nodes_new = run(g, initial, MacForSudoku.ac3, args.level)
+        assert nodes == nodes_new, "different search trees"
+        print(f"{k:>3} {nodes:>7} {a_old:>12} {a_new:>12} {t_old:>9.3f} {t_new:>9.3f}")
+        for i, v in enumerate((a_old, a_new, t_old, t_new)):
+            totals[i] += v
+    print(f"{'Σ':>3} {'':>7} {totals[0]:>12} {totals[1]:>12} {totals[2]:>9.3f} {totals[3]:>9.3f}")
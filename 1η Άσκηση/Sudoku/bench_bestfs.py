@@ -0,0 +1,75 @@
+import argparse, heapq, itertools, os, time, tracemalloc
+
+import sudokuBestFs
+from sudoku_grid import parse, initial_domains, consistent, to_line
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+#---------- Προηγούμενο best_first_search (dict + set ανά παιδί, h = κενά κελιά) για σύγκριση ----------
+def old_best_first(g, initial, domain, max_nodes=0):
+    """Με max_nodes σταματά εκεί και επιστρέφει found = None (τα 9x9 hard θέλουν ~10⁶ κόμβους)"""
+    counter = itertools.count()
+    pq = []
+    unassigned_vars = set(domain.keys()) - set(initial.keys())
+    heapq.heappush(pq, (len(unassigned_vars), next(counter), initial.copy(), unassigned_vars))
+    nodes = 0
+    found = []
+    while pq:
+        h, _, sol, unassigned = heapq.heappop(pq)
+        nodes += 1
+        if max_nodes and nodes >= max_nodes:
+            return nodes, None
+        if not unassigned:
+            found.append(sol.copy())
+            continue
+        var = min(unassigned, key=lambda v: len(domain[v]))
+        remaining = unassigned - {var}
+        for value in domain[var]:
+            if consistent(g, sol, var, value):
+                new_sol = sol.copy()
+                new_sol[var] = value
+                heapq.heappush(pq, (len(remaining), next(counter), new_sol, remaining))
+    return nodes, found
+
+def new_best_first(g, initial, domain, max_nodes=0):
+    solver = sudokuBestFs.BestFirstSolver()
+    found = solver.solve((g, initial))
+    return solver.tree_nodes, found
+
+#---------- Μέτρηση ----------
+def measure(search, g, initial, max_nodes=0):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    nodes, found = search(g, initial, initial_domains(g, initial), max_nodes)
+    elapsed = time.perf_counter() - t0
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return nodes, peak, elapsed, found and sorted(to_line(g, s) for s in found)
+
+#---------- Εκτέλεση ----------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Κόμβοι, peak μνήμη και χρόνος του best_first_search: πριν και τώρα")
+    parser.add_argument("corpus", nargs="*", default=[os.path.join(HERE, "corpus", name)
+                        for name in ("9x9_36.txt", "9x9_hard.txt", "16x16_120.txt")])
+    parser.add_argument("--limit", type=int, default=0, help="μόνο τα πρώτα N puzzles κάθε αρχείου")
+    parser.add_argument("--old-max-nodes", type=int, default=100000,
+                        help="όριο κόμβων της παλιάς εκδοχής (0 = χωρίς όριο)· οι κομμένες γραμμές έχουν '>'")
+    args = parser.parse_args()
+
+    for path in args.corpus:
+        with open(path) as f:
+            puzzles = [parse(line) for line in f if line.strip()]
+        if args.limit:
+            puzzles = puzzles[:args.limit]
+
+        print(f"\nBEST-FIRST: {len(puzzles)} puzzles ({os.path.basename(path)}, tracemalloc peak)")
+        print("--------------------------------------------------")
+        print(f"{'#':>3} {'κόμβοι (πριν)':>14} {'κόμβοι (τώρα)':>14} {'KB (πριν)':>10} {'KB (τώρα)':>10} {'s (πριν)':>9} {'s (τώρα)':>9}")
+        for k, (g, initial) in enumerate(puzzles, 1):
+            n_old, m_old, t_old, s_old = measure(old_best_first, g, initial, args.old_max_nodes)
+            n_new, m_new, t_new, s_new = measure(new_best_first, g, initial)
+            # κομμένη παλιά αναζήτηση: κόμβοι, μνήμη και χρόνος είναι κάτω όρια
+            cut = ">" if s_old is None else ""
+            assert s_old is None or s_old == s_new, "different solutions"
+            print(f"{k:>3} {cut + str(n_old):>14} {n_new:>14} {cut + f'{m_old/1024:.1f}':>10} {m_new/1024:>10.1f} "
+                  f"{cut + f'{t_old:.3f}':>9} {t_new:>9.3f}")
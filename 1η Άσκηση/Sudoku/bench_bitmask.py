@@ -0,0 +1,46 @@
+import argparse, os, time
+
+import MacForSudoku, sudokuForwardSimpleSearch, sudokuBitmask
+from sudoku_grid import parse, to_line
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+#---------- Engines ----------
+ENGINES = {
+    "forward_checking": sudokuForwardSimpleSearch.ForwardCheckingSolver,
+    "mac_search":       MacForSudoku.MacSolver,
+    "bitmask_search":   sudokuBitmask.BitmaskSolver,
+}
+
+#---------- Εκτέλεση ----------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bitmask search έναντι forward_checking και mac_search")
+    parser.add_argument("corpus", nargs="?", default=os.path.join(HERE, "corpus", "9x9_36.txt"))
+    parser.add_argument("--limit", type=int, default=0, help="μόνο τα πρώτα N puzzles")
+    parser.add_argument("--engines", nargs="+", default=list(ENGINES), choices=list(ENGINES))
+    args = parser.parse_args()
+    with open(args.corpus) as f:
+        puzzles = [parse(line) for line in f if line.strip()]
+    if args.limit:
+        puzzles = puzzles[:args.limit]
+
+    print(f"\nBENCHMARK {len(puzzles)} puzzles ({os.path.basename(args.corpus)})")
+    print("--------------------------------------------------")
+    print(f"{'engine':<18} {'κόμβοι':>10} {'αποτυχίες':>10} {'χρόνος(s)':>10} {'ms/puzzle':>10}")
+    reference = None
+    for name in args.engines:
+        solver = ENGINES[name]()
+        nodes = fails = 0
+        found = []
+        t0 = time.perf_counter()
+        for g, initial in puzzles:
+            solutions = solver.solve((g, initial))
+            nodes += solver.tree_nodes
+            fails += solver.failure_leaves
+            found.append(sorted(to_line(g, s) for s in solutions))
+        elapsed = time.perf_counter() - t0
+        if reference is None:
+            reference = found
+        elif found != reference:
+            print(f"! {name}: διαφορετικές λύσεις από {args.engines[0]}")
+        print(f"{name:<18} {nodes:>10} {fails:>10} {elapsed:>10.3f} {elapsed/len(puzzles)*1000:>10.1f}")
@@ -0,0 +1,52 @@
+import argparse, os, time
+
+import MacForSudoku
+from sudoku_grid import parse, to_line
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+#---------- Παραλλαγές ----------
+# ίδια διάδοση (arc-consistency του !=) σε όλες, ώστε η διαφορά να είναι μόνο το άλμα και η μάθηση
+VARIANTS = {
+    "chronological": dict(backjump=False, nogoods=0),
+    "backjumping":   dict(backjump=True, nogoods=0),
+    "cbj+nogoods":   dict(backjump=True, nogoods=MacForSudoku.NOGOOD_LIMIT),
+}
+
+def run(g, initial, options):
+    solver = MacForSudoku.MacCbjSolver(**options)
+    t0 = time.perf_counter()
+    solutions = solver.solve((g, initial))
+    elapsed = time.perf_counter() - t0
+    return (solver.tree_nodes, solver.failure_leaves + solver.wipeouts, solver.backjumps,
+            elapsed, sorted(to_line(g, s) for s in solutions))
+
+#---------- Εκτέλεση ----------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="MAC με/χωρίς conflict-directed backjumping και nogoods")
+    parser.add_argument("corpus", nargs="?", default=os.path.join(HERE, "corpus", "16x16_115_s1.txt"))
+    parser.add_argument("--limit", type=int, default=0, help="μόνο τα πρώτα N puzzles")
+    parser.add_argument("--variants", nargs="+", default=list(VARIANTS), choices=list(VARIANTS))
+    args = parser.parse_args()
+    with open(args.corpus) as f:
+        puzzles = [parse(line) for line in f if line.strip()]
+    if args.limit:
+        puzzles = puzzles[:args.limit]
+
+    print(f"\nBACKJUMPING: {len(puzzles)} puzzles ({os.path.basename(args.corpus)})")
+    print("--------------------------------------------------")
+    print(f"{'παραλλαγή':<14} {'κόμβοι':>9} {'αποτυχίες':>10} {'άλματα':>8} {'χρόνος(s)':>10}")
+    reference = None
+    for name in args.variants:
+        nodes = fails = jumps = 0
+        elapsed = 0.0
+        found = []
+        for g, initial in puzzles:
+            n, f, j, t, sols = run(g, initial, VARIANTS[name])
+            nodes += n; fails += f; jumps += j; elapsed += t
+            found.append(sols)
+        if reference is None:
+            reference = found
+        elif found != reference:
+            print(f"! {name}: διαφορετικές λύσεις από {args.variants[0]}")
+        print(f"{name:<14} {nodes:>9} {fails:>10} {jumps:>8} {elapsed:>10.3f}")
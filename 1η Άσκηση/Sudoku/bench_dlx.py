@@ -0,0 +1,44 @@
+import argparse, os, time
+
+import MacForSudoku, sudokuDLX
+from sudoku_grid import parse, to_line
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+CORPORA = [os.path.join(HERE, "corpus", name) for name in ("9x9_36.txt", "9x9_hard.txt", "16x16_120.txt")]
+
+#---------- Engines ----------
+ENGINES = {"mac_search": MacForSudoku.MacSolver, "dlx_search": lambda level: sudokuDLX.DLXSolver()}
+
+#---------- Εκτέλεση ----------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Dancing Links έναντι mac_search σε 9x9 και 16x16")
+    parser.add_argument("corpora", nargs="*", default=CORPORA)
+    parser.add_argument("--limit", type=int, default=0, help="μόνο τα πρώτα N puzzles κάθε αρχείου")
+    parser.add_argument("--level", default="subsets", choices=MacForSudoku.LEVELS, help="διάδοση του mac_search")
+    args = parser.parse_args()
+
+    print(f"\nDANCING LINKS vs MAC ({args.level})")
+    print("--------------------------------------------------")
+    print(f"{'corpus':<15} {'engine':<11} {'κόμβοι':>8} {'αποτυχίες':>10} {'χρόνος(s)':>10} {'ms/puzzle':>10}")
+    for path in args.corpora:
+        with open(path) as f:
+            puzzles = [parse(line) for line in f if line.strip()]
+        if args.limit:
+            puzzles = puzzles[:args.limit]
+        reference = None
+        for name, make in ENGINES.items():
+            solver = make(args.level)
+            nodes = fails = 0
+            found = []
+            t0 = time.perf_counter()
+            for g, initial in puzzles:
+                solutions = solver.solve((g, initial))
+                nodes += solver.tree_nodes
+                fails += solver.failure_leaves
+                found.append(sorted(to_line(g, s) for s in solutions))
+            elapsed = time.perf_counter() - t0
+            if reference is None:
+                reference = found
+            elif found != reference:
+                print(f"! {name}: διαφορετικές λύσεις από mac_search")
+            print(f"{os.path.basename(path):<15} {name:<11} {nodes:>8} {fails:>10} {elapsed:>10.3f} {elapsed/len(puzzles)*1000:>10.1f}")
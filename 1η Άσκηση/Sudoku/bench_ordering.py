@@ -0,0 +1,51 @@
+import argparse, os, time
+
+import MacForSudoku
+from sudoku_grid import parse
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+#---------- Παραλλαγές ----------
+# Όλες βρίσκουν την πρώτη λύση με την ίδια διάδοση· μετράει η χειρότερη περίπτωση, όχι ο μέσος όρος.
+VARIANTS = {
+    "mrv":               lambda level: MacForSudoku.MacSolver(level),
+    "dom/wdeg":          lambda level: MacForSudoku.MacSolver(level, wdeg=True),
+    "dom/wdeg+lcv":      lambda level: MacForSudoku.MacSolver(level, wdeg=True, lcv=True),
+    "dom/wdeg+restarts": lambda level: MacForSudoku.MacRestartSolver(level),
+}
+
+def percentile(times, p):
+    times = sorted(times)
+    return times[min(len(times) - 1, int(p * len(times)))]
+
+#---------- Εκτέλεση ----------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Χειρότερος χρόνος πρώτης λύσης με MRV, dom/wdeg, LCV και restarts")
+    parser.add_argument("corpora", nargs="*", default=[os.path.join(HERE, "corpus", name)
+                                                       for name in ("9x9_hard.txt", "9x9_24_s1.txt", "16x16_115_s1.txt")])
+    parser.add_argument("--level", default="subsets", choices=MacForSudoku.LEVELS,
+                        help="το \"ac3\" δεν αφαιρεί τιμές ανατεθειμένων κελιών, οπότε η τυχαία σειρά του βλάπτει")
+    parser.add_argument("--limit", type=int, default=0, help="μόνο τα πρώτα N puzzles κάθε αρχείου")
+    parser.add_argument("--variants", nargs="+", default=list(VARIANTS), choices=list(VARIANTS))
+    args = parser.parse_args()
+
+    for path in args.corpora:
+        with open(path) as f:
+            puzzles = [parse(line) for line in f if line.strip()]
+        if args.limit:
+            puzzles = puzzles[:args.limit]
+        print(f"\nΣΕΙΡΑ ΜΕΤΑΒΛΗΤΩΝ: {len(puzzles)} puzzles ({os.path.basename(path)}, {args.level})")
+        print("--------------------------------------------------")
+        print(f"{'παραλλαγή':<18} {'κόμβοι':>9} {'restarts':>8} {'p50 ms':>9} {'p95 ms':>9} {'max ms':>9}")
+        for name in args.variants:
+            solver = VARIANTS[name](args.level)
+            nodes = restarts = 0
+            times = []
+            for g, initial in puzzles:
+                t0 = time.perf_counter()
+                if not solver.solve((g, initial), 1):
+                    print(f"! {name}: χωρίς λύση")
+                times.append((time.perf_counter() - t0) * 1000)
+                nodes += solver.tree_nodes; restarts += getattr(solver, "restarts", 0)
+            print(f"{name:<18} {nodes:>9} {restarts:>8} {percentile(times, 0.5):>9.1f} "
+                  f"{percentile(times, 0.95):>9.1f} {max(times):>9.1f}")
@@ -0,0 +1,46 @@
+import argparse, os, time
+
+import MacForSudoku
+from sudoku_grid import parse, to_line
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+#---------- Μέτρηση ----------
+def run(g, initial, level):
+    """mac_search με το δοσμένο επίπεδο διάδοσης -> (κόμβοι, αποτυχίες, wipeouts, χρόνος, λύσεις)"""
+    solver = MacForSudoku.MacSolver(level)
+    t0 = time.perf_counter()
+    solutions = solver.solve((g, initial))
+    elapsed = time.perf_counter() - t0
+    return (solver.tree_nodes, solver.failure_leaves, solver.wipeouts, elapsed,
+            sorted(to_line(g, s) for s in solutions))
+
+#---------- Εκτέλεση ----------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Κόμβοι, αποτυχίες και χρόνος του mac_search ανά επίπεδο διάδοσης")
+    parser.add_argument("corpus", nargs="?", default=os.path.join(HERE, "corpus", "9x9_36.txt"))
+    parser.add_argument("--limit", type=int, default=0, help="μόνο τα πρώτα N puzzles")
+    parser.add_argument("--levels", nargs="+", default=list(MacForSudoku.LEVELS), choices=MacForSudoku.LEVELS)
+    args = parser.parse_args()
+    with open(args.corpus) as f:
+        puzzles = [parse(line) for line in f if line.strip()]
+    if args.limit:
+        puzzles = puzzles[:args.limit]
+
+    print(f"\nΔΙΑΔΟΣΗ ΣΤΟ MAC: {len(puzzles)} puzzles ({os.path.basename(args.corpus)})")
+    print("--------------------------------------------------")
+    print(f"{'επίπεδο':<9} {'κόμβοι':>9} {'αποτυχίες':>10} {'wipeouts':>9} {'χρόνος(s)':>10} {'ms/puzzle':>10}")
+    reference = None
+    for level in args.levels:
+        nodes = fails = wipeouts = 0
+        elapsed = 0.0
+        found = []
+        for g, initial in puzzles:
+            n, f, w, t, sols = run(g, initial, level)
+            nodes += n; fails += f; wipeouts += w; elapsed += t
+            found.append(sols)
+        if reference is None:
+            reference = found
+        elif found != reference:
+            print(f"! {level}: διαφορετικές λύσεις από {args.levels[0]}")
+        print(f"{level:<9} {nodes:>9} {fails:>10} {wipeouts:>9} {elapsed:>10.3f} {elapsed/len(puzzles)*1000:>10.1f}")
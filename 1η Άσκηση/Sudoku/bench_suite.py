@@ -0,0 +1,103 @@
+import argparse, json, os, platform, sys, time, tracemalloc
+
+import sudoku_batch
+from sudoku_grid import parse, take_solutions
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+CORPORA = [os.path.join(HERE, "corpus", name) for name in ("9x9_30_s1.txt", "9x9_24_s1.txt", "16x16_130_s1.txt")]
+ENGINES = ["forward_checking", "mac_search", "best_first_search"]
+
+#---------- Μέτρηση ----------
+def run(engine, puzzles, max_solutions, trace=False):
+    """Λύνει όλα τα puzzles -> (κόμβοι, αποτυχίες, λυμένα, χρόνος, peak bytes ή None)"""
+    solver = sudoku_batch.ENGINES[engine](sudoku_batch.MAC_LEVEL)
+    nodes = fails = solved = 0
+    if trace:
+        tracemalloc.start()
+    t0 = time.perf_counter()
+    for g, initial in puzzles:
+        solver.reset()
+        if take_solutions(solver.solutions_of(g, initial), max_solutions, count_only=True):
+            solved += 1
+        nodes += solver.tree_nodes
+        fails += solver.failure_leaves
+    elapsed = time.perf_counter() - t0
+    peak = None
+    if trace:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return nodes, fails, solved, elapsed, peak
+
+def measure(engine, path, max_solutions, limit=0, repeat=3):
+    with open(path) as f:
+        puzzles = [parse(line) for line in f if line.strip()]
+    if limit:
+        puzzles = puzzles[:limit]
+    # ο χρόνος (ο καλύτερος από repeat) μετριέται χωρίς tracemalloc και η μνήμη σε χωριστό πέρασμα
+    nodes, fails, solved, elapsed, _ = min((run(engine, puzzles, max_solutions) for _ in range(repeat)),
+                                           key=lambda r: r[3])
+    _, _, _, _, peak = run(engine, puzzles, max_solutions, trace=True)
+    return {"corpus": os.path.basename(path), "engine": engine, "puzzles": len(puzzles), "solved": solved,
+            "tree_nodes": nodes, "failure_leaves": fails, "seconds": round(elapsed, 4),
+            "puzzles_per_sec": round(len(puzzles) / elapsed, 1), "peak_kb": round(peak / 1024, 1)}
+
+#---------- Όρια παλινδρόμησης ----------
+def regressions(results, baseline, tolerances):
+    """Σύγκριση με αποθηκευμένο αποτέλεσμα: κάθε μετρική πάνω από base·(1 + ανοχή) είναι παλινδρόμηση"""
+    base = {(r["corpus"], r["engine"]): r for r in baseline["results"]}
+    found = []
+    for r in results:
+        b = base.get((r["corpus"], r["engine"]))
+        if b is None or b["puzzles"] != r["puzzles"]:
+            continue
+        if r["solved"] < b["solved"]:
+            found.append(f"{r['corpus']} {r['engine']}: solved {r['solved']} < {b['solved']}")
+        for key, tol in tolerances.items():
+            if r[key] > b[key] * (1 + tol):
+                found.append(f"{r['corpus']} {r['engine']}: {key} {r[key]} > {b[key]} (+{tol:.0%})")
+    return found
+
+#---------- Εκτέλεση ----------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark των Sudoku engines σε corpora με αποτέλεσμα JSON")
+    parser.add_argument("corpora", nargs="*", default=CORPORA)
+    parser.add_argument("--engines", nargs="+", default=ENGINES, choices=list(sudoku_batch.ENGINES))
+    parser.add_argument("--level", default=sudoku_batch.MAC_LEVEL, help="διάδοση του mac_search")
+    parser.add_argument("--max-solutions", type=int, default=2, help="2 = έλεγχος μοναδικότητας")
+    parser.add_argument("--limit", type=int, default=0, help="μόνο τα πρώτα N puzzles κάθε αρχείου")
+    parser.add_argument("--repeat", type=int, default=3, help="επαναλήψεις για τον χρόνο (κρατιέται ο καλύτερος)")
+    parser.add_argument("-o", "--output", help="αποθήκευση του JSON (π.χ. ως νέο baseline)")
+    parser.add_argument("--baseline", help="JSON προηγούμενης εκτέλεσης για έλεγχο παλινδρόμησης")
+    parser.add_argument("--time-tolerance", type=float, default=0.5)
+    parser.add_argument("--memory-tolerance", type=float, default=0.25)
+    parser.add_argument("--nodes-tolerance", type=float, default=0.0)
+    args = parser.parse_args()
+    sudoku_batch.MAC_LEVEL = args.level
+
+    results = []
+    for path in args.corpora:
+        for engine in args.engines:
+            r = measure(engine, path, args.max_solutions, args.limit, args.repeat)
+            results.append(r)
+            print(f"{r['corpus']:<18} {engine:<18} {r['tree_nodes']:>9} κόμβοι {r['seconds']:>8.3f}s "
+                  f"{r['puzzles_per_sec']:>9.1f}/s {r['peak_kb']:>8.1f} KB", file=sys.stderr)
+    report = {"python": platform.python_version(), "level": args.level,
+              "max_solutions": args.max_solutions, "results": results}
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if (baseline["level"], baseline["max_solutions"]) != (args.level, args.max_solutions):
+            sys.exit(f"το baseline είναι για level={baseline['level']}, max_solutions={baseline['max_solutions']}")
+        found = regressions(results, baseline, {"seconds": args.time_tolerance, "peak_kb": args.memory_tolerance,
+                                                "tree_nodes": args.nodes_tolerance,
+                                                "failure_leaves": args.nodes_tolerance})
+        for line in found:
+            print(f"ΠΑΛΙΝΔΡΟΜΗΣΗ: {line}", file=sys.stderr)
+        sys.exit(1 if found else 0)
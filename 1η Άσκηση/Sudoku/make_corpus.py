@@ -0,0 +1,86 @@
+import argparse, os, random
+
+import sudokuBitmask
+from sudoku_grid import grid, to_line, take_solutions, bit, mask_values
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+#---------- Λυμένο πλέγμα ----------
+def solved_grid(g, rng):
+    """Τυχαία λύση: backtracking με MRV πάνω στα bitmasks του sudokuBitmask και τυχαία σειρά
+    τιμών σε κάθε κελί (οι μετασχηματισμοί ενός μοτίβου δίνουν πάντα ισομορφικά πλέγματα).
+    Μετά από 4·size κόμβους ξεκινά από την αρχή, γιατί λίγες κακές πρώτες τιμές κολλάνε
+    την αναζήτηση στα 25x25· οι επανεκκινήσεις παίρνουν τιμές από το ίδιο rng."""
+    row_of, col_of, box_of = g.row_of, g.col_of, g.box_of
+
+    def fill():
+        nonlocal budget
+        if not unassigned:
+            return True
+        budget -= 1
+        if budget < 0:
+            return False
+        var, cand, best = None, 0, g.n + 1
+        for v in unassigned:
+            m = domains[v] & ~(rows[row_of[v]] | cols[col_of[v]] | boxes[box_of[v]])
+            if m.bit_count() < best:
+                var, cand, best = v, m, m.bit_count()
+        r, c, bx = row_of[var], col_of[var], box_of[var]
+        unassigned.remove(var)
+        for value in rng.sample(list(mask_values(cand)), best):
+            b = bit(value)
+            sol[var] = value
+            rows[r] |= b; cols[c] |= b; boxes[bx] |= b
+            if fill():
+                return True
+            rows[r] ^= b; cols[c] ^= b; boxes[bx] ^= b
+        sol.pop(var, None)
+        unassigned.add(var)
+        return False
+
+    while True:
+        domains, rows, cols, boxes = sudokuBitmask.bitmask_state(g, {})
+        sol, unassigned, budget = {}, set(g.cells), 4 * g.size
+        if fill():
+            return sol
+
+def count_solutions(g, sol, limit=2):
+    return take_solutions(sudokuBitmask.BitmaskSolver().solutions_of(g, sol), limit, count_only=True)
+
+#---------- Puzzle ----------
+def make_puzzle(g, clues, rng):
+    """Αφαιρεί τιμές με τυχαία σειρά όσο η λύση μένει μοναδική, μέχρι να μείνουν clues.
+    Αν καμία άλλη τιμή δεν αφαιρείται, μένουν περισσότερα (ελάχιστο puzzle)."""
+    sol = solved_grid(g, rng)
+    for cell in rng.sample(list(g.cells), g.size):
+        if len(sol) <= clues:
+            break
+        value = sol.pop(cell)
+        if count_solutions(g, sol) != 1:
+            sol[cell] = value
+    return sol
+
+def generate(box, count, clues, seed):
+    """count puzzles με μοναδική λύση, ίδια για ίδια (box, clues, seed)"""
+    g = grid(box)
+    rng = random.Random(f"{box}/{clues}/{seed}")
+    for _ in range(count):
+        yield to_line(g, make_puzzle(g, clues, rng))
+
+#---------- Εκτέλεση ----------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Αναπαραγώγιμο corpus puzzles με μοναδική λύση")
+    parser.add_argument("--box", type=int, default=3, help="μέγεθος κουτιού (3 = 9x9, 4 = 16x16)")
+    parser.add_argument("--count", type=int, default=20)
+    parser.add_argument("--clues", type=int, default=30, help="στόχος δοσμένων τιμών")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("-o", "--output", help="αρχείο (προεπιλογή corpus/<N>x<N>_<clues>_s<seed>.txt)")
+    args = parser.parse_args()
+    n = args.box * args.box
+    path = args.output or os.path.join(HERE, "corpus", f"{n}x{n}_{args.clues}_s{args.seed}.txt")
+    given = []
+    with open(path, "w") as f:
+        for line in generate(args.box, args.count, args.clues, args.seed):
+            f.write(line + "\n")
+            given.append(sum(ch != '.' for ch in line))
+    print(f"{args.count} puzzles {n}x{n} στο {path} (δοσμένες τιμές {min(given)}-{max(given)})")
@@ -1,101 +1,102 @@
+import sys
 import itertools
 import heapq
 
-#---------- Sudoku 4x4 Setup ----------
-ROWS = ['1','2','3','4']  #αριθμητική αρίθμηση από κάτω προς τα πάνω
-COLS = ['a','b','c','d']
+from sudoku_grid import parse, initial_domains, bit, full_mask, mask_values, Solver
 
-#αρχική κατάσταση
-initial = {
-    ('3','b'): '4',
-    ('2','c'): '3',
-    ('2','d'): '2',
-    ('4','d'): '3'
-}
+#---------- Sudoku Setup ----------
+#αρχική κατάσταση 4x4 σε μορφή μίας γραμμής (γραμμή 0 = πάνω, '.' = κενό)
+INITIAL = "...3.4....32...."
 
-#domain για κάθε κελί
-domain = { (r,c): ['1','2','3','4'] if (r,c) not in initial else [initial[(r,c)]]
-          for r in ROWS for c in COLS }
+#---------- Compact board ----------
+# Μια κατάσταση είναι bytes μήκους g.size (0 = κενό), αμετάβλητη και ~g.size bytes,
+# αντί για αντίγραφο του dict λύσης + set μη ανατεθειμένων κελιών ανά παιδί.
+def board_of(g, sol):
+    return bytes(sol.get(i, 0) for i in g.cells)
 
-#---------- Constraints ----------
-def consistent(sol, var, value):
-    """Ελέγχει περιορισμούς για σειρά, στήλη και τετράγωνο 2x2"""
-    r,c = var
-    #σειρά
-    for col in COLS:
-        if col != c and sol.get((r,col)) == value:
-            return False
-    #στήλη
-    for row in ROWS:
-        if row != r and sol.get((row,c)) == value:
-            return False
-    #μικρό τετράγωνο 2x2
-    box_rows = ['1','2'] if r in ['1','2'] else ['3','4']
-    box_cols = ['a','b'] if c in ['a','b'] else ['c','d']
-    for br in box_rows:
-        for bc in box_cols:
-            if (br,bc) != var and sol.get((br,bc)) == value:
-                return False
-    return True
+def sol_of(board):
+    return {i: v for i, v in enumerate(board) if v}
 
 #--------- Heuristic ----------
-def heuristic(sol, unassigned):
-    """Απλό ευρετικό: αριθμός μη ανατεθειμένων κελιών"""
-    return len(unassigned)
+def propagate(g, board):
+    """Συμπληρώνει naked singles μέχρι να μη μένουν και υπολογίζει τα διαδομένα domains.
+    Επιστρέφει (board, h, κελί MRV, mask υποψηφίων του) ή None σε αδιέξοδο.
+    h = άθροισμα μεγεθών των domains των κενών κελιών (0 μόνο σε λύση)."""
+    n = g.n
+    row_of, col_of, box_of = g.row_of, g.col_of, g.box_of
+    rows, cols, boxes = [0] * n, [0] * n, [0] * n
+    for i, v in enumerate(board):
+        if v:
+            b = bit(v)
+            if (rows[row_of[i]] | cols[col_of[i]] | boxes[box_of[i]]) & b:
+                return None
+            rows[row_of[i]] |= b; cols[col_of[i]] |= b; boxes[box_of[i]] |= b
+    cells = bytearray(board)
+    empty = [i for i in g.cells if not cells[i]]
+    full = full_mask(g)
+    while True:
+        h, var, cand, best, forced = 0, None, 0, n + 1, False
+        for i in empty:
+            if cells[i]: continue
+            m = full & ~(rows[row_of[i]] | cols[col_of[i]] | boxes[box_of[i]])
+            c = m.bit_count()
+            if c == 0:
+                return None
+            if c == 1:
+                cells[i] = m.bit_length()
+                rows[row_of[i]] |= m; cols[col_of[i]] |= m; boxes[box_of[i]] |= m
+                forced = True
+                continue
+            h += c
+            if c < best:
+                var, cand, best = i, m, c
+        if not forced:
+            return bytes(cells), h, var, cand
+        empty = [i for i in empty if not cells[i]]
 
 #---------- Best-First Search with Forward Checking ----------
-solutions = []
-tree_nodes = 0
-solution_leaves = 0
-failure_leaves = 0
-
-def best_first_search():
-    global tree_nodes, solution_leaves, failure_leaves
+def best_first_iter(stats, g, initial, domain):
+    """Γεννήτρια: δίνει κάθε λύση με τη σειρά που βγαίνει από την ουρά.
+    Στην ουρά μπαίνουν (h, α/α, board, κελί MRV, υποψήφιες τιμές του)."""
     counter = itertools.count()  #μοναδικός αριθμός για heapq
     pq = []
 
-    all_vars = set(domain.keys())
-    assigned_vars = set(initial.keys())
-    unassigned_vars = all_vars - assigned_vars
-    sol0 = initial.copy()
-
-    #αρχική κατάσταση
-    heapq.heappush(pq, (heuristic(sol0, unassigned_vars), next(counter), sol0, unassigned_vars))
+    #αρχική κατάσταση (κελιά με μονοσύνολο domain θεωρούνται δοσμένα)
+    start = propagate(g, board_of(g, {v: d[0] for v, d in domain.items() if len(d) == 1}))
+    if start is None:
+        stats.failure_leaves += 1
+        return
+    board, h, var, cand = start
+    heapq.heappush(pq, (h, next(counter), board, var, cand))
 
     while pq:
-        h, _, sol, unassigned = heapq.heappop(pq)
-        tree_nodes += 1
+        h, _, board, var, cand = heapq.heappop(pq)
+        stats.tree_nodes += 1
 
-        if not unassigned:
+        if var is None:
             #βρήκαμε λύση
-            solutions.append(sol.copy())
-            solution_leaves += 1
+            stats.solution_leaves += 1
+            yield sol_of(board)
             continue
 
-        #MRV heuristic απλό: διάλεξε κελί με μικρότερο domain
-        var = min(unassigned, key=lambda v: len(domain[v]))
-        remaining = unassigned - {var}
+        for value in mask_values(cand):
+            child = propagate(g, board[:var] + bytes((value,)) + board[var+1:])
+            if child is None:
+                #φύλλο αποτυχίας: η διάδοση άδειασε κάποιο domain
+                stats.failure_leaves += 1
+                continue
+            child_board, child_h, child_var, child_cand = child
+            heapq.heappush(pq, (child_h, next(counter), child_board, child_var, child_cand))
 
-        for value in domain[var]:
-            if consistent(sol, var, value):
-                new_sol = sol.copy()
-                new_sol[var] = value
-                heapq.heappush(pq, (heuristic(new_sol, remaining), next(counter), new_sol, remaining))
-            else:
-                failure_leaves += 1
+class BestFirstSolver(Solver):
+    def solutions_of(self, g, initial):
+        return best_first_iter(self, g, initial, initial_domains(g, initial))
 
 #---------- Εκτέλεση ----------
-best_first_search()
-
-#---------- Εκτύπωση Αποτελεσμάτων ----------
-print("\nΑΠΟΤΕΛΕΣΜΑΤΑ SUDOKU 4x4 ΜΕ BEST-FIRST SEARCH")
-print("--------------------------------------------------")
-for sol in solutions:
-    full_sol = {(r,c): sol.get((r,c), '0') for r in ROWS for c in COLS}
-    for r in reversed(ROWS):  # από κάτω προς τα πάνω
-        print(' '.join(full_sol[(r,c)] for c in COLS))
-    print('')  # κενή γραμμή μεταξύ λύσεων
+if __name__ == "__main__":
+    g, initial = parse(sys.argv[1] if len(sys.argv) > 1 else INITIAL)
+    solver = BestFirstSolver()
+    solutions = solver.solve((g, initial))
 
-print("Στατιστικά δέντρου αναζήτησης:")
-print(f"Συνολικοί κόμβοι: {tree_nodes}")
-print(f"Φύλλα λύσης: {solution_leaves}, Φύλλα αποτυχίας: {failure_leaves}")
+    #---------- Εκτύπωση Αποτελεσμάτων ----------
+    solver.report("BEST-FIRST SEARCH", g, solutions)
\ No newline at end of file
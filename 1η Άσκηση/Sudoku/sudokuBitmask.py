@@ -0,0 +1,80 @@
+import sys
+
+from sudoku_grid import parse, bit, full_mask, Solver
+
+#---------- Sudoku Setup ----------
+#αρχική κατάσταση 4x4 σε μορφή μίας γραμμής (γραμμή 0 = πάνω, '.' = κενό)
+INITIAL = "...3.4....32...."
+
+#---------- Bitmask State ----------
+def bitmask_state(g, initial):
+    """Domain ως ένα int ανά κελί και masks "χρησιμοποιημένων ψηφίων" ανά γραμμή/στήλη/κουτί.
+    Επιστρέφει None αν οι δοσμένες τιμές συγκρούονται."""
+    full = full_mask(g)
+    domains = [full] * g.size
+    rows, cols, boxes = [0] * g.n, [0] * g.n, [0] * g.n
+    for var, value in initial.items():
+        b = bit(value)
+        r, c, bx = g.row_of[var], g.col_of[var], g.box_of[var]
+        if (rows[r] | cols[c] | boxes[bx]) & b:
+            return None
+        rows[r] |= b; cols[c] |= b; boxes[bx] |= b
+        domains[var] = b
+    return domains, rows, cols, boxes
+
+#---------- Bitmask Search ----------
+def bitmask_iter(stats, g, sol, unassigned, domains, rows, cols, boxes):
+    """Backtracking με MRV όπου ο έλεγχος συνέπειας και το μέγεθος domain είναι
+    πράξεις bits: υποψήφιες τιμές = domain & ~(γραμμή | στήλη | κουτί).
+    Γεννήτρια: δίνει κάθε λύση μόλις βρεθεί (το ίδιο το dict sol)."""
+    stats.tree_nodes += 1
+    if not unassigned:
+        #βρήκαμε λύση
+        stats.solution_leaves += 1
+        yield sol
+        return
+
+    #MRV: το κελί με τις λιγότερες υποψήφιες τιμές
+    row_of, col_of, box_of = g.row_of, g.col_of, g.box_of
+    var, cand, best = None, 0, g.n + 1
+    for v in unassigned:
+        m = domains[v] & ~(rows[row_of[v]] | cols[col_of[v]] | boxes[box_of[v]])
+        cnt = m.bit_count()
+        if cnt < best:
+            var, cand, best = v, m, cnt
+            if cnt <= 1: break
+    if not cand:
+        #φύλλο αποτυχίας: κελί χωρίς καμία συνεπή τιμή
+        stats.failure_leaves += 1
+        return
+
+    r, c, bx = row_of[var], col_of[var], box_of[var]
+    unassigned.remove(var)
+    try:
+        while cand:
+            b = cand & -cand
+            cand ^= b
+            sol[var] = b.bit_length()
+            rows[r] |= b; cols[c] |= b; boxes[bx] |= b
+            try:
+                yield from bitmask_iter(stats, g, sol, unassigned, domains, rows, cols, boxes)
+            finally:
+                rows[r] ^= b; cols[c] ^= b; boxes[bx] ^= b
+    finally:
+        sol.pop(var, None)
+        unassigned.add(var)
+
+class BitmaskSolver(Solver):
+    def solutions_of(self, g, initial):
+        state = bitmask_state(g, initial)
+        if state is not None:
+            yield from bitmask_iter(self, g, initial.copy(), set(g.cells) - set(initial), *state)
+
+#---------- Εκτέλεση ----------
+if __name__ == "__main__":
+    g, initial = parse(sys.argv[1] if len(sys.argv) > 1 else INITIAL)
+    solver = BitmaskSolver()
+    solutions = solver.solve((g, initial))
+
+    #---------- Εκτύπωση Αποτελεσμάτων ----------
+    solver.report("BITMASK SEARCH", g, solutions)
\ No newline at end of file
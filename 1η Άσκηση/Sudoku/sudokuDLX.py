@@ -0,0 +1,178 @@
+import sys
+from functools import lru_cache
+
+from sudoku_grid import parse, grid, bit, Solver
+
+#---------- Sudoku Setup ----------
+#αρχική κατάσταση 4x4 σε μορφή μίας γραμμής (γραμμή 0 = πάνω, '.' = κενό)
+INITIAL = "...3.4....32...."
+
+#---------- Exact cover ----------
+# Στήλες (4·N² + 1 με την κεφαλή 0): κελί i, (γραμμή r, ψηφίο d), (στήλη c, d), (κουτί b, d).
+# Κάθε υποψήφιο (κελί, ψηφίο) είναι μια γραμμή του πίνακα με 4 κόμβους.
+# Οι σύνδεσμοι L/R/U/D, η στήλη C κάθε κόμβου και τα μεγέθη S είναι λίστες ακεραίων
+# που φτιάχνονται μία φορά ανά μέγεθος πλέγματος και επαναφέρονται (με αντιγραφή
+# στη θέση τους) πριν από κάθε puzzle.
+class DancingLinks:
+    def __init__(self, g):
+        self.g = g
+        n, size = g.n, g.size
+        cols = 4 * size
+        self.cols = cols
+        first = cols + 1                    # ο πρώτος κόμβος μετά τις κεφαλές
+        total = first + 4 * size * n
+        L, R, U, D, C = ([0] * total for _ in range(5))
+        for c in range(cols + 1):
+            L[c], R[c] = (c - 1) % (cols + 1), (c + 1) % (cols + 1)
+            U[c] = D[c] = C[c] = c
+        self.row_of = [0] * total           # κόμβος -> αριθμός υποψηφίου (κελί·N + ψηφίο-1)
+        self.row_start = [0] * (size * n)   # υποψήφιο -> πρώτος κόμβος του
+        node = first
+        for cell in g.cells:
+            r, c, b = g.row_of[cell], g.col_of[cell], g.box_of[cell]
+            for d in range(n):
+                cand = cell * n + d
+                self.row_start[cand] = node
+                for k, col in enumerate((1 + cell, 1 + size + r*n + d,
+                                         1 + 2*size + c*n + d, 1 + 3*size + b*n + d)):
+                    x = node + k
+                    L[x], R[x] = node + (k - 1) % 4, node + (k + 1) % 4
+                    C[x] = col
+                    U[x], D[x] = U[col], col    # στο τέλος της στήλης
+                    D[U[col]] = x
+                    U[col] = x
+                    self.row_of[x] = cand
+                node += 4
+        self.L, self.R, self.U, self.D, self.C = L, R, U, D, C
+        self.S = [0] + [n] * cols
+        self.pristine = (L[:], R[:], U[:], D[:], self.S[:])
+
+    def copy(self):
+        """Νέος πίνακας με δικούς του συνδέσμους· τα σταθερά μέρη (C, row_of, ...) είναι κοινά"""
+        dl = DancingLinks.__new__(DancingLinks)
+        dl.__dict__.update(self.__dict__)
+        L0, R0, U0, D0, S0 = self.pristine
+        dl.L, dl.R, dl.U, dl.D, dl.S = L0[:], R0[:], U0[:], D0[:], S0[:]
+        return dl
+
+    def reset(self):
+        """Επαναφορά του αρχικού πίνακα χωρίς νέες δεσμεύσεις μνήμης"""
+        L0, R0, U0, D0, S0 = self.pristine
+        self.L[:] = L0; self.R[:] = R0; self.U[:] = U0; self.D[:] = D0; self.S[:] = S0
+
+    def cover(self, c):
+        L, R, U, D, C, S = self.L, self.R, self.U, self.D, self.C, self.S
+        R[L[c]] = R[c]; L[R[c]] = L[c]
+        i = D[c]
+        while i != c:
+            j = R[i]
+            while j != i:
+                D[U[j]] = D[j]; U[D[j]] = U[j]
+                S[C[j]] -= 1
+                j = R[j]
+            i = D[i]
+
+    def uncover(self, c):
+        L, R, U, D, C, S = self.L, self.R, self.U, self.D, self.C, self.S
+        i = U[c]
+        while i != c:
+            j = L[i]
+            while j != i:
+                S[C[j]] += 1
+                D[U[j]] = j; U[D[j]] = j
+                j = L[j]
+            i = U[i]
+        R[L[c]] = c; L[R[c]] = c
+
+    def select(self, cand):
+        """Βάζει στη λύση το υποψήφιο cand καλύπτοντας τις 4 στήλες του"""
+        x = self.row_start[cand]
+        for k in range(4):
+            self.cover(self.C[x + k])
+
+    def load(self, initial):
+        """Επαναφορά και κάλυψη των δοσμένων τιμών. False αν συγκρούονται."""
+        g = self.g
+        self.reset()
+        rows, cols, boxes = [0] * g.n, [0] * g.n, [0] * g.n
+        for var, value in initial.items():
+            b = bit(value)
+            r, c, bx = g.row_of[var], g.col_of[var], g.box_of[var]
+            if (rows[r] | cols[c] | boxes[bx]) & b:
+                return False
+            rows[r] |= b; cols[c] |= b; boxes[bx] |= b
+            self.select(var * g.n + value - 1)
+        return True
+
+@lru_cache(maxsize=None)
+def links(box):
+    """Ο αρχικός πίνακας ανά μέγεθος κουτιού (κάθε solver παίρνει δικό του copy())"""
+    return DancingLinks(grid(box))
+
+#---------- Algorithm X ----------
+def dlx_iter(stats, dl, sol):
+    """Algorithm X: διαλέγει τη στήλη με τις λιγότερες γραμμές (ισοδύναμο του MRV
+    για κελιά και για "σε ποιο κελί πάει το ψηφίο d της μονάδας").
+    Γεννήτρια: δίνει κάθε λύση μόλις βρεθεί (το ίδιο το dict sol)."""
+    R, D, S = dl.R, dl.D, dl.S
+    stats.tree_nodes += 1
+    if R[0] == 0:
+        #βρήκαμε λύση
+        stats.solution_leaves += 1
+        yield sol
+        return
+
+    c, best = 0, dl.g.n + 1
+    j = R[0]
+    while j != 0:
+        if S[j] < best:
+            c, best = j, S[j]
+            if best <= 1: break
+        j = R[j]
+    if best == 0:
+        #φύλλο αποτυχίας: περιορισμός που δεν καλύπτεται από καμία γραμμή
+        stats.failure_leaves += 1
+        return
+
+    n, C, L = dl.g.n, dl.C, dl.L
+    dl.cover(c)
+    try:
+        r = D[c]
+        while r != c:
+            cand = dl.row_of[r]
+            sol[cand // n] = cand % n + 1
+            j = R[r]
+            while j != r:
+                dl.cover(C[j]); j = R[j]
+            try:
+                yield from dlx_iter(stats, dl, sol)
+            finally:
+                j = L[r]
+                while j != r:
+                    dl.uncover(C[j]); j = L[j]
+                sol.pop(cand // n)
+            r = D[r]
+    finally:
+        dl.uncover(c)
+
+class DLXSolver(Solver):
+    def __init__(self):
+        super().__init__()
+        self.links = {}                 # μέγεθος κουτιού -> δικός του πίνακας
+
+    def solutions_of(self, g, initial):
+        """Φορτώνει το puzzle στον πίνακα του μεγέθους του και δίνει τις λύσεις του"""
+        dl = self.links.get(g.box)
+        if dl is None:
+            dl = self.links[g.box] = links(g.box).copy()
+        if dl.load(initial):
+            yield from dlx_iter(self, dl, initial.copy())
+
+#---------- Εκτέλεση ----------
+if __name__ == "__main__":
+    g, initial = parse(sys.argv[1] if len(sys.argv) > 1 else INITIAL)
+    solver = DLXSolver()
+    solutions = solver.solve((g, initial))
+
+    #---------- Εκτύπωση Αποτελεσμάτων ----------
+    solver.report("DANCING LINKS", g, solutions)
\ No newline at end of file
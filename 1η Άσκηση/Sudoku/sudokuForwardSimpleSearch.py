@@ -1,88 +1,94 @@
-import itertools
+import sys
 
-#---------- Sudoku 4x4 Setup ----------
-ROWS = ['1','2','3','4']  #αριθμητική αρθροίση από κάτω προς τα πάνω
-COLS = ['a','b','c','d']
+from sudoku_grid import parse, initial_domains, consistent, Solver
 
-#αρχική κατάσταση
-initial = {
-    ('3','b'): '4',
-    ('2','c'): '3',
-    ('2','d'): '2',
-    ('4','d'): '3'
-}
+#---------- Sudoku Setup ----------
+#αρχική κατάσταση 4x4 σε μορφή μίας γραμμής (γραμμή 0 = πάνω, '.' = κενό)
+INITIAL = "...3.4....32...."
 
-#domain για κάθε κελί
-domain = { (r,c): ['1','2','3','4'] if (r,c) not in initial else [initial[(r,c)]]
-          for r in ROWS for c in COLS }
-
-#---------- Constraints ----------
-def consistent(sol, var, value):
-    """Ελέγχει περιορισμούς για σειρά, στήλη και τετράγωνο 2x2"""
-    r,c = var
-    #σειρά
-    for col in COLS:
-        if col != c and sol.get((r,col)) == value:
-            return False
-    #στήλη
-    for row in ROWS:
-        if row != r and sol.get((row,c)) == value:
-            return False
-    #μικρό τετράγωνο 2x2
-    box_rows = ['1','2'] if r in ['1','2'] else ['3','4']
-    box_cols = ['a','b'] if c in ['a','b'] else ['c','d']
-    for br in box_rows:
-        for bc in box_cols:
-            if (br,bc) != var and sol.get((br,bc)) == value:
+#---------- Forward Checking Search ----------
+# Κάθε ανάθεση αφαιρεί την τιμή από τα domains των μη ανατεθειμένων γειτόνων και
+# η αναζήτηση γυρίζει πίσω στο πρώτο άδειο domain. Τα κελιά κρατιούνται σε "κουβάδες"
+# buckets[k] = κελιά με k τιμές, ώστε το MRV να βρίσκει το επόμενο κελί χωρίς σάρωση.
+def prune(g, sol, domains, buckets, var, value, pruned):
+    """Αφαιρεί την value από τους γείτονες της var (γράφοντάς τους στο pruned).
+    False αν κάποιο domain άδειασε."""
+    for p in g.peers[var]:
+        d = domains.get(p)
+        if d is not None and p not in sol and value in d:
+            k = len(d)
+            buckets[k].discard(p)
+            d.discard(value)
+            buckets[k-1].add(p)
+            pruned.append(p)
+            if k == 1:
                 return False
     return True
 
-#---------- Forward Checking Search ----------
-solutions = []
-tree_nodes = 0
-solution_leaves = 0
-failure_leaves = 0
+def restore(domains, buckets, value, pruned):
+    for p in pruned:
+        d = domains[p]
+        k = len(d)
+        buckets[k].discard(p)
+        d.add(value)
+        buckets[k+1].add(p)
 
-def forward_checking(sol, unassigned):
-    global tree_nodes, solution_leaves, failure_leaves
-    if not unassigned:
+def forward_search(stats, g, sol, domains, buckets):
+    stats.tree_nodes += 1
+    #διάλεξε επόμενο κελί (δυναμικό MRV: ο πρώτος μη κενός κουβάς)
+    for bucket in buckets:
+        if bucket: break
+    else:
         #βρήκαμε λύση
-        solutions.append(sol.copy())
-        solution_leaves += 1
-        tree_nodes += 1
-        return True
+        stats.solution_leaves += 1
+        yield sol
+        return
 
-    #διάλεξε επόμενο κελί (MRV heuristic απλό)
-    var = min(unassigned, key=lambda v: len(domain[v]))
-    remaining = unassigned - {var}
-
-    tree_nodes += 1
-    for value in domain[var]:
-        if consistent(sol, var, value):
+    var = bucket.pop()
+    try:
+        for value in sorted(domains[var]):
             sol[var] = value
-            forward_checking(sol, remaining)
-            sol.pop(var)
-        else:
-            #φύλλο αποτυχίας
-            failure_leaves += 1
+            pruned = []
+            try:
+                if prune(g, sol, domains, buckets, var, value, pruned):
+                    yield from forward_search(stats, g, sol, domains, buckets)
+                else:
+                    #φύλλο αποτυχίας: κάποιος γείτονας έμεινε χωρίς τιμές
+                    stats.failure_leaves += 1
+            finally:
+                restore(domains, buckets, value, pruned)
+                sol.pop(var)
+    finally:
+        bucket.add(var)
 
-#---------- Εκτέλεση ----------
-all_vars = set(domain.keys())
-assigned_vars = set(initial.keys())
-unassigned_vars = all_vars - assigned_vars
-solution_dict = initial.copy()
+def forward_checking_iter(stats, g, sol, unassigned, domain):
+    """Γεννήτρια: δίνει κάθε λύση μόλις βρεθεί (το ίδιο το dict sol, αντίγραφο αν πρέπει να κρατηθεί).
+    Τα στατιστικά γράφονται στο stats (ένας ForwardCheckingSolver)."""
+    domains = {v: set(domain[v]) for v in unassigned}
+    for var, value in sol.items():
+        if not consistent(g, sol, var, value):
+            stats.failure_leaves += 1
+            return
+        for p in g.peers[var]:
+            if p in domains:
+                domains[p].discard(value)
+    buckets = [set() for _ in range(g.n + 1)]
+    for v, d in domains.items():
+        buckets[len(d)].add(v)
+    if buckets[0]:
+        stats.failure_leaves += 1
+        return
+    yield from forward_search(stats, g, sol, domains, buckets)
 
-forward_checking(solution_dict, unassigned_vars)
+class ForwardCheckingSolver(Solver):
+    def solutions_of(self, g, initial):
+        return forward_checking_iter(self, g, initial.copy(), set(g.cells) - set(initial), initial_domains(g, initial))
 
-#--------- Εκτύπωση Αποτελεσμάτων ----------
-print("\nΑΠΟΤΕΛΕΣΜΑΤΑ SUDOKU 4x4 ΜΕ FORWARD CHECKING")
-print("--------------------------------------------------")
-for sol in solutions:
-    full_sol = {(r,c): sol.get((r,c), '0') for r in ROWS for c in COLS}
-    for r in reversed(ROWS):  # από κάτω προς τα πάνω
-        print(' '.join(full_sol[(r,c)] for c in COLS))
-    print('')  #κενή γραμμή μεταξύ λύσεων
+#---------- Εκτέλεση ----------
+if __name__ == "__main__":
+    g, initial = parse(sys.argv[1] if len(sys.argv) > 1 else INITIAL)
+    solver = ForwardCheckingSolver()
+    solutions = solver.solve((g, initial))
 
-print("Στατιστικά δέντρου αναζήτησης:")
-print(f"Συνολικοί κόμβοι: {tree_nodes}")
-print(f"Φύλλα λύσης: {solution_leaves}, Φύλλα αποτυχίας: {failure_leaves}")
+    #---------- Εκτύπωση Αποτελεσμάτων ----------
+    solver.report("FORWARD CHECKING", g, solutions)
\ No newline at end of file
@@ -0,0 +1,140 @@
+import argparse, itertools, json, os, sys, time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import MacForSudoku, sudokuForwardSimpleSearch, sudokuBestFs, sudokuBitmask, sudokuDLX, sudoku_local, sudoku_sat
+from sudoku_canon import SolutionCache
+from sudoku_grid import parse, to_line
+
+#---------- Engines ----------
+# Κάθε engine: επίπεδο διάδοσης του MAC -> νέος solver (με δικά του στατιστικά)
+ENGINES = {
+    "forward_checking":  lambda level: sudokuForwardSimpleSearch.ForwardCheckingSolver(),
+    "mac_search":        lambda level: MacForSudoku.MacSolver(level),
+    "mac_wdeg":          lambda level: MacForSudoku.MacSolver(level, wdeg=True, lcv=True),
+    "mac_cbj":           lambda level: MacForSudoku.MacCbjSolver(),
+    "best_first_search": lambda level: sudokuBestFs.BestFirstSolver(),
+    "bitmask_search":    lambda level: sudokuBitmask.BitmaskSolver(),
+    "dlx_search":        lambda level: sudokuDLX.DLXSolver(),
+    "sat_cdcl":          lambda level: sudoku_sat.SATSolver(),
+    "min_conflicts":     lambda level: sudoku_local.MinConflictsSolver(fallback=lambda: MacForSudoku.MacSolver(level)),
+}
+MAC_LEVEL = "subsets"
+MAX_SOLUTIONS = 2               # 2 = έλεγχος μοναδικότητας, 0 = όλες οι λύσεις
+CACHE = None                    # SolutionCache (ένα ανά διεργασία) ή None
+
+#---------- Worker (τρέχει στο process pool) ----------
+def _init(level, max_solutions, cache=None):
+    global MAC_LEVEL, MAX_SOLUTIONS, CACHE
+    MAC_LEVEL, MAX_SOLUTIONS = level, max_solutions
+    CACHE = SolutionCache(cache) if cache else None
+
+def solve_line(solver, line):
+    """Μία γραμμή puzzle -> εγγραφή JSON με την πρώτη λύση, το πλήθος λύσεων
+    (έως MAX_SOLUTIONS) και τα στατιστικά"""
+    try:
+        g, initial = parse(line)
+    except ValueError as e:
+        return {"puzzle": line, "error": str(e)}
+    solver.reset()
+    t0 = time.perf_counter()
+    key = answer = None
+    if CACHE is not None:
+        # ισοδύναμο puzzle (ως προς τις συμμετρίες) που έχει ήδη λυθεί: χωρίς αναζήτηση
+        key, answer = CACHE.lookup(g, initial, MAX_SOLUTIONS)
+    if answer is not None:
+        first, found = answer
+    else:
+        first, found = None, 0
+        it = solver.solutions_of(g, initial)
+        try:
+            for sol in it:
+                if first is None:
+                    first = sol.copy()
+                found += 1
+                if found == MAX_SOLUTIONS:
+                    break
+        finally:
+            it.close()
+        if CACHE is not None:
+            CACHE.put(g, key, first, found, MAX_SOLUTIONS)
+    elapsed = time.perf_counter() - t0
+    record = {"puzzle": line, "solution": first and to_line(g, first), "solutions": found}
+    if MAX_SOLUTIONS != 1:
+        record["unique"] = found == 1
+    record.update(tree_nodes=solver.tree_nodes, failure_leaves=solver.failure_leaves, ms=round(elapsed * 1000, 3))
+    if CACHE is not None:
+        record["cached"] = answer is not None
+    return record
+
+def solve_chunk(engine, lines):
+    solver = ENGINES[engine](MAC_LEVEL)
+    records = []
+    for line in lines:
+        try:
+            record = solve_line(solver, line)
+        except Exception as e:
+            # ένα puzzle που ρίχνει τον solver δεν σταματά το stream: εγγραφή σφάλματος και
+            # νέος solver, γιατί η κατάσταση του παλιού μπορεί να έμεινε μισή
+            record = {"puzzle": line, "error": f"{type(e).__name__}: {e}"}
+            solver = ENGINES[engine](MAC_LEVEL)
+        records.append(json.dumps(record))
+    return records
+
+#---------- Streaming ----------
+def puzzles(f):
+    """Οι γραμμές του αρχείου μία-μία (χωρίς κενές γραμμές και σχόλια '#')"""
+    for line in f:
+        line = line.strip()
+        if line and not line.startswith('#'):
+            yield line
+
+def solve_stream(lines, out, engine, workers=None, chunk=64, level=MAC_LEVEL, max_solutions=MAX_SOLUTIONS,
+                 cache=None):
+    """Λύνει τα puzzles του iterable lines στο pool και γράφει JSON Lines στο out με τη
+    σειρά εισόδου. Σε πτήση βρίσκονται το πολύ 2·workers κομμάτια των chunk γραμμών,
+    άρα η μνήμη δεν εξαρτάται από το μέγεθος του αρχείου. Με cache (αρχείο SQLite) τα
+    ισοδύναμα puzzles που έχουν ήδη λυθεί δεν ξαναλύνονται. Επιστρέφει το πλήθος."""
+    workers = workers or os.cpu_count()
+    count = 0
+    it = iter(lines)
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init, initargs=(level, max_solutions, cache)) as pool:
+        while True:
+            while len(pending) < 2 * workers:
+                block = list(itertools.islice(it, chunk))
+                if not block:
+                    break
+                pending.append(pool.submit(solve_chunk, engine, block))
+            if not pending:
+                break
+            records = pending.popleft().result()
+            out.write('\n'.join(records) + '\n')
+            count += len(records)
+    return count
+
+#---------- Εκτέλεση ----------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Μαζική επίλυση puzzles μίας γραμμής (81/256 χαρακτήρες) σε process pool")
+    parser.add_argument("input", help="αρχείο με ένα puzzle ανά γραμμή ('-' για stdin)")
+    parser.add_argument("-o", "--output", default="-", help="αρχείο JSON Lines ('-' για stdout)")
+    parser.add_argument("--engine", default="mac_search", choices=list(ENGINES))
+    parser.add_argument("--level", default=MAC_LEVEL, choices=MacForSudoku.LEVELS, help="διάδοση του mac_search")
+    parser.add_argument("--max-solutions", type=int, default=MAX_SOLUTIONS,
+                        help="σταματά μετά από τόσες λύσεις (2 = έλεγχος μοναδικότητας, 0 = όλες)")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk", type=int, default=64, help="puzzles ανά αποστολή σε worker")
+    parser.add_argument("--cache", help="αρχείο SQLite με τις λύσεις των κανονικών μορφών")
+    args = parser.parse_args()
+
+    fin = sys.stdin if args.input == "-" else open(args.input)
+    fout = sys.stdout if args.output == "-" else open(args.output, "w")
+    try:
+        t0 = time.perf_counter()
+        count = solve_stream(puzzles(fin), fout, args.engine, args.workers, args.chunk, args.level,
+                             args.max_solutions, args.cache)
+        elapsed = time.perf_counter() - t0
+    finally:
+        if fin is not sys.stdin: fin.close()
+        if fout is not sys.stdout: fout.close()
+    print(f"{count} puzzles σε {elapsed:.2f}s ({count/elapsed:.1f} puzzles/s, {args.engine})", file=sys.stderr)
@@ -0,0 +1,226 @@
+import argparse, itertools, os, random, sqlite3, time
+
+from sudoku_grid import parse, to_line, SYMBOLS
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+#---------- Κανονική μορφή ----------
+# Συμμετρίες: μετάθεση ψηφίων, γραμμών μέσα σε ζώνη, ζωνών, στηλών μέσα σε στοίβα, στοιβών
+# και ανάστροφη. Η κανονική μορφή είναι η λεξικογραφικά μικρότερη γραμμή που δίνουν: κάθε
+# ψηφίο παίρνει ετικέτα 1, 2, ... με τη σειρά που εμφανίζεται και το κενό μετράει ως το
+# μεγαλύτερο σύμβολο (οπότε οι πυκνές γραμμές έρχονται πρώτες και κλαδεύουν νωρίς).
+# Οι γραμμές επιλέγονται μία-μία και κρατιούνται μόνο οι καταστάσεις με το ελάχιστο πρόθεμα.
+# Για κουτιά πάνω από 3 οι μεταθέσεις μέσα σε ζώνη/στοίβα (4!^5 ανά άξονα) είναι πολλές:
+# εκεί η μορφή είναι κανονική ως προς ψηφία, ζώνες, στοίβες και ανάστροφη μόνο.
+def row_code(row, cols, labels, nxt, blank):
+    """Η γραμμή με τη σειρά cols σε ετικέτες· νέα ψηφία παίρνουν τις επόμενες (αλλάζει το labels)"""
+    code = []
+    for c in cols:
+        d = row[c]
+        if not d:
+            code.append(blank)
+        else:
+            if not labels[d]:
+                labels[d] = nxt
+                nxt += 1
+            code.append(labels[d])
+    return code, nxt
+
+def first_columns(row, box, within):
+    """Οι διατάξεις στηλών που δίνουν την ελάχιστη πρώτη γραμμή (με within όλες ισοδύναμες)"""
+    stacks = [range(s * box, (s + 1) * box) for s in range(box)]
+    if not within:
+        for order in itertools.permutations(range(box)):
+            yield tuple(c for s in order for c in stacks[s])
+        return
+    # στοίβες με περισσότερα ψηφία πρώτα· σε κάθε στοίβα τα ψηφία (με όποια σειρά) και μετά τα κενά
+    inner = []
+    for cols in stacks:
+        full = [c for c in cols if row[c]]
+        empty = [c for c in cols if not row[c]]
+        inner.append([a + b for a in itertools.permutations(full) for b in itertools.permutations(empty)])
+    counts = [sum(1 for c in cols if row[c]) for cols in stacks]
+    groups = [[s for s in range(box) if counts[s] == k] for k in sorted(set(counts), reverse=True)]
+    for order in itertools.product(*(itertools.permutations(group) for group in groups)):
+        flat = [s for group in order for s in group]
+        for parts in itertools.product(*(inner[s] for s in flat)):
+            yield sum(parts, ())
+
+MAX_STATES = 10000      # τα puzzles του corpus (και τα ισοδύναμά τους) φτάνουν ως 1296
+
+def canonical(g, puzzle, max_states=MAX_STATES):
+    """puzzle (dict κελί -> τιμή) -> (γραμμή κανονικού puzzle, μετασχηματισμός), ή None όταν οι
+    ισοδύναμες καταστάσεις ενός επιπέδου ξεπερνούν τις max_states (σχεδόν άδεια ή πολύ
+    συμμετρικά πλέγματα: το άδειο 9x9 ήθελε δευτερόλεπτα)"""
+    n, box = g.n, g.box
+    within = box <= 3
+    blank = n + 1
+    cells = [[puzzle.get(r * n + c, 0) for c in range(n)] for r in range(n)]
+    frames = (cells, [list(col) for col in zip(*cells)])
+    band = lambda r: r // box
+
+    # κατάσταση: (ανάστροφη, σειρά γραμμών, σειρά στηλών, ετικέτες ψηφίων, επόμενη ετικέτα)
+    best, states = None, []
+    for t, rows in enumerate(frames):
+        for r in (range(n) if within else range(0, n, box)):
+            for cols in first_columns(rows[r], box, within):
+                labels = [0] * (n + 1)
+                code, nxt = row_code(rows[r], cols, labels, 1, blank)
+                if best is None or code < best:
+                    best, states = code, []
+                if code == best:
+                    states.append((t, (r,), cols, labels, nxt))
+                    if len(states) > max_states:
+                        return None
+    lines = [best]
+
+    for level in range(1, n):
+        best, nxt_states, seen = None, [], set()
+        for t, seq, cols, labels, nxt in states:
+            rows, used = frames[t], set(seq)
+            if level % box:
+                last = seq[-1]
+                candidates = [r for r in range(band(last) * box, (band(last) + 1) * box) if r not in used] \
+                    if within else [last + 1]
+            else:
+                done = {band(r) for r in seq}
+                candidates = [r for r in range(n) if band(r) not in done and (within or r % box == 0)]
+            for r in candidates:
+                lab = labels[:]
+                code, nx = row_code(rows[r], cols, lab, nxt, blank)
+                if best is None or code < best:
+                    best, nxt_states, seen = code, [], set()
+                if code == best:
+                    key = (t, frozenset(seq) | {r}, r, cols, tuple(lab))
+                    if key not in seen:
+                        seen.add(key)
+                        nxt_states.append((t, seq + (r,), cols, lab, nx))
+                        if len(nxt_states) > max_states:
+                            return None
+        lines.append(best)
+        states = nxt_states
+
+    t, seq, cols, labels, nxt = states[0]
+    for d in range(1, n + 1):                   # ψηφία που δεν εμφανίζονται: με τη σειρά τους
+        if not labels[d]:
+            labels[d] = nxt
+            nxt += 1
+    line = ''.join('.' if v == blank else SYMBOLS[v - 1] for code in lines for v in code)
+    return line, (t, seq, cols, labels)
+
+def frame_cell(g, transform, i, j):
+    """Το κελί του αρχικού puzzle που πηγαίνει στη θέση (i, j) της κανονικής μορφής"""
+    t, seq, cols, _ = transform
+    r, c = seq[i], cols[j]
+    return (c * g.n + r) if t else (r * g.n + c)
+
+def to_canonical(g, transform, sol):
+    """Λύση στο αρχικό πλαίσιο -> λύση του κανονικού puzzle"""
+    labels = transform[3]
+    return {i * g.n + j: labels[sol[frame_cell(g, transform, i, j)]] for i in range(g.n) for j in range(g.n)}
+
+def from_canonical(g, transform, sol):
+    """Λύση του κανονικού puzzle -> λύση στο αρχικό πλαίσιο"""
+    digit = {label: d for d, label in enumerate(transform[3]) if d}
+    return {frame_cell(g, transform, i, j): digit[sol[i * g.n + j]] for i in range(g.n) for j in range(g.n)}
+
+def shuffle(g, puzzle, rng):
+    """Τυχαίο ισοδύναμο puzzle ως προς τις συμμετρίες της canonical (για έλεγχο και για corpus με επαναλήψεις)"""
+    box, n = g.box, g.n
+    inner = (lambda: rng.sample(range(box), box)) if box <= 3 else (lambda: range(box))
+    digits = [0] + rng.sample(range(1, n + 1), n)
+    rows = [b * box + i for b in rng.sample(range(box), box) for i in inner()]
+    cols = [b * box + i for b in rng.sample(range(box), box) for i in inner()]
+    flip = rng.random() < 0.5
+    out = {}
+    for r in range(n):
+        for c in range(n):
+            v = puzzle.get(rows[r] * n + cols[c])
+            if v:
+                out[(c * n + r) if flip else (r * n + c)] = digits[v]
+    return out
+
+#---------- Cache στον δίσκο ----------
+class SolutionCache:
+    """SQLite: κανονικό puzzle -> (λύση του κανονικού puzzle, πλήθος λύσεων έως limit, limit).
+    Το πλήθος είναι ακριβές όταν είναι μικρότερο από το limit με το οποίο μετρήθηκε."""
+    def __init__(self, path):
+        self.db = sqlite3.connect(path, timeout=30)
+        self.db.execute("CREATE TABLE IF NOT EXISTS solved (puzzle TEXT PRIMARY KEY, solution TEXT, "
+                        "solutions INTEGER, counted INTEGER)")
+        self.hits = self.misses = 0
+
+    def lookup(self, g, initial, max_solutions=2):
+        """-> (κλειδί για το put, (λύση στο αρχικό πλαίσιο ή None, πλήθος λύσεων) ή None αν
+        το cache δεν έχει απάντηση για αυτό το max_solutions). Χωρίς κανονική μορφή (βλ.
+        MAX_STATES) το κλειδί είναι None και το puzzle απλώς λύνεται."""
+        canon = canonical(g, initial)
+        if canon is None:
+            self.misses += 1
+            return None, None
+        line, transform = canon
+        row = self.db.execute("SELECT solution, solutions, counted FROM solved WHERE puzzle = ?", (line,)).fetchone()
+        if row is not None:
+            solution, count, counted = row
+            if count < counted or (max_solutions and counted >= max_solutions):
+                self.hits += 1
+                if solution is not None:
+                    solution = from_canonical(g, transform, parse(solution)[1])
+                return (line, transform), (solution, min(count, max_solutions) if max_solutions else count)
+        self.misses += 1
+        return (line, transform), None
+
+    def put(self, g, key, solution, count, max_solutions):
+        """Αποθήκευση της πρώτης λύσης (ή None) και του πλήθους που βρέθηκε με όριο max_solutions"""
+        if key is None:
+            return
+        line, transform = key
+        canon = to_line(g, to_canonical(g, transform, solution)) if solution is not None else None
+        with self.db:
+            self.db.execute("INSERT OR REPLACE INTO solved VALUES (?, ?, ?, ?)",
+                            (line, canon, count, max_solutions or g.size + 1))
+
+    def close(self):
+        self.db.close()
+
+#---------- Εκτέλεση ----------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Κανονική μορφή puzzles ως προς τις συμμετρίες και έλεγχος σε τυχαία ισοδύναμα")
+    parser.add_argument("corpus", nargs="?", default=os.path.join(HERE, "corpus", "9x9_30_s1.txt"))
+    parser.add_argument("--variants", type=int, default=5, help="τυχαία ισοδύναμα ανά puzzle")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("-o", "--output", help="γράφει τα puzzles μαζί με τα ισοδύναμά τους (corpus με επαναλήψεις)")
+    args = parser.parse_args()
+    with open(args.corpus) as f:
+        puzzles = [parse(line) for line in f if line.strip()]
+    rng = random.Random(args.seed)
+
+    t0 = time.perf_counter()
+    forms, calls, failed, skipped, written = set(), 0, 0, 0, []
+    for g, initial in puzzles:
+        canon = canonical(g, initial)
+        if canon is None:
+            skipped += 1
+            continue
+        line, _ = canon
+        forms.add(line)
+        calls += 1
+        written.append(to_line(g, initial))
+        for _ in range(args.variants):
+            variant = shuffle(g, initial, rng)
+            written.append(to_line(g, variant))
+            calls += 1
+            if (canonical(g, variant) or (None,))[0] != line:
+                failed += 1
+    elapsed = time.perf_counter() - t0
+    if args.output:
+        rng.shuffle(written)
+        with open(args.output, "w") as f:
+            f.write('\n'.join(written) + '\n')
+
+    print(f"\nΚΑΝΟΝΙΚΗ ΜΟΡΦΗ: {len(puzzles)} puzzles x {args.variants + 1} ({os.path.basename(args.corpus)})")
+    print("--------------------------------------------------")
+    print(f"Διαφορετικές κανονικές μορφές: {len(forms)}, ισοδύναμα με άλλη μορφή: {failed}")
+    if skipped:
+        print(f"Χωρίς κανονική μορφή (πάνω από {MAX_STATES} καταστάσεις): {skipped}")
+    print(f"{elapsed*1000/max(calls, 1):.2f} ms ανά puzzle")
@@ -0,0 +1,200 @@
+from functools import lru_cache
+
+#---------- Γεωμετρία N²×N² ----------
+# Τα κελιά είναι ακέραιοι 0..N*N-1 (γραμμή r, στήλη c -> r*N + c, γραμμή 0 = πάνω)
+# και οι τιμές ακέραιοι 1..N.
+SYMBOLS = "123456789ABCDEFGHIJKLMNOP"   # σύμβολα για N έως 25
+BLANKS = ".0"
+
+class Grid:
+    """Οι προϋπολογισμένες μονάδες (γραμμές, στήλες, κουτιά) και οι γείτονες κάθε κελιού"""
+    def __init__(self, box):
+        self.box = box
+        self.n = n = box * box
+        self.size = n * n
+        self.cells = range(self.size)
+        self.digits = range(1, n + 1)
+        self.row_of = [i // n for i in self.cells]
+        self.col_of = [i % n for i in self.cells]
+        self.box_of = [(i // n) // box * box + (i % n) // box for i in self.cells]
+        self.rows = [[r*n + c for c in range(n)] for r in range(n)]
+        self.cols = [[r*n + c for r in range(n)] for c in range(n)]
+        self.boxes = [[] for _ in range(n)]
+        for i in self.cells:
+            self.boxes[self.box_of[i]].append(i)
+        self.units = self.rows + self.cols + self.boxes
+        self.peers = []
+        for i in self.cells:
+            ps = set(self.rows[self.row_of[i]]) | set(self.cols[self.col_of[i]]) | set(self.boxes[self.box_of[i]])
+            ps.discard(i)
+            self.peers.append(tuple(sorted(ps)))
+        self.peer_sets = [frozenset(p) for p in self.peers]
+
+@lru_cache(maxsize=None)
+def grid(box):
+    return Grid(box)
+
+def box_for_size(cells):
+    """Πλήθος κελιών (16, 81, 256, 625, ...) -> μέγεθος κουτιού"""
+    box = round(cells ** 0.25)
+    if box < 2 or box ** 4 != cells:
+        raise ValueError(f"not a square sudoku: {cells} cells")
+    return box
+
+#---------- Είσοδος / Έξοδος ----------
+def parse(line):
+    """Μορφή μίας γραμμής ('.'/'0' για κενά) -> (grid, αρχικές τιμές {κελί: τιμή})"""
+    line = line.strip()
+    g = grid(box_for_size(len(line)))
+    initial = {}
+    for i, ch in enumerate(line):
+        if ch in BLANKS: continue
+        v = SYMBOLS.find(ch.upper()) + 1
+        if not 1 <= v <= g.n:
+            raise ValueError(f"bad symbol {ch!r} at cell {i}")
+        initial[i] = v
+    return g, initial
+
+def to_line(g, sol):
+    return ''.join(SYMBOLS[sol[i]-1] if i in sol else '.' for i in g.cells)
+
+def format_grid(g, sol):
+    """Πλέγμα για εκτύπωση, μία γραμμή ανά σειρά ('0' για κενό κελί)"""
+    return '\n'.join(' '.join(SYMBOLS[sol[i]-1] if i in sol else '0' for i in row) for row in g.rows)
+
+def initial_domains(g, initial):
+    """Domain για κάθε κελί: όλα τα ψηφία ή μόνο η δοσμένη τιμή"""
+    return {i: [initial[i]] if i in initial else list(g.digits) for i in g.cells}
+
+#---------- Constraints ----------
+def consistent(g, sol, var, value):
+    """Ελέγχει περιορισμούς για σειρά, στήλη και κουτί μέσω της λίστας γειτόνων"""
+    for p in g.peers[var]:
+        if sol.get(p) == value:
+            return False
+    return True
+
+#---------- Bitmasks ----------
+# Ένα σύνολο τιμών ως int: η τιμή v αντιστοιχεί στο bit 1 << (v-1)
+def bit(v): return 1 << (v - 1)
+def full_mask(g): return (1 << g.n) - 1
+
+def mask_values(mask):
+    """Οι τιμές ενός mask σε αύξουσα σειρά"""
+    while mask:
+        b = mask & -mask
+        yield b.bit_length()
+        mask ^= b
+
+#---------- Διάδοση σε masks ----------
+# Κατάσταση ως λίστα domains-masks (μία ανά κελί): η μερική ανάθεση είναι τα κελιά με ένα
+# bit και τα υπόλοιπα είναι τα ήδη κλαδεμένα domains (sudoku_parallel, sudoku_local).
+def single(m):
+    return m & (m - 1) == 0
+
+def propagate_masks(g, dom, queue):
+    """Naked singles (από τα κελιά του queue) και hidden singles μέχρι να μην αλλάζει τίποτα.
+    Αλλάζει το dom επί τόπου· False σε αντίφαση."""
+    peers, full = g.peers, full_mask(g)
+    while True:
+        while queue:
+            x = queue.pop()
+            m = dom[x]
+            for p in peers[x]:
+                if dom[p] & m:
+                    d = dom[p] & ~m
+                    if not d:
+                        return False
+                    dom[p] = d
+                    if single(d):
+                        queue.append(p)
+        for unit in g.units:
+            once = twice = 0
+            for c in unit:
+                d = dom[c]
+                twice |= once & d
+                once |= d
+            if once != full:
+                return False                # κάποιο ψηφίο δεν χωράει πουθενά
+            only = once & ~twice
+            if only:
+                for c in unit:
+                    d = dom[c] & only
+                    if d and dom[c] != d:
+                        if not single(d):
+                            return False
+                        dom[c] = d
+                        queue.append(c)
+        if not queue:
+            return True
+
+def root_state(g, initial):
+    """Domains-masks των δοσμένων τιμών μετά τη διάδοση (None σε αντίφαση)"""
+    full = full_mask(g)
+    dom = [full] * g.size
+    for var, value in initial.items():
+        dom[var] = bit(value)
+    return dom if propagate_masks(g, dom, list(initial)) else None
+
+#---------- Απαρίθμηση λύσεων ----------
+# Οι μηχανές (mac_search_iter, forward_checking_iter, best_first_iter, ...) είναι γεννήτριες
+# που δίνουν κάθε λύση μόλις βρεθεί, οπότε η αναζήτηση σταματά όταν σταματήσει ο καταναλωτής.
+def take_solutions(solutions, max_solutions=None, count_only=False):
+    """Τραβά έως max_solutions λύσεις (None ή 0 = όλες) από τη γεννήτρια και την κλείνει.
+    Επιστρέφει λίστα αντιγράφων ή, με count_only, μόνο το πλήθος (χωρίς να κρατά λύσεις)."""
+    found = 0
+    kept = []
+    try:
+        for sol in solutions:
+            found += 1
+            if not count_only:
+                kept.append(sol.copy())
+            if max_solutions and found >= max_solutions:
+                break
+    finally:
+        solutions.close()
+    return found if count_only else kept
+
+def is_unique(solutions):
+    """Έλεγχος μοναδικότητας: αρκεί να βρεθούν το πολύ δύο λύσεις"""
+    return take_solutions(solutions, 2, count_only=True) == 1
+
+#---------- Solvers ----------
+# Κάθε engine είναι μια υποκλάση του Solver. Τα στατιστικά και οι επιλογές ανήκουν στο
+# αντικείμενο και όχι στο module, οπότε πολλοί solvers μπορούν να λύνουν ταυτόχρονα (threads,
+# processes, async) χωρίς να επηρεάζει ο ένας τον άλλον. Ένα αντικείμενο λύνει ένα puzzle τη φορά.
+class Solver:
+    """Βάση των engines: solutions_of(g, initial) -> γεννήτρια λύσεων, στατιστικά στο αντικείμενο"""
+    counters = ("tree_nodes", "solution_leaves", "failure_leaves")
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        for name in self.counters:
+            setattr(self, name, 0)
+
+    def stats(self):
+        return {name: getattr(self, name) for name in self.counters}
+
+    def solutions_of(self, g, initial):
+        """Γεννήτρια που δίνει κάθε λύση μόλις βρεθεί (το ίδιο dict, αντίγραφο αν πρέπει να κρατηθεί)"""
+        raise NotImplementedError
+
+    def solve(self, puzzle, max_solutions=None):
+        """puzzle (γραμμή ή (g, initial)) -> λίστα λύσεων έως max_solutions, με μηδενισμένα στατιστικά"""
+        g, initial = parse(puzzle) if isinstance(puzzle, str) else puzzle
+        self.reset()
+        return take_solutions(self.solutions_of(g, initial), max_solutions)
+
+    def report(self, title, g, solutions):
+        """Εκτύπωση των λύσεων και των στατιστικών όπως τη δίνουν τα scripts"""
+        print(f"\nΑΠΟΤΕΛΕΣΜΑΤΑ SUDOKU {g.n}x{g.n} ΜΕ {title}")
+        print("--------------------------------------------------")
+        for sol in solutions:
+            print(format_grid(g, sol))
+            print('')  # κενή γραμμή μεταξύ λύσεων
+
+        print("Στατιστικά δέντρου αναζήτησης:")
+        print(f"Συνολικοί κόμβοι: {self.tree_nodes}")
+        print(f"Φύλλα λύσης: {self.solution_leaves}, Φύλλα αποτυχίας: {self.failure_leaves}")
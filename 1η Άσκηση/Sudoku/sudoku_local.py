@@ -0,0 +1,217 @@
+import argparse, math, os, random, time
+
+import MacForSudoku
+from sudoku_grid import parse, to_line, bit, mask_values, single, root_state, Solver
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+#---------- Αρχική κατάσταση ----------
+# Οι δοσμένες τιμές και όσες βγαίνουν από naked/hidden singles μένουν σταθερές. Κάθε κουτί
+# γεμίζει με τα ψηφία που του λείπουν (άρα είναι πάντα μετάθεση) και κάθε κίνηση ανταλλάσσει
+# δύο ελεύθερα κελιά του ίδιου κουτιού, οπότε συγκρούσεις υπάρχουν μόνο σε γραμμές και στήλες.
+def fill_boxes(g, dom, rng):
+    """Κάθε ελεύθερο κελί παίρνει ένα ψηφίο του domain του, διαφορετικό μέσα στο κουτί
+    (ταίριασμα με επαυξάνοντα μονοπάτια). None αν κάποιο κουτί δεν γεμίζει (χωρίς λύση)."""
+    sol = [d.bit_length() if single(d) else 0 for d in dom]
+    for box in g.boxes:
+        owner = {}                              # ψηφίο -> κελί
+
+        def augment(i, seen):
+            digits = list(mask_values(dom[i]))
+            rng.shuffle(digits)
+            for v in digits:
+                if v not in seen:
+                    seen.add(v)
+                    if v not in owner or augment(owner[v], seen):
+                        owner[v] = i
+                        return True
+            return False
+
+        free = [i for i in box if not sol[i]]
+        for i in rng.sample(free, len(free)):
+            if not augment(i, set()):
+                return None
+        for v, i in owner.items():
+            sol[i] = v
+    return sol
+
+#---------- Συγκρούσεις ----------
+# Γραμμές 0..n-1 και στήλες n..2n-1: count[l][v] = πόσες φορές εμφανίζεται το v στη γραμμή l
+# και bad[l] = Σ max(0, count - 1). Το κόστος είναι Σ bad, άρα 0 ακριβώς στη λύση.
+def line_counts(g, sol):
+    n = g.n
+    count = [[0] * (n + 1) for _ in range(2 * n)]
+    for i in g.cells:
+        count[g.row_of[i]][sol[i]] += 1
+        count[n + g.col_of[i]][sol[i]] += 1
+    bad = [sum(k - 1 for k in c if k > 1) for c in count]
+    return count, bad
+
+def swap_delta(count, la, lb, va, vb):
+    """Αλλαγή κόστους όταν το va πάει από τη γραμμή la στη lb και το vb αντίστροφα (O(1))"""
+    if la == lb:
+        return 0
+    ca, cb = count[la], count[lb]
+    return (ca[vb] >= 1) - (ca[va] >= 2) + (cb[va] >= 1) - (cb[vb] >= 2)
+
+def apply_swap(count, bad, la, lb, va, vb):
+    if la == lb:
+        return
+    for l, out, into in ((la, va, vb), (lb, vb, va)):
+        c = count[l]
+        if c[out] > 1: bad[l] -= 1
+        c[out] -= 1
+        if c[into] >= 1: bad[l] += 1
+        c[into] += 1
+
+#---------- Min-conflicts ----------
+# Κάθε βήμα διαλέγει μια τυχαία γραμμή/στήλη με bad > 0 και ανταλλάσσει ένα ελεύθερο κελί της
+# που συγκρούεται με ένα κελί του κουτιού του, κρατώντας και τα δύο μέσα στα domains τους.
+#   tabu:   η καλύτερη ανταλλαγή όλων των κελιών σε σύγκρουση της γραμμής (ακόμη κι αν
+#           χειροτερεύει), που δεν ξαναβάζει μια τιμή σε κελί από το οποίο έφυγε πριν από
+#           λιγότερα από tenure..2·tenure βήματα, εκτός αν δίνει νέο ελάχιστο κόστος·
+#           μετά από restart_after βήματα χωρίς νέο ελάχιστο ξεκινά από νέο γέμισμα
+#   anneal: τυχαία ανταλλαγή ενός κελιού, δεκτή με πιθανότητα exp(-Δ/T) αν χειροτερεύει·
+#           η T πέφτει γεωμετρικά ως το min_temperature (πιο κάτω η αναζήτηση κολλάει)
+def min_conflicts(stats, g, sol, dom, rng, max_steps, method="tabu", tenure=3,
+                  temperature=0.5, cooling=0.9999, min_temperature=0.35, restart_after=1000):
+    """Αλλάζει το sol επί τόπου μέχρι κόστος 0 ή max_steps βήματα· True αν βρέθηκε λύση"""
+    n = g.n
+    row, col = g.row_of, [n + c for c in g.col_of]
+    lines = g.rows + g.cols
+    fixed = [single(d) for d in dom]
+    partners = [[j for j in g.boxes[g.box_of[i]] if j != i and not fixed[j]] for i in g.cells]
+    count, bad = line_counts(g, sol)
+    cost = best = sum(bad)
+    tabu = {}                                   # (κελί, τιμή) -> βήμα έως το οποίο απαγορεύεται
+    temp = temperature
+    steps = last = 0
+    while cost and steps < max_steps:
+        steps += 1
+        if method == "tabu" and steps - last > restart_after:
+            # καμία βελτίωση του ελάχιστου για restart_after βήματα: νέο τυχαίο γέμισμα
+            sol[:] = fill_boxes(g, dom, rng)
+            count, bad = line_counts(g, sol)
+            cost = best = sum(bad)
+            tabu.clear()
+            temp, last = temperature, steps
+            stats.restarts += 1
+        l = rng.choice([l for l in range(2 * n) if bad[l]])
+        c = count[l]
+        conflicted = [i for i in lines[l] if not fixed[i] and c[sol[i]] > 1]
+        if method == "tabu":
+            moves, low = [], None
+            for a in conflicted:
+                va, ra, ca, da = sol[a], row[a], col[a], dom[a]
+                for b in partners[a]:
+                    vb = sol[b]
+                    if not (da & bit(vb) and dom[b] & bit(va)):
+                        continue
+                    d = swap_delta(count, ra, row[b], va, vb) + swap_delta(count, ca, col[b], va, vb)
+                    if (tabu.get((a, vb), 0) > steps or tabu.get((b, va), 0) > steps) and cost + d >= best:
+                        continue
+                    if low is None or d < low:
+                        moves, low = [(a, b)], d
+                    elif d == low:
+                        moves.append((a, b))
+            if not moves:
+                continue
+            (a, b), d = rng.choice(moves), low
+        else:
+            a = rng.choice(conflicted)
+            va, da = sol[a], dom[a]
+            moves = [b for b in partners[a] if da & bit(sol[b]) and dom[b] & bit(va)]
+            if not moves:
+                continue
+            b = rng.choice(moves)
+            d = swap_delta(count, row[a], row[b], va, sol[b]) + swap_delta(count, col[a], col[b], va, sol[b])
+            temp = max(temp * cooling, min_temperature)
+            if d > 0 and rng.random() >= math.exp(-d / temp):
+                continue
+        va, vb, ra, ca = sol[a], sol[b], row[a], col[a]
+        apply_swap(count, bad, ra, row[b], va, vb)
+        apply_swap(count, bad, ca, col[b], va, vb)
+        sol[a], sol[b] = vb, va
+        tabu[(a, va)] = tabu[(b, vb)] = steps + tenure + rng.randrange(tenure)
+        cost += d
+        if cost < best:
+            best, last = cost, steps
+    stats.steps += steps
+    return cost == 0
+
+class MinConflictsSolver(Solver):
+    """Πρώτη λύση με τοπική αναζήτηση· αν δεν βρεθεί σε max_steps βήματα (ή ζητηθούν κι άλλες
+    λύσεις) συνεχίζει ο συστηματικός solver του fallback, που αποδεικνύει και τη μοναδικότητα"""
+    counters = Solver.counters + ("steps", "restarts", "fallbacks", "local_time")
+
+    def __init__(self, method="tabu", max_steps=200000, seed=0, tenure=3, restart_after=1000, fallback=None):
+        super().__init__()
+        self.method, self.max_steps, self.seed = method, max_steps, seed
+        self.tenure, self.restart_after = tenure, restart_after
+        self.fallback = fallback or (lambda: MacForSudoku.MacSolver("subsets"))
+
+    def solutions_of(self, g, initial):
+        t0 = time.perf_counter()
+        dom = root_state(g, initial)
+        rng = random.Random(self.seed)
+        sol = dom and fill_boxes(g, dom, rng)
+        if not sol:
+            # αντίφαση στη διάδοση ή κουτί χωρίς ταίριασμα: δεν υπάρχει λύση
+            self.failure_leaves += 1
+            self.local_time += time.perf_counter() - t0
+            return
+        found = min_conflicts(self, g, sol, dom, rng, self.max_steps, self.method, self.tenure,
+                              restart_after=self.restart_after)
+        self.local_time += time.perf_counter() - t0
+        if found:
+            self.solution_leaves += 1
+            yield dict(enumerate(sol))
+        else:
+            self.fallbacks += 1
+        solver = self.fallback()
+        try:
+            for s in solver.solutions_of(g, initial):
+                if found and all(s[i] == sol[i] for i in g.cells):
+                    solver.solution_leaves -= 1     # η λύση της τοπικής αναζήτησης
+                    continue
+                yield s
+        finally:
+            for name in Solver.counters:
+                setattr(self, name, getattr(self, name) + getattr(solver, name))
+
+#---------- Εκτέλεση ----------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Min-conflicts (tabu ή simulated annealing) για μεγάλα Sudoku")
+    parser.add_argument("puzzles", nargs="?", default=os.path.join(HERE, "corpus", "25x25_hard.txt"),
+                        help="puzzle μίας γραμμής ή αρχείο με ένα puzzle ανά γραμμή")
+    parser.add_argument("--method", default="tabu", choices=["tabu", "anneal"])
+    parser.add_argument("--max-steps", type=int, default=200000, help="βήματα πριν από τον συστηματικό solver")
+    parser.add_argument("--tenure", type=int, default=3)
+    parser.add_argument("--restart-after", type=int, default=1000, help="βήματα χωρίς βελτίωση πριν από νέο γέμισμα (tabu)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--level", default="subsets", choices=MacForSudoku.LEVELS, help="διάδοση του fallback")
+    parser.add_argument("--grid", action="store_true", help="εκτύπωση των λύσεων ως πλέγμα")
+    args = parser.parse_args()
+    if os.path.isfile(args.puzzles):
+        with open(args.puzzles) as f:
+            lines = [line.strip() for line in f if line.strip()]
+    else:
+        lines = [args.puzzles]
+
+    solver = MinConflictsSolver(args.method, args.max_steps, args.seed, args.tenure, args.restart_after,
+                                lambda: MacForSudoku.MacSolver(args.level))
+    steps = local_time = 0
+    for line in lines:
+        g, initial = parse(line)
+        t0 = time.perf_counter()
+        solutions = solver.solve((g, initial), 1)
+        elapsed = time.perf_counter() - t0
+        steps += solver.steps
+        local_time += solver.local_time
+        if args.grid:
+            solver.report(f"MIN-CONFLICTS ({args.method})", g, solutions)
+        else:
+            print(to_line(g, solutions[0]) if solutions else "χωρίς λύση")
+        print(f"  {solver.steps} βήματα, {solver.restarts} restarts, {solver.steps / max(solver.local_time, 1e-9):.0f} βήματα/s, "
+              f"fallback: {'ναι' if solver.fallbacks else 'όχι'}, {elapsed:.3f}s")
+    print(f"\n{len(lines)} puzzles, {steps} βήματα, {steps / max(local_time, 1e-9):.0f} βήματα/s ({args.method})")
@@ -0,0 +1,131 @@
+import argparse, itertools, os, time
+from functools import lru_cache
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError("sudoku_numpy χρειάζεται το numpy (pip install numpy)") from e
+
+from sudoku_grid import grid, box_for_size, SYMBOLS, BLANKS
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+#---------- Tensor υποψηφίων ----------
+# B πίνακες ως bool tensor cand[b, κελί, ψηφίο-1]. Οι μονάδες (γραμμές, στήλες, κουτιά)
+# είναι ένας πίνακας δεικτών (3N, N), οπότε κάθε κανόνας είναι μια αναγωγή στον άξονα
+# των κελιών μιας μονάδας για όλους τους πίνακες μαζί.
+@lru_cache(maxsize=None)
+def indices(box):
+    """(κελιά κάθε μονάδας (3N, N), μονάδες κάθε κελιού (N², 3))"""
+    g = grid(box)
+    unit_cells = np.array(g.units, dtype=np.intp)
+    cell_units = np.array([(g.row_of[i], g.n + g.col_of[i], 2*g.n + g.box_of[i]) for i in g.cells],
+                          dtype=np.intp)
+    return unit_cells, cell_units
+
+def to_tensor(g, lines):
+    """Γραμμές puzzle ίδιου μεγέθους -> cand (B, N², N)"""
+    lut = np.zeros(256, dtype=np.int64)                 # χαρακτήρας -> ψηφίο (0 = κενό)
+    for v, ch in enumerate(SYMBOLS[:g.n], 1):
+        lut[ord(ch)] = lut[ord(ch.lower())] = v
+    for ch in BLANKS:
+        lut[ord(ch)] = 0
+    raw = np.frombuffer(''.join(lines).encode('ascii'), dtype=np.uint8).reshape(len(lines), g.size)
+    values = lut[raw]
+    cand = np.ones((len(lines), g.size, g.n), dtype=bool)
+    given = values > 0
+    cand[given] = False
+    b, c = np.nonzero(given)
+    cand[b, c, values[given] - 1] = True
+    return cand
+
+def to_lines(g, cand):
+    """Κελιά με ένα υποψήφιο -> σύμβολο, τα υπόλοιπα '.'"""
+    symbols = np.frombuffer(('.' + SYMBOLS[:g.n]).encode('ascii'), dtype=np.uint8)
+    single = cand.sum(axis=2) == 1
+    digit = np.where(single, cand.argmax(axis=2) + 1, 0)
+    return [row.tobytes().decode('ascii') for row in symbols[digit]]
+
+#---------- Διάδοση ----------
+def propagate(g, cand):
+    """Naked και hidden singles σε όλους τους πίνακες μέχρι να μην αλλάζει κανένας.
+    Αλλάζει το cand επί τόπου και επιστρέφει dead (B,): πίνακες που βρέθηκαν αντιφατικοί."""
+    unit_cells, cell_units = indices(g.box)
+    dead = np.zeros(len(cand), dtype=bool)
+    rounds = 0
+    while True:
+        rounds += 1
+        before = cand.sum()
+        # naked singles: ένα ψηφίο τοποθετημένο σε μονάδα φεύγει από τα άλλα κελιά της
+        placed = cand & (cand.sum(axis=2) == 1)[:, :, None]
+        in_unit = placed[:, unit_cells, :].sum(axis=2)              # (B, 3N, N)
+        dead |= (in_unit > 1).any(axis=(1, 2))
+        taken = (in_unit > 0)[:, cell_units, :].any(axis=2)         # (B, N², N)
+        cand &= ~taken | placed
+        # hidden singles: ψηφίο με μία μόνο θέση σε μονάδα μπαίνει σε εκείνο το κελί
+        places = cand[:, unit_cells, :].sum(axis=2)                 # (B, 3N, N)
+        dead |= (places == 0).any(axis=(1, 2))
+        hidden = (places == 1)[:, cell_units, :].any(axis=2) & cand
+        forced = hidden.any(axis=2)
+        dead |= (hidden.sum(axis=2) > 1).any(axis=1)
+        cand[forced] = hidden[forced]
+        dead |= (cand.sum(axis=2) == 0).any(axis=1)
+        if cand.sum() == before:
+            return dead, rounds
+
+def solved(cand, dead):
+    return ~dead & (cand.sum(axis=2) == 1).all(axis=1)
+
+#---------- Batch ----------
+def presolve(lines, batch=4096):
+    """Για κάθε γραμμή (με τη σειρά εισόδου): ('solved', λύση), ('dead', None)
+    ή ('open', γραμμή με τα διαδομένα singles) για τους backtracking solvers.
+    Διαβάζει έως batch γραμμές τη φορά και φτιάχνει ένα tensor ανά μέγεθος πλέγματος."""
+    it = iter(lines)
+    while block := list(itertools.islice(it, batch)):
+        by_len = {}
+        for k, line in enumerate(block):
+            by_len.setdefault(len(line), []).append(k)
+        results = [None] * len(block)
+        for length, ks in by_len.items():
+            g = grid(box_for_size(length))
+            cand = to_tensor(g, [block[k] for k in ks])
+            dead, _ = propagate(g, cand)
+            done = solved(cand, dead)
+            out = to_lines(g, cand)
+            for j, k in enumerate(ks):
+                if dead[j]: results[k] = ("dead", None)
+                elif done[j]: results[k] = ("solved", out[j])
+                else: results[k] = ("open", out[j])
+        yield from results
+
+#---------- Εκτέλεση ----------
+if __name__ == "__main__":
+    import sudoku_batch
+
+    parser = argparse.ArgumentParser(description="Διάδοση singles σε NumPy για πολλά puzzles μαζί και backtracking μόνο στα υπόλοιπα")
+    parser.add_argument("corpus", nargs="?", default=os.path.join(HERE, "corpus", "9x9_36.txt"))
+    parser.add_argument("--batch", type=int, default=4096, help="πίνακες ανά tensor")
+    parser.add_argument("--engine", default="dlx_search", choices=list(sudoku_batch.ENGINES))
+    args = parser.parse_args()
+    with open(args.corpus) as f:
+        lines = [line.strip() for line in f if line.strip()]
+
+    t0 = time.perf_counter()
+    counts = {"solved": 0, "dead": 0, "open": 0}
+    rest = []
+    for status, line in presolve(lines, args.batch):
+        counts[status] += 1
+        if status == "open":
+            rest.append(line)
+    t_np = time.perf_counter() - t0
+    solver = sudoku_batch.ENGINES[args.engine](sudoku_batch.MAC_LEVEL)
+    for line in rest:
+        solver.solve(line, 1)
+    elapsed = time.perf_counter() - t0
+
+    print(f"\nNUMPY PRESOLVE: {len(lines)} puzzles ({os.path.basename(args.corpus)})")
+    print("--------------------------------------------------")
+    print(f"Λύθηκαν με διάδοση: {counts['solved']}, αντιφατικά: {counts['dead']}, για backtracking: {counts['open']}")
+    print(f"Χρόνος διάδοσης: {t_np:.3f}s, συνολικός ({args.engine} στα υπόλοιπα): {elapsed:.3f}s "
+          f"({len(lines)/elapsed:.0f} puzzles/s)")
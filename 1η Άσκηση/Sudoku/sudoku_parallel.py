@@ -0,0 +1,208 @@
+import argparse, multiprocessing as mp, os, queue, time
+
+from sudoku_grid import parse, to_line, single, propagate_masks, root_state
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+#---------- Κατάσταση ----------
+# Ένα υποπρόβλημα είναι μια κατάσταση domains-masks του sudoku_grid (root_state/propagate_masks).
+def branch(g, dom):
+    """Κελί MRV (ή None αν λύθηκε)"""
+    var, best = None, g.n + 1
+    for i, d in enumerate(dom):
+        if not single(d):
+            c = d.bit_count()
+            if c < best:
+                var, best = i, c
+                if c == 2: break
+    return var
+
+def children(g, dom, var, values):
+    """Τα παιδιά για τις τιμές του mask values, μετά τη διάδοση"""
+    while values:
+        b = values & -values
+        values ^= b
+        child = dom[:]
+        child[var] = b
+        if propagate_masks(g, child, [var]):
+            yield child
+
+def solution_line(g, dom):
+    return to_line(g, {i: d.bit_length() for i, d in enumerate(dom)})
+
+#---------- Αναζήτηση με δυνατότητα κλοπής ----------
+# Κάθε worker κρατά ρητή στοίβα [(κατάσταση, κελί, τιμές που δεν δοκιμάστηκαν)].
+# Όταν κάποιος worker περιμένει και η ουρά είναι άδεια, ο απασχολημένος δίνει τις
+# αδοκίμαστες τιμές του ρηχότερου επιπέδου του (τα μεγαλύτερα υποδέντρα) ως νέες εργασίες.
+STEAL_CHECK = 64            # κόμβοι ανάμεσα σε ελέγχους για stop/κλοπή
+
+def dfs(g, dom, on_solution, should_stop, donate=None):
+    """DFS από την κατάσταση dom. on_solution(line) -> True για να σταματήσει.
+    Επιστρέφει (κόμβοι, πλήθος δωρεών)."""
+    nodes = gifts = 0
+    var = branch(g, dom)
+    if var is None:
+        on_solution(solution_line(g, dom))
+        return 1, 0
+    stack = [(dom, var, dom[var])]
+    while stack:
+        state, var, values = stack[-1]
+        if not values:
+            stack.pop()
+            continue
+        b = values & -values
+        stack[-1] = (state, var, values ^ b)
+        child = state[:]
+        child[var] = b
+        nodes += 1
+        if nodes % STEAL_CHECK == 0:
+            if should_stop():
+                break
+            if donate is not None:
+                for k, (s, v, rest) in enumerate(stack):
+                    if rest and donate(s, v, rest):
+                        stack[k] = (s, v, 0)
+                        gifts += 1
+                        break
+        if not propagate_masks(g, child, [var]):
+            continue
+        nxt = branch(g, child)
+        if nxt is None:
+            if on_solution(solution_line(g, child)):
+                break
+        else:
+            stack.append((child, nxt, child[nxt]))
+    return nodes, gifts
+
+#---------- Workers ----------
+def worker(box, tasks, results, stop, pending, idle, max_solutions, found):
+    from sudoku_grid import grid
+    g = grid(box)
+    tasks.cancel_join_thread()          # στο stop μπορεί να μείνουν εργασίες στην ουρά
+
+    def on_solution(line):
+        with found.get_lock():
+            if max_solutions and found.value >= max_solutions:
+                return True
+            found.value += 1
+            done = bool(max_solutions) and found.value >= max_solutions
+        results.put(("solution", line))
+        if done:
+            stop.set()
+        return done
+
+    def donate(state, var, rest):
+        # δίνει μόνο όταν κάποιος περιμένει και δεν υπάρχει ήδη δουλειά στην ουρά
+        if idle.value == 0 or tasks.qsize() > 0:
+            return False
+        for child in children(g, state, var, rest):
+            with pending.get_lock():
+                pending.value += 1
+            tasks.put(child)
+        return True
+
+    nodes = gifts = 0
+    waiting = False
+    while not stop.is_set():
+        try:
+            dom = tasks.get(timeout=0.02)
+        except queue.Empty:
+            if not waiting:
+                waiting = True
+                with idle.get_lock(): idle.value += 1
+            if pending.value == 0:
+                break
+            continue
+        if waiting:
+            waiting = False
+            with idle.get_lock(): idle.value -= 1
+        n, k = dfs(g, dom, on_solution, stop.is_set, donate)
+        nodes += n; gifts += k
+        with pending.get_lock():
+            pending.value -= 1
+    results.put(("stats", nodes, gifts))
+
+def split(g, dom, parts):
+    """Ανάπτυξη κατά πλάτος των πρώτων επιπέδων μέχρι να υπάρχουν τουλάχιστον parts υποπροβλήματα"""
+    frontier = [dom]
+    while 0 < len(frontier) < parts:
+        nxt = []
+        for state in frontier:
+            var = branch(g, state)
+            if var is None:
+                nxt.append(state)           # ήδη λυμένο: μένει ως έχει
+            else:
+                nxt.extend(children(g, state, var, state[var]))
+        if len(nxt) == len(frontier):
+            break
+        frontier = nxt
+    return frontier
+
+def solve_parallel(g, initial, workers, max_solutions=1, split_factor=4):
+    """Λύνει ένα puzzle με workers διεργασίες -> (λύσεις, κόμβοι, δωρεές, χρόνος).
+    max_solutions 0 ή None = όλες οι λύσεις (όπως στο take_solutions)."""
+    t0 = time.perf_counter()
+    max_solutions = max_solutions or 0
+    dom = root_state(g, initial)
+    if dom is None:
+        return [], 0, 0, time.perf_counter() - t0
+    tasks, results = mp.Queue(), mp.Queue()
+    stop = mp.Event()
+    pending, idle, found = mp.Value('i', 0), mp.Value('i', 0), mp.Value('i', 0)
+    parts = split(g, dom, workers * split_factor)
+    pending.value = len(parts)
+    for part in parts:
+        tasks.put(part)
+    procs = [mp.Process(target=worker, args=(g.box, tasks, results, stop, pending, idle, max_solutions, found))
+             for _ in range(workers)]
+    for p in procs:
+        p.start()
+    solutions, nodes, gifts, finished = [], 0, 0, 0
+    try:
+        while finished < workers:
+            try:
+                msg = results.get(timeout=0.1)
+            except queue.Empty:
+                # ένας worker που πέθανε (exception, kill) δεν στέλνει ποτέ stats και η εργασία
+                # του μένει στο pending, άρα χωρίς αυτόν τον έλεγχο θα περιμέναμε για πάντα
+                dead = [p for p in procs if p.exitcode not in (None, 0)]
+                if dead:
+                    raise RuntimeError(f"worker {dead[0].pid} τερματίστηκε με κωδικό {dead[0].exitcode}")
+                continue
+            if msg[0] == "solution":
+                solutions.append(msg[1])
+            else:
+                finished += 1
+                nodes += msg[1]; gifts += msg[2]
+    finally:
+        stop.set()
+        for p in procs:
+            p.join(1)
+            if p.is_alive():
+                p.terminate()
+                p.join()
+        tasks.cancel_join_thread()
+    return solutions, nodes, gifts, time.perf_counter() - t0
+
+#---------- Εκτέλεση ----------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Παράλληλη αναζήτηση ενός δύσκολου puzzle με διαμοιρασμό υποδέντρων")
+    parser.add_argument("puzzle", nargs="?", help="puzzle μίας γραμμής (προεπιλογή: το πρώτο του corpus)")
+    parser.add_argument("--corpus", default=os.path.join(HERE, "corpus", "25x25_hard.txt"))
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--max-solutions", type=int, default=1, help="σταματά μετά από τόσες λύσεις (0 = όλες)")
+    parser.add_argument("--split", type=int, default=4, help="αρχικά υποπροβλήματα ανά worker (τα υπόλοιπα με κλοπή)")
+    args = parser.parse_args()
+    if args.puzzle is None:
+        with open(args.corpus) as f:
+            args.puzzle = f.readline().strip()
+    g, initial = parse(args.puzzle)
+
+    print(f"\nΠΑΡΑΛΛΗΛΗ ΑΝΑΖΗΤΗΣΗ SUDOKU {g.n}x{g.n} ({os.cpu_count()} CPU)")
+    print("--------------------------------------------------")
+    print(f"{'workers':>7} {'λύσεις':>7} {'κόμβοι':>9} {'δωρεές':>7} {'χρόνος(s)':>10} {'speedup':>8}")
+    base = None
+    for w in args.workers:
+        sols, nodes, gifts, elapsed = solve_parallel(g, initial, w, args.max_solutions, args.split)
+        base = base or elapsed
+        print(f"{w:>7} {len(sols):>7} {nodes:>9} {gifts:>7} {elapsed:>10.3f} {base/elapsed:>8.2f}")
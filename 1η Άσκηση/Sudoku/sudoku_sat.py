@@ -0,0 +1,297 @@
+import argparse, heapq, itertools
+
+from MacForSudoku import luby
+from sudoku_grid import parse, Solver
+
+#---------- Sudoku Setup ----------
+#αρχική κατάσταση 4x4 σε μορφή μίας γραμμής (γραμμή 0 = πάνω, '.' = κενό)
+INITIAL = "...3.4....32...."
+
+#---------- CNF ----------
+# Μεταβλητή x = κελί·N + τιμή (1..N³): αληθής όταν το κελί έχει την τιμή.
+# Οι περιορισμοί του consistent ως "ακριβώς ένα": κάθε κελί έχει μία τιμή και κάθε ψηφίο
+# εμφανίζεται μία φορά σε κάθε γραμμή/στήλη/κουτί (μία clause "τουλάχιστον ένα" και clauses
+# ανά ζεύγος για το "το πολύ ένα"). Οι δοσμένες τιμές είναι unit clauses, όπως και η άρνηση
+# κάθε μεταβλητής που αποκλείουν· οι clauses που ικανοποιούν ήδη παραλείπονται, οπότε ο τύπος
+# είναι ισοδύναμος με τον πλήρη αλλά πολύ μικρότερος (ο πλήρης 25x25 έχει ~750000 clauses).
+def cell_var(g, i, v):
+    return i * g.n + v
+
+def encode(g, initial):
+    """-> (πλήθος μεταβλητών, λίστα clauses με literals ±x)"""
+    true = {cell_var(g, i, v) for i, v in initial.items()}
+    false = set()
+    for i, v in initial.items():
+        false.update(cell_var(g, i, w) for w in g.digits if w != v)
+        false.update(cell_var(g, p, v) for p in g.peers[i])
+    clauses = [[x] for x in sorted(true)] + [[-x] for x in sorted(false - true)]
+
+    def exactly_one(lits):
+        if true.intersection(lits):
+            return                      # τα υπόλοιπα είναι ήδη στα false
+        lits = [x for x in lits if x not in false]
+        clauses.append(lits)
+        clauses.extend([-a, -b] for a, b in itertools.combinations(lits, 2))
+
+    for i in g.cells:
+        exactly_one([cell_var(g, i, v) for v in g.digits])
+    for unit in g.units:
+        for v in g.digits:
+            exactly_one([cell_var(g, i, v) for i in unit])
+    return g.size * g.n, clauses
+
+def dimacs(nvars, clauses, comment=None):
+    """Ο τύπος σε μορφή DIMACS (για έλεγχο με άλλον SAT solver)"""
+    lines = [f"c {comment}"] if comment else []
+    lines.append(f"p cnf {nvars} {len(clauses)}")
+    lines.extend(' '.join(map(str, c)) + " 0" for c in clauses)
+    return '\n'.join(lines) + '\n'
+
+def decode(g, true_vars):
+    """Αληθείς μεταβλητές -> λύση {κελί: τιμή}"""
+    return {(x - 1) // g.n: (x - 1) % g.n + 1 for x in true_vars}
+
+#---------- CDCL ----------
+# Literals ±x· val[N + l] = 1 / -1 / 0 για αληθές / ψευδές / χωρίς τιμή, ώστε η τιμή ενός
+# literal να είναι ένα lookup. Κάθε clause (με ≥ 2 literals) παρακολουθεί τα c[0], c[1]
+# και εξετάζεται μόνο όταν ένα από αυτά γίνει ψευδές (two watched literals). Η clause που
+# ανάγκασε ένα literal το έχει στη θέση 0 και είναι ο λόγος (reason) της ανάθεσης.
+# Σε σύγκρουση μαθαίνεται η clause του πρώτου UIP και γίνεται backjump στο δεύτερο υψηλότερο
+# επίπεδό της. Επιλογή μεταβλητής VSIDS (heap με παλιές εγγραφές που αγνοούνται), πολικότητα
+# η τελευταία που είχε (phase saving) και restarts μετά από RESTART_BASE·luby(i) συγκρούσεις.
+# Οι μαθημένες clauses δεν σβήνονται: στα Sudoku οι συγκρούσεις είναι λίγες.
+RESTART_BASE = 100
+DECAY = 0.95
+
+class CDCL:
+    def __init__(self, nvars, clauses, stats):
+        self.N = N = nvars
+        self.stats = stats
+        self.val = [0] * (2 * N + 1)
+        self.level = [0] * (N + 1)
+        self.reason = [None] * (N + 1)
+        self.phase = [False] * (N + 1)
+        self.activity = [0.0] * (N + 1)
+        self.inc = 1.0
+        self.heap = [(0.0, x) for x in range(1, N + 1)]
+        self.seen = [False] * (N + 1)
+        self.watches = [[] for _ in range(2 * N + 1)]
+        self.trail, self.lim = [], []
+        self.qhead = 0
+        self.ok = True
+        for c in clauses:
+            if not self.add_clause(c):
+                break
+
+    def assign(self, lit, reason):
+        x = abs(lit)
+        self.val[self.N + lit], self.val[self.N - lit] = 1, -1
+        self.level[x] = len(self.lim)
+        self.reason[x] = reason
+        self.trail.append(lit)
+
+    def add_clause(self, lits):
+        """Clause στο επίπεδο 0 (αρχικές και αποκλεισμού λύσεων)· False αν ο τύπος γίνεται UNSAT"""
+        N, val = self.N, self.val
+        if any(val[N + l] == 1 for l in lits):
+            return True
+        lits = [l for l in dict.fromkeys(lits) if val[N + l] == 0]
+        if not lits:
+            self.ok = False
+        elif len(lits) == 1:
+            self.assign(lits[0], None)
+            self.ok = self.propagate() is None
+        else:
+            self.watches[N + lits[0]].append(lits)
+            self.watches[N + lits[1]].append(lits)
+        return self.ok
+
+    def propagate(self):
+        """Unit propagation από το qhead -> clause σε σύγκρουση ή None"""
+        N, val, W, trail = self.N, self.val, self.watches, self.trail
+        qhead = self.qhead
+        try:
+            while qhead < len(trail):
+                false_lit = -trail[qhead]
+                qhead += 1
+                ws = W[N + false_lit]
+                i = j = 0
+                end = len(ws)
+                while i < end:
+                    c = ws[i]
+                    i += 1
+                    if c[0] == false_lit:
+                        c[0], c[1] = c[1], false_lit
+                    first = c[0]
+                    if val[N + first] == 1:
+                        ws[j] = c
+                        j += 1
+                        continue
+                    for k in range(2, len(c)):
+                        lk = c[k]
+                        if val[N + lk] != -1:
+                            c[1], c[k] = lk, false_lit
+                            W[N + lk].append(c)
+                            break
+                    else:
+                        ws[j] = c
+                        j += 1
+                        if val[N + first] == -1:
+                            ws[j:i] = []                # κρατά τις clauses που δεν εξετάστηκαν
+                            qhead = len(trail)
+                            return c
+                        self.assign(first, c)
+                del ws[j:]
+            return None
+        finally:
+            self.stats.propagations += qhead - self.qhead
+            self.qhead = qhead
+
+    def bump(self, x):
+        a = self.activity[x] = self.activity[x] + self.inc
+        if a > 1e100:
+            self.activity = [b * 1e-100 for b in self.activity]
+            self.inc *= 1e-100
+            self.heap = [(-self.activity[y], y) for y in range(1, self.N + 1) if not self.val[self.N + y]]
+            heapq.heapify(self.heap)
+        else:
+            heapq.heappush(self.heap, (-a, x))
+
+    def analyze(self, confl):
+        """Clause του πρώτου UIP -> (learnt με το literal που αναγκάζεται πρώτο, επίπεδο backjump)"""
+        seen, level, reason, trail = self.seen, self.level, self.reason, self.trail
+        current = len(self.lim)
+        learnt = [None]
+        counter, p, idx = 0, None, len(trail) - 1
+        while True:
+            for q in (confl if p is None else confl[1:]):
+                x = abs(q)
+                if not seen[x] and level[x] > 0:
+                    seen[x] = True
+                    self.bump(x)
+                    if level[x] >= current:
+                        counter += 1
+                    else:
+                        learnt.append(q)
+            while not seen[abs(trail[idx])]:
+                idx -= 1
+            p = trail[idx]
+            idx -= 1
+            seen[abs(p)] = False
+            counter -= 1
+            if not counter:
+                break
+            confl = reason[abs(p)]
+        learnt[0] = -p
+        for q in learnt[1:]:
+            seen[abs(q)] = False
+        back = 0
+        if len(learnt) > 1:
+            k = max(range(1, len(learnt)), key=lambda k: level[abs(learnt[k])])
+            learnt[1], learnt[k] = learnt[k], learnt[1]
+            back = level[abs(learnt[1])]
+        return learnt, back
+
+    def backtrack(self, level):
+        if len(self.lim) <= level:
+            return
+        N, val, phase, reason, activity, heap = self.N, self.val, self.phase, self.reason, self.activity, self.heap
+        mark = self.lim[level]
+        for lit in self.trail[mark:]:
+            x = abs(lit)
+            phase[x] = lit > 0
+            val[N + lit] = val[N - lit] = 0
+            reason[x] = None
+            heapq.heappush(heap, (-activity[x], x))
+        del self.trail[mark:], self.lim[level:]
+        self.qhead = mark
+
+    def pick(self):
+        """Η μη ανατεθειμένη μεταβλητή με τη μεγαλύτερη δραστηριότητα (ή None)"""
+        heap, val, N, activity = self.heap, self.val, self.N, self.activity
+        while heap:
+            a, x = heapq.heappop(heap)
+            if not val[N + x] and -a == activity[x]:
+                return x
+        return None
+
+    def search(self, budget):
+        """Έως budget συγκρούσεις -> True (μοντέλο), False (UNSAT) ή None (restart)"""
+        stats, conflicts = self.stats, 0
+        while True:
+            confl = self.propagate()
+            if confl is not None:
+                conflicts += 1
+                stats.failure_leaves += 1
+                if not self.lim:
+                    return False
+                learnt, back = self.analyze(confl)
+                self.backtrack(back)
+                if len(learnt) == 1:
+                    self.assign(learnt[0], None)
+                else:
+                    self.watches[self.N + learnt[0]].append(learnt)
+                    self.watches[self.N + learnt[1]].append(learnt)
+                    self.assign(learnt[0], learnt)
+                    stats.learned += 1
+                self.inc /= DECAY
+            else:
+                if conflicts >= budget:
+                    return None
+                x = self.pick()
+                if x is None:
+                    return True
+                stats.tree_nodes += 1
+                self.lim.append(len(self.trail))
+                self.assign(x if self.phase[x] else -x, None)
+
+    def solve(self):
+        """True αν ο τύπος είναι ικανοποιήσιμος (το μοντέλο μένει στο val μέχρι το backtrack)"""
+        if not self.ok:
+            return False
+        i = 1
+        while True:
+            status = self.search(RESTART_BASE * luby(i))
+            if status is not None:
+                return status
+            self.stats.restarts += 1
+            self.backtrack(0)
+            i += 1
+
+    def model(self):
+        return [x for x in range(1, self.N + 1) if self.val[self.N + x] == 1]
+
+#---------- Solver ----------
+class SATSolver(Solver):
+    """Κωδικοποίηση σε CNF και CDCL· κάθε λύση αποκλείεται με μια clause για να βρεθεί η επόμενη"""
+    counters = Solver.counters + ("propagations", "learned", "restarts")
+
+    def solutions_of(self, g, initial):
+        cdcl = CDCL(*encode(g, initial), self)
+        while cdcl.solve():
+            sol = decode(g, cdcl.model())
+            self.solution_leaves += 1
+            yield sol
+            cdcl.backtrack(0)
+            if not cdcl.add_clause([-cell_var(g, i, v) for i, v in sol.items() if i not in initial]):
+                break
+
+#---------- Εκτέλεση ----------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sudoku ως SAT: κωδικοποίηση CNF και CDCL solver")
+    parser.add_argument("puzzle", nargs="?", default=INITIAL, help="puzzle μίας γραμμής")
+    parser.add_argument("--dimacs", help="αποθήκευση του CNF σε μορφή DIMACS")
+    parser.add_argument("--max-solutions", type=int, default=None)
+    args = parser.parse_args()
+    g, initial = parse(args.puzzle)
+    if args.dimacs:
+        nvars, clauses = encode(g, initial)
+        with open(args.dimacs, "w") as f:
+            f.write(dimacs(nvars, clauses, f"sudoku {g.n}x{g.n}: x = cell*{g.n} + value, cell = row*{g.n} + col"))
+        print(f"{args.dimacs}: {nvars} μεταβλητές, {len(clauses)} clauses")
+    solver = SATSolver()
+    solutions = solver.solve((g, initial), args.max_solutions)
+
+    #---------- Εκτύπωση Αποτελεσμάτων ----------
+    solver.report("SAT (CDCL)", g, solutions)
+    print(f"Propagations: {solver.propagations}, μαθημένες clauses: {solver.learned}, restarts: {solver.restarts}")
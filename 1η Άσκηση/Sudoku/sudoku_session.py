@@ -0,0 +1,173 @@
+import argparse, os, random, time
+from collections import OrderedDict
+
+import MacForSudoku
+from MacForSudoku import restrict, propagate, undo, remove_value
+from sudoku_grid import parse, consistent, take_solutions
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+#---------- Session ----------
+# Οι τιμές μπαίνουν μία-μία πάνω σε ένα κοινό trail: η προσθήκη κάνει μόνο τη διάδοση της
+# νέας τιμής και η αφαίρεση γυρίζει το trail στο σημείο της και ξαναβάζει μόνο τις τιμές
+# που μπήκαν μετά από αυτήν, με μία διάδοση για όλες μαζί. Οι απαντήσεις (πλήθος λύσεων έως 2
+# και μια λύση) κρατιούνται ανά σύνολο τιμών, οπότε το πήγαινε-έλα μιας τιμής δεν ψάχνει ξανά.
+ANSWERS_LIMIT = 1024
+
+class Session:
+    """Puzzle που αλλάζει μία τιμή τη φορά, με ερωτήσεις solvable()/unique() μετά από κάθε αλλαγή"""
+    def __init__(self, g, initial=(), level="subsets"):
+        self.g, self.level = g, level
+        self.domains = {i: list(g.digits) for i in g.cells}
+        self.trail = []
+        self.clues = {}                 # κελί -> τιμή, με τη σειρά προσθήκης
+        self.marks = {}                 # κελί -> μήκος του trail πριν από την τιμή του
+        self.unassigned = set(g.cells)
+        self.dead = None                # η τελευταία τιμή πριν βρεθεί αντίφαση
+        self.answers = OrderedDict()    # frozenset(τιμών) -> (πλήθος λύσεων 0/1/2, λύση ή None)
+        self.replayed = 0               # τιμές που ξαναμπήκαν σε αφαιρέσεις
+        self.removed = None             # (σύνολο τιμών πριν, κελί, τιμή) της τελευταίας αφαίρεσης
+        self.solver = MacForSudoku.MacSolver(level)     # στατιστικά όλων των αναζητήσεων του session
+        self._push(dict(initial).items())
+
+    def _push(self, items):
+        """Βάζει τις τιμές και κάνει μία διάδοση στο τέλος"""
+        last = None
+        for var, value in items:
+            self.marks[var] = len(self.trail)
+            self.clues[var] = value
+            self.unassigned.discard(var)
+            last = var
+            if self.dead is not None:
+                continue                # μετά από αντίφαση δεν έχει νόημα η διάδοση
+            if value in self.domains[var] and consistent(self.g, self.clues, var, value):
+                restrict(self.domains, var, (value,), self.trail)
+            else:
+                self.dead = var
+        if last is not None and self.dead is None:
+            if not propagate(self.g, self.domains, self.unassigned, self.trail, self.level):
+                self.dead = last
+
+    def add(self, var, value):
+        """Νέα τιμή (ή αλλαγή τιμής) στο κελί var"""
+        if self.clues.get(var) == value:
+            return
+        if var in self.clues:
+            self.remove(var)
+        self._push([(var, value)])
+
+    def remove(self, var):
+        """Αφαίρεση της τιμής του κελιού var: undo έως το σημείο της και ξανά όσες μπήκαν μετά"""
+        self.removed = (frozenset(self.clues.items()), var, self.clues[var])
+        order = list(self.clues)
+        later = [(v, self.clues[v]) for v in order[order.index(var) + 1:]]
+        undo(self.domains, self.trail, self.marks[var])
+        for v in [var] + [v for v, _ in later]:
+            del self.clues[v], self.marks[v]
+            self.unassigned.add(v)
+        if self.dead is not None and self.dead not in self.clues:
+            self.dead = None            # η αντίφαση βρέθηκε μετά το var: θα ξαναελεγχθεί
+        self._push(later)
+        self.replayed += len(later)
+
+    def candidates(self, var):
+        """Οι τιμές που απομένουν για το κελί μετά τη διάδοση"""
+        return list(self.domains[var])
+
+    def count_solutions(self):
+        """0, 1 ή 2 (= τουλάχιστον δύο) λύσεις· αναζήτηση μόνο για σύνολο τιμών που δεν έχει ξαναρωτηθεί"""
+        if self.dead is not None:
+            return 0
+        key = frozenset(self.clues.items())
+        if key in self.answers:
+            self.answers.move_to_end(key)
+            return self.answers[key][0]
+        before = None
+        if self.removed:
+            # μόνο αν μετά την αφαίρεση δεν άλλαξε τίποτα άλλο (π.χ. add σε άλλο κελί)
+            clues, var, value = self.removed
+            if key == clues - {(var, value)}:
+                before = self.answers.get(clues)
+        if before:
+            # μετά την αφαίρεση του var=value: οι λύσεις που υπήρχαν συν όσες έχουν var != value
+            count, solution = before
+            if count < 2:
+                found = self._search(2 - count, var, value)
+                count += len(found)
+                solution = solution or (found[0] if found else None)
+        else:
+            found = self._search(2)
+            count, solution = len(found), found[0] if found else None
+        self.answers[key] = (count, solution)
+        if len(self.answers) > ANSWERS_LIMIT:
+            self.answers.popitem(last=False)
+        return count
+
+    def _search(self, limit, var=None, value=None):
+        """Έως limit λύσεις (με var != value αν δοθεί) από τα διαδομένα domains, που επαναφέρονται στο τέλος"""
+        mark = len(self.trail)
+        try:
+            if var is not None:
+                remove_value(self.domains, var, value, self.trail)
+                if not propagate(self.g, self.domains, self.unassigned, self.trail, self.level):
+                    return []
+            return take_solutions(MacForSudoku.mac_search_iter(self.solver, self.g, dict(self.clues),
+                                                               set(self.unassigned), self.domains, level=self.level),
+                                  limit)
+        finally:
+            undo(self.domains, self.trail, mark)
+
+    def solution(self):
+        """Μια λύση (ή None)"""
+        return self.answers[frozenset(self.clues.items())][1] if self.count_solutions() else None
+
+    def solvable(self):
+        return self.count_solutions() > 0
+
+    def unique(self):
+        return self.count_solutions() == 1
+
+#---------- Εκτέλεση ----------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Επανάληψη ερωτήσεων μετά από αφαίρεση/προσθήκη μίας τιμής: session ή λύση από την αρχή")
+    parser.add_argument("corpus", nargs="?", default=os.path.join(HERE, "corpus", "9x9_30_s1.txt"))
+    parser.add_argument("--limit", type=int, default=5, help="μόνο τα πρώτα N puzzles")
+    parser.add_argument("--edits", type=int, default=20, help="αλλαγές ανά puzzle")
+    parser.add_argument("--level", default="subsets", choices=MacForSudoku.LEVELS[1:])
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    with open(args.corpus) as f:
+        puzzles = [parse(line) for line in f if line.strip()][:args.limit]
+    rng = random.Random(args.seed)
+
+    t_session = t_scratch = 0.0
+    edits = mismatches = 0
+    for g, initial in puzzles:
+        session = Session(g, initial, args.level)
+        session.unique()
+        for _ in range(args.edits):
+            # αφαίρεση μιας τυχαίας τιμής, ερώτηση, τιμή σε άλλο κελί, ερώτηση, αφαίρεσή της,
+            # ερώτηση, επαναφορά της πρώτης τιμής, ερώτηση
+            var = rng.choice(list(session.clues))
+            value = session.clues[var]
+            other = rng.choice([v for v in g.cells if v not in session.clues and v != var])
+            changes = (lambda: session.remove(var),
+                       lambda: session.add(other, rng.choice(session.candidates(other) or list(g.digits))),
+                       lambda: session.remove(other),
+                       lambda: session.add(var, value))
+            for change in changes:
+                t0 = time.perf_counter()
+                change()
+                answer = session.count_solutions()
+                t_session += time.perf_counter() - t0
+                t0 = time.perf_counter()
+                expected = len(MacForSudoku.MacSolver(args.level).solve((g, dict(session.clues)), 2))
+                t_scratch += time.perf_counter() - t0
+                edits += 1
+                mismatches += answer != expected
+
+    print(f"\nSESSION: {len(puzzles)} puzzles, {edits} αλλαγές ({os.path.basename(args.corpus)}, {args.level})")
+    print("--------------------------------------------------")
+    print(f"Session:      {t_session*1000/edits:8.2f} ms ανά αλλαγή + ερώτηση")
+    print(f"Από την αρχή: {t_scratch*1000/edits:8.2f} ms ανά ερώτηση")
+    print(f"Διαφορετικές απαντήσεις: {mismatches}")